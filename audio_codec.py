@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import struct
+import time
+import uuid
+import warnings
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from metrics import CACHE_LOOKUPS, timed
+
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", DeprecationWarning)
+    try:
+        import audioop  # stdlib up to 3.12; the ``audioop-lts`` package provides it on 3.13+.
+    except ImportError:
+        audioop = None
+
+
+LOGGER = logging.getLogger("audio_codec")
+
+COMPACT_EXTENSION = ".adpcm"
+COMPACT_MAGIC = b"NPAD"
+COMPACT_VERSION = 1
+# magic, version, channels, sample width, sample rate, frames, payload digest
+_HEADER = struct.Struct("<4sHBBII16s")
+# Renditions touched this recently are never evicted, so a file is not removed mid-response.
+DERIVED_EVICTION_GRACE_SECONDS = 60.0
+
+PcmBuffer = Union[bytes, bytearray, memoryview]
+
+
+@dataclass(frozen=True)
+class CompactAudioInfo:
+    channels: int
+    sample_width: int
+    sample_rate: int
+    frames: int
+    digest: str
+
+
+def wav_header(data_size: int, channels: int, sample_width: int, sample_rate: int) -> bytes:
+    block_align = channels * sample_width
+    return struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF",
+        36 + data_size,
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,
+        channels,
+        sample_rate,
+        sample_rate * block_align,
+        block_align,
+        sample_width * 8,
+        b"data",
+        data_size,
+    )
+
+
+def can_encode(channels: int, sample_width: int) -> bool:
+    # audioop keeps one ADPCM predictor, so only mono 16-bit PCM round-trips.
+    return audioop is not None and channels == 1 and sample_width == 2
+
+
+def encode_adpcm(pcm_buffers: List[PcmBuffer], channels: int, sample_width: int, sample_rate: int) -> bytes:
+    """
+    Encode 16-bit mono PCM as IMA ADPCM (4 bits per sample, a quarter of the PCM size) behind a
+    small header recording the PCM parameters and a digest of the encoded payload.
+    """
+    if not can_encode(channels, sample_width):
+        raise ValueError(f"ADPCM storage needs mono 16-bit PCM, got {channels} channel(s) of {sample_width} bytes.")
+    pcm = b"".join(pcm_buffers)
+    frames = len(pcm) // sample_width
+    if frames % 2:
+        # Two samples share each payload byte and audioop drops an unpaired last one; pad it.
+        pcm += b"\0" * sample_width
+    payload, _ = audioop.lin2adpcm(pcm, sample_width, None)
+    digest = hashlib.blake2b(payload, digest_size=16).digest()
+    return _HEADER.pack(COMPACT_MAGIC, COMPACT_VERSION, channels, sample_width, sample_rate, frames, digest) + payload
+
+
+def _parse_header(header: bytes) -> CompactAudioInfo:
+    if len(header) < _HEADER.size:
+        raise ValueError("Compact audio file is truncated.")
+    magic, version, channels, sample_width, sample_rate, frames, digest = _HEADER.unpack_from(header)
+    if magic != COMPACT_MAGIC or version != COMPACT_VERSION:
+        raise ValueError("Not a compact audio file.")
+    return CompactAudioInfo(channels, sample_width, sample_rate, frames, digest.hex())
+
+
+def read_info(path: Path) -> CompactAudioInfo:
+    with open(path, "rb") as handle:
+        return _parse_header(handle.read(_HEADER.size))
+
+
+def decode_adpcm(data: PcmBuffer) -> Tuple[bytes, CompactAudioInfo]:
+    """Return the PCM samples of a compact file and its parameters."""
+    if audioop is None:
+        raise RuntimeError("audioop is not available; install audioop-lts to read ADPCM audio.")
+    view = memoryview(data)
+    info = _parse_header(bytes(view[: _HEADER.size]))
+    pcm, _ = audioop.adpcm2lin(view[_HEADER.size :], info.sample_width, None)
+    # An odd frame count was padded with one sample when encoding.
+    return pcm[: info.frames * info.sample_width], info
+
+
+class DerivedAudioCache:
+    """
+    WAV renditions of compact audio, decoded on first request and kept on disk up to a byte budget.
+
+    Renditions are named after the source's payload digest, so a re-encoded source never serves a
+    stale file, and concurrent requests for the same rendition share one decode.
+    """
+
+    def __init__(self, directory: Path, max_bytes: int) -> None:
+        self.directory = Path(directory)
+        self.max_bytes = max(0, max_bytes)
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    async def wav_for(self, source: Path) -> Tuple[Path, str]:
+        """Path of the WAV rendition of ``source`` and the digest identifying its content."""
+        info = await asyncio.to_thread(read_info, source)
+        path = self.directory / f"{source.stem}-{info.digest}.wav"
+        if await asyncio.to_thread(self._touch, path):
+            self.hits += 1
+            CACHE_LOOKUPS.inc(cache="derived_audio", result="hit")
+            return path, info.digest
+        task = self._inflight.get(path.name)
+        CACHE_LOOKUPS.inc(cache="derived_audio", result="miss" if task is None else "coalesced")
+        if task is None:
+            self.misses += 1
+            task = asyncio.create_task(asyncio.to_thread(self._derive, source, path))
+            self._inflight[path.name] = task
+            task.add_done_callback(lambda _: self._inflight.pop(path.name, None))
+        await asyncio.shield(task)
+        return path, info.digest
+
+    @staticmethod
+    def _touch(path: Path) -> bool:
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return False
+        return True
+
+    def _derive(self, source: Path, path: Path) -> None:
+        with timed("transcode"):
+            pcm, info = decode_adpcm(source.read_bytes())
+        self.directory.mkdir(parents=True, exist_ok=True)
+        temp_path = self.directory / f".{path.name}.{uuid.uuid4().hex}.tmp"
+        try:
+            with open(temp_path, "wb") as handle:
+                handle.write(wav_header(len(pcm), info.channels, info.sample_width, info.sample_rate))
+                handle.write(pcm)
+            os.replace(temp_path, path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        if self.max_bytes:
+            self._evict(self.max_bytes, keep=path)
+
+    def trim(self, max_bytes: int) -> int:
+        """Evict renditions (outside the grace period) down to ``max_bytes``; returns the bytes left."""
+        return self._evict(max_bytes)
+
+    def _evict(self, max_bytes: int, keep: Optional[Path] = None) -> int:
+        entries = []
+        for path in self.directory.glob("*.wav"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        cutoff = time.time() - DERIVED_EVICTION_GRACE_SECONDS
+        for mtime, size, path in sorted(entries):
+            if total <= max_bytes or mtime > cutoff:
+                break
+            if path == keep:
+                continue
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError as exc:
+                LOGGER.warning("Unable to remove derived audio %s: %s", path, exc)
+                continue
+            total -= size
+            self.evictions += 1
+        return total
+
+    def stats(self) -> Dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions, "inflight": len(self._inflight)}
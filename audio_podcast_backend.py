@@ -1,27 +1,48 @@
 from __future__ import annotations
 
 import asyncio
-import base64
 import hashlib
-import io
 import json
 import logging
-import math
 import os
+import re
+import socket
+import struct
 import time
-import wave
+import uuid
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, Iterable, List, Optional
-from google import genai
-from google.genai import types
+from typing import Dict, Iterable, List, Optional, Set, Union
+
+import aiofiles
+import aiofiles.os
+
+from audio_codec import COMPACT_EXTENSION, DerivedAudioCache, can_encode, decode_adpcm, encode_adpcm, wav_header
+from generation_backends import (
+    INTRO_MARKER,
+    OUTRO_MARKER,
+    GenerationBackend,
+    create_generation_backend,
+)
+from generation_cache import GenerationCache, prompt_cache_key, tts_cache_key
+from job_store import JobStore, MemoryJobStore, create_job_store
+from generation_scheduler import PRIORITY_INTERACTIVE, GenerationScheduler, StageConfig
+from metrics import AUDIO_BYTES_WRITTEN, CACHE_LOOKUPS, JOB_OUTCOMES, REGISTRY, STARTUP, start_background_task, timed
+from podcast_storage import PodcastStorage
+from podcast_index import EpisodeRecord, PodcastIndex, StorySegmentRecord, episode_cache_key, story_cache_key
 
 
 LOGGER = logging.getLogger("audio_podcast_backend")
 
+# Audio moves through the pipeline as a list of buffers (e.g. a WAV header plus PCM views)
+# so stitching and writing never copy the sample data.
+AudioBuffers = List[memoryview]
+
 TRANSCRIPT_MODEL = "gemini-2.5-flash"
 TTS_MODEL = "gemini-2.5-flash-preview-tts"
 OUTPUT_DIR = Path("static/podcasts")
+INDEX_PATH = Path(os.getenv("PODCAST_INDEX_PATH", "data/podcast_index.sqlite3"))
 MAX_PROMPT_ARTICLES = 8
 DEFAULT_SPEAKERS = (
     ("Anya", "Kore"),
@@ -30,8 +51,41 @@ DEFAULT_SPEAKERS = (
 DEFAULT_SAMPLE_RATE = 24000
 DEFAULT_SAMPLE_WIDTH = 2
 DEFAULT_CHANNELS = 1
-FAKE_AUDIO_SECONDS = 8
-FAKE_AUDIO_FREQUENCY = 440.0
+MAX_CONCURRENT_TRANSCRIPTS = int(os.getenv("PODCAST_MAX_CONCURRENT_TRANSCRIPTS", "2"))
+MAX_CONCURRENT_TTS = int(os.getenv("PODCAST_MAX_CONCURRENT_TTS", "2"))
+TRANSCRIPT_REQUESTS_PER_MINUTE = float(os.getenv("PODCAST_TRANSCRIPT_RPM", "30"))
+TTS_REQUESTS_PER_MINUTE = float(os.getenv("PODCAST_TTS_RPM", "10"))
+GENERATION_MAX_ATTEMPTS = int(os.getenv("PODCAST_GENERATION_MAX_ATTEMPTS", "4"))
+TTS_SEGMENT_MAX_CHARS = int(os.getenv("PODCAST_TTS_SEGMENT_CHARS", "1200"))
+MAX_TRACKED_JOBS = int(os.getenv("PODCAST_MAX_TRACKED_JOBS", "512"))
+MAX_TRACKED_JOB_BYTES = int(os.getenv("PODCAST_MAX_TRACKED_JOB_BYTES", str(8 * 1024 * 1024)))
+JOB_IDLE_TTL_SECONDS = float(os.getenv("PODCAST_JOB_IDLE_TTL_SECONDS", "3600"))
+JOB_BASE_BYTES = 512
+SEGMENT_BASE_BYTES = 160
+JOB_STORE_BACKEND = os.getenv("PODCAST_JOB_STORE", "sqlite").strip().lower()
+JOB_STORE_PATH = os.getenv("PODCAST_JOB_STORE_PATH")
+JOB_LEASE_SECONDS = float(os.getenv("PODCAST_JOB_LEASE_SECONDS", "120"))
+REMOTE_JOB_POLL_SECONDS = float(os.getenv("PODCAST_REMOTE_JOB_POLL_SECONDS", "2"))
+STORAGE_QUOTA_BYTES = int(os.getenv("PODCAST_STORAGE_QUOTA_BYTES", str(1024 * 1024 * 1024)))
+STORAGE_ORPHAN_GRACE_SECONDS = float(os.getenv("PODCAST_STORAGE_ORPHAN_GRACE_SECONDS", "3600"))
+STORAGE_SWEEP_INTERVAL_SECONDS = float(os.getenv("PODCAST_STORAGE_SWEEP_SECONDS", "600"))
+# Serving an episode refreshes its eviction order at most this often per file.
+ACCESS_TOUCH_INTERVAL_SECONDS = float(os.getenv("PODCAST_ACCESS_TOUCH_SECONDS", "300"))
+MAX_TRACKED_ACCESS_TOUCHES = 4096
+TRANSCRIPT_CACHE_TTL_SECONDS = float(os.getenv("PODCAST_TRANSCRIPT_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+TRANSCRIPT_CACHE_MAX_BYTES = int(os.getenv("PODCAST_TRANSCRIPT_CACHE_MAX_BYTES", str(16 * 1024 * 1024)))
+TTS_CACHE_TTL_SECONDS = float(os.getenv("PODCAST_TTS_CACHE_TTL_SECONDS", str(30 * 24 * 3600)))
+TTS_CACHE_MAX_BYTES = int(os.getenv("PODCAST_TTS_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+# Cached TTS audio is raw PCM duplicating stored episodes, so it is carved out of the storage quota.
+TTS_CACHE_QUOTA_SHARE = float(os.getenv("PODCAST_TTS_CACHE_QUOTA_SHARE", "0.25"))
+GENERATION_BACKEND = os.getenv("PODCAST_GENERATION_BACKEND", "").strip().lower()
+REPLAY_DIR = Path(os.getenv("PODCAST_REPLAY_DIR", "data/replay"))
+REPLAY_RECORD = os.getenv("PODCAST_REPLAY_RECORD", "").strip().lower() in {"1", "true", "yes", "on"}
+# "adpcm" stores WAV audio as IMA ADPCM (a quarter of the size) and derives WAV when it is requested.
+AUDIO_STORAGE_FORMAT = os.getenv("PODCAST_AUDIO_STORAGE", "adpcm").strip().lower()
+DERIVED_AUDIO_MAX_BYTES = int(os.getenv("PODCAST_DERIVED_AUDIO_MAX_BYTES", str(256 * 1024 * 1024)))
+AUDIO_URL_PREFIX = "/audio/"
+SERVED_AUDIO_TYPES = {".wav": "audio/wav", ".mp3": "audio/mpeg"}
 
 
 def _env_fake_audio_flag() -> bool:
@@ -43,83 +97,153 @@ def _ensure_directory(path: Path) -> Path:
     return path
 
 
-def _extract_audio_bytes(response: types.GenerateContentResponse) -> tuple[bytes, str]:
-    candidate = response.candidates[0]
-    if not candidate.content.parts:
-        raise ValueError("No audio parts returned by TTS model.")
-    part = candidate.content.parts[0]
-    inline = getattr(part, "inline_data", None)
-    if inline is None or not inline.data:
-        raise ValueError("TTS response missing inline audio data.")
-    payload = inline.data
-    mime = inline.mime_type or "audio/mpeg"
-    if isinstance(payload, str):
-        try:
-            return base64.b64decode(payload), mime
-        except (ValueError, base64.binascii.Error) as exc:
-            raise ValueError("Unable to decode inline audio payload.") from exc
-    if isinstance(payload, (bytes, bytearray)):
-        return bytes(payload), mime
-    raise ValueError("Inline audio payload not in recognised format.")
-
-
-def _has_wav_header(data: bytes) -> bool:
+def _has_wav_header(data: Union[bytes, memoryview]) -> bool:
     return len(data) >= 12 and data[:4] == b"RIFF" and data[8:12] == b"WAVE"
 
 
-def _has_mp3_header(data: bytes) -> bool:
+def _has_mp3_header(data: Union[bytes, memoryview]) -> bool:
     return len(data) >= 2 and (data[:2] == b"\xff\xfb" or data[:3] == b"ID3")
 
 
-def _wrap_pcm_as_wav(pcm: bytes, channels: int = DEFAULT_CHANNELS, sample_width: int = DEFAULT_SAMPLE_WIDTH, sample_rate: int = DEFAULT_SAMPLE_RATE) -> bytes:
-    buffer = io.BytesIO()
-    with wave.open(buffer, "wb") as wav_file:
-        wav_file.setnchannels(channels)
-        wav_file.setsampwidth(sample_width)
-        wav_file.setframerate(sample_rate)
-        wav_file.writeframes(pcm)
-    return buffer.getvalue()
+def _wav_header(data_size: int, channels: int = DEFAULT_CHANNELS, sample_width: int = DEFAULT_SAMPLE_WIDTH, sample_rate: int = DEFAULT_SAMPLE_RATE) -> bytes:
+    return wav_header(data_size, channels, sample_width, sample_rate)
 
 
-def _sine_wave_pcm(duration_seconds: int, sample_rate: int, frequency: float, amplitude: float = 0.32) -> bytes:
-    total_samples = int(duration_seconds * sample_rate)
-    max_amplitude = int((2 ** (DEFAULT_SAMPLE_WIDTH * 8 - 1)) - 1)
-    scaled_amplitude = max(0, min(1, amplitude)) * max_amplitude
-    frames = bytearray()
-    for index in range(total_samples):
-        sample = int(scaled_amplitude * math.sin(2 * math.pi * frequency * (index / sample_rate)))
-        frames.extend(sample.to_bytes(DEFAULT_SAMPLE_WIDTH, byteorder="little", signed=True))
-    return bytes(frames)
+def _parse_wav(data: memoryview) -> tuple[memoryview, tuple[int, int, int]]:
+    """Locate the PCM data of a WAV buffer without copying it; returns the data view and its params."""
+    params = None
+    offset = 12
+    while offset + 8 <= len(data):
+        chunk_id = bytes(data[offset:offset + 4])
+        (chunk_size,) = struct.unpack_from("<I", data, offset + 4)
+        body = offset + 8
+        if chunk_id == b"fmt ":
+            _, channels, sample_rate, _, _, bits = struct.unpack_from("<HHIIHH", data, body)
+            params = (channels, bits // 8, sample_rate)
+        elif chunk_id == b"data":
+            if params is None:
+                break
+            return data[body:body + chunk_size], params
+        offset = body + chunk_size + (chunk_size & 1)
+    raise ValueError("WAV audio is missing its fmt or data chunk.")
 
 
-def _normalise_audio_bytes(audio_bytes: bytes, mime_type: str) -> tuple[bytes, str]:
-    if _has_wav_header(audio_bytes):
-        return audio_bytes, "audio/wav"
-    if _has_mp3_header(audio_bytes):
-        return audio_bytes, "audio/mpeg"
+def _normalise_audio_bytes(audio_bytes: Union[bytes, bytearray, memoryview], mime_type: str) -> tuple[AudioBuffers, str]:
+    view = memoryview(audio_bytes)
+    if _has_wav_header(view):
+        return [view], "audio/wav"
+    if _has_mp3_header(view):
+        return [view], "audio/mpeg"
 
     mime_lower = (mime_type or "").lower()
     if mime_lower in {"audio/mpeg", "audio/mp3"}:
-        return audio_bytes, "audio/mpeg"
-    if mime_lower in {"audio/wav", "audio/x-wav"} and _has_wav_header(audio_bytes):
-        return audio_bytes, "audio/wav"
+        return [view], "audio/mpeg"
+
+    # Raw PCM: prepend a header instead of copying the samples into a new WAV file.
+    return [memoryview(_wav_header(len(view))), view], "audio/wav"
+
+
+def audio_url(filename: str) -> str:
+    """URL an audio file is served at: compact files are served as the WAV derived from them."""
+    path = Path(filename)
+    if path.suffix == COMPACT_EXTENSION:
+        return f"{AUDIO_URL_PREFIX}{path.stem}.wav"
+    return f"{AUDIO_URL_PREFIX}{filename}"
+
+
+def _split_transcript_segments(transcript: str, speaker_names: Iterable[str], max_chars: int = TTS_SEGMENT_MAX_CHARS) -> List[str]:
+    """
+    Split a dialogue transcript into TTS-sized segments without breaking a speaker's turn.
 
-    wrapped = _wrap_pcm_as_wav(audio_bytes)
-    return wrapped, "audio/wav"
+    A turn starts on a line beginning with a known speaker name (optionally in bold); other
+    lines stay with the current turn. Turns are packed greedily up to ``max_chars``.
+    """
+    names = [re.escape(name) for name in speaker_names if name]
+    if not names:
+        return [transcript.strip()] if transcript.strip() else []
+    turn_start = re.compile(r"^\s*(?:\*\*)?(?:%s)(?:\*\*)?\s*:" % "|".join(names), re.IGNORECASE)
 
+    turns: List[str] = []
+    for line in transcript.splitlines():
+        if turn_start.match(line) or not turns:
+            turns.append(line)
+        else:
+            turns[-1] = f"{turns[-1]}\n{line}"
 
-def _articles_digest(articles: Iterable[Dict[str, str]]) -> str:
-    normalised: List[Dict[str, str]] = []
-    for article in articles:
-        if not isinstance(article, dict):
+    segments: List[str] = []
+    current = ""
+    for turn in (turn.strip() for turn in turns):
+        if not turn:
             continue
-        normalised.append(
-            {
-                "title": (article.get("title") or "").strip(),
-                "description": (article.get("description") or "").strip(),
-                "link": (article.get("link") or "").strip(),
-            }
-        )
+        if current and len(current) + len(turn) + 1 > max_chars:
+            segments.append(current)
+            current = turn
+        else:
+            current = f"{current}\n{turn}" if current else turn
+    if current:
+        segments.append(current)
+    return segments
+
+
+def _wav_pcm_buffers(buffers: AudioBuffers) -> tuple[AudioBuffers, tuple[int, int, int]]:
+    # The first buffer holds the header (and possibly the samples); any others are raw PCM.
+    pcm, params = _parse_wav(buffers[0])
+    return ([pcm] if len(pcm) else []) + list(buffers[1:]), params
+
+
+def _stitch_audio_segments(parts: List[tuple[AudioBuffers, str]]) -> tuple[AudioBuffers, str]:
+    """Join normalised segment audio into one file: PCM/WAV segments are concatenated as raw PCM."""
+    if len(parts) == 1:
+        return parts[0]
+    mime_types = {mime for _, mime in parts}
+    if mime_types == {"audio/mpeg"}:
+        return [buffer for buffers, _ in parts for buffer in buffers], "audio/mpeg"
+    if mime_types != {"audio/wav"}:
+        raise ValueError(f"Cannot stitch segments with mixed audio formats: {sorted(mime_types)}")
+    pcm_buffers: AudioBuffers = []
+    params = None
+    for buffers, _ in parts:
+        segment_pcm, segment_params = _wav_pcm_buffers(buffers)
+        if params is not None and segment_params != params:
+            raise ValueError("Cannot stitch WAV segments with different audio parameters.")
+        params = segment_params
+        pcm_buffers.extend(segment_pcm)
+    header = _wav_header(sum(len(buffer) for buffer in pcm_buffers), *params)
+    return [memoryview(header), *pcm_buffers], "audio/wav"
+
+
+def _split_transitions(text: str) -> tuple[str, str]:
+    """Separate a generated ``INTRO:``/``OUTRO:`` script into its opening and closing parts."""
+    intro_lines: List[str] = []
+    outro_lines: List[str] = []
+    target = intro_lines
+    for line in text.splitlines():
+        marker = line.strip().strip("*#").strip().upper()
+        if marker == INTRO_MARKER:
+            target = intro_lines
+            continue
+        if marker == OUTRO_MARKER:
+            target = outro_lines
+            continue
+        target.append(line)
+    return "\n".join(intro_lines).strip(), "\n".join(outro_lines).strip()
+
+
+def _article_fingerprint(article: Dict[str, str]) -> Dict[str, str]:
+    return {
+        "title": (article.get("title") or "").strip(),
+        "description": (article.get("description") or "").strip(),
+        "link": (article.get("link") or "").strip(),
+    }
+
+
+def article_hash(article: Dict[str, str]) -> str:
+    encoded = json.dumps(_article_fingerprint(article), sort_keys=True, ensure_ascii=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def articles_digest(articles: Iterable[Dict[str, str]]) -> str:
+    normalised = [_article_fingerprint(article) for article in articles if isinstance(article, dict)]
     encoded = json.dumps(normalised, sort_keys=True, ensure_ascii=True).encode("utf-8")
     return hashlib.sha256(encoded).hexdigest()
 
@@ -133,33 +257,111 @@ def _articles_prompt_snippet(articles: List[Dict[str, str]]) -> str:
     return "\n\n".join(lines)
 
 
-@dataclass
+@dataclass(slots=True)
+class AudioSegment:
+    index: int
+    kind: str = "story"
+    status: str = "pending"
+    audio_url: Optional[str] = None
+    reused: bool = False
+
+    def to_dict(self) -> Dict[str, Optional[str]]:
+        return {
+            "index": self.index,
+            "kind": self.kind,
+            "status": self.status,
+            "audio_url": self.audio_url,
+            "reused": self.reused,
+        }
+
+
+@dataclass(slots=True)
 class AudioJob:
     feed_url: str
     channel_title: str
     content_hash: str
     articles: List[Dict[str, str]]
+    cache_key: str = ""
     status: str = "pending"
     audio_path: Optional[Path] = None
     audio_url: Optional[str] = None
     audio_mime_type: Optional[str] = None
     transcript: Optional[str] = None
     error: Optional[str] = None
+    segments: List[AudioSegment] = field(default_factory=list)
     updated_at: float = field(default_factory=time.time)
+    accessed_at: float = field(default_factory=time.monotonic)
+    leased: bool = False
+    lease_owner: str = ""
     task: Optional[asyncio.Task] = None
 
-    def to_dict(self) -> Dict[str, Optional[str]]:
+    @property
+    def active(self) -> bool:
+        return self.task is not None and not self.task.done()
+
+    def approx_bytes(self) -> int:
+        """Rough in-memory footprint, used to bound the job registry."""
+        size = JOB_BASE_BYTES + len(self.feed_url) + len(self.channel_title) + len(self.cache_key)
+        size += len(self.audio_url or "") + len(self.transcript or "") + len(self.error or "")
+        for article in self.articles:
+            size += sum(len(str(key)) + len(str(value)) for key, value in article.items())
+        for segment in self.segments:
+            size += SEGMENT_BASE_BYTES + len(segment.audio_url or "")
+        return size
+
+    def to_dict(self, include_transcript: bool = True) -> Dict[str, Optional[str]]:
         return {
             "feed": self.feed_url,
             "status": self.status,
             "audio_url": self.audio_url,
             "mime_type": self.audio_mime_type,
-            "transcript": self.transcript,
+            "transcript": self.transcript if include_transcript else None,
             "error": self.error,
+            "segments": [segment.to_dict() for segment in self.segments],
             "updated_at": self.updated_at,
         }
 
 
+def _log_status_write_failure(future: asyncio.Future) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        LOGGER.warning("Failed to share job status: %s", future.exception())
+
+
+class AudioStatusSubscription:
+    """
+    Per-client queue of job status changes, coalesced to the latest state of each feed.
+
+    A slow consumer never blocks publishers or grows without bound: it simply receives the
+    most recent status for every feed that changed since it last read.
+    """
+
+    def __init__(self, feeds: Optional[Iterable[str]] = None) -> None:
+        self.feeds: Optional[Set[str]] = set(feeds) if feeds else None
+        self._pending: Dict[str, Dict[str, Optional[str]]] = {}
+        self._changed = asyncio.Event()
+
+    def wants(self, feed_url: str) -> bool:
+        return self.feeds is None or feed_url in self.feeds
+
+    def push(self, status: Dict[str, Optional[str]]) -> None:
+        feed_url = status["feed"]
+        self._pending.pop(feed_url, None)
+        self._pending[feed_url] = status
+        self._changed.set()
+
+    async def next(self, timeout: Optional[float] = None) -> List[Dict[str, Optional[str]]]:
+        """Wait for status changes; returns an empty list if ``timeout`` passes first."""
+        if not self._pending:
+            try:
+                await asyncio.wait_for(self._changed.wait(), timeout)
+            except asyncio.TimeoutError:
+                return []
+        self._changed.clear()
+        events = list(self._pending.values())
+        self._pending.clear()
+        return events
+
+
 class AudioPodcastManager:
     def __init__(
         self,
@@ -168,173 +370,641 @@ class AudioPodcastManager:
         tts_model: str = TTS_MODEL,
         speakers: Iterable[tuple[str, str]] = DEFAULT_SPEAKERS,
         use_fake_audio: Optional[bool] = None,
+        backend: Optional[GenerationBackend] = None,
+        index_path: Optional[Path] = INDEX_PATH,
+        scheduler: Optional[GenerationScheduler] = None,
+        max_jobs: int = MAX_TRACKED_JOBS,
+        max_job_bytes: int = MAX_TRACKED_JOB_BYTES,
+        job_idle_ttl_seconds: float = JOB_IDLE_TTL_SECONDS,
+        job_store: Optional[JobStore] = None,
+        job_lease_seconds: float = JOB_LEASE_SECONDS,
+        remote_poll_seconds: float = REMOTE_JOB_POLL_SECONDS,
+        storage_quota_bytes: int = STORAGE_QUOTA_BYTES,
+        storage_format: str = AUDIO_STORAGE_FORMAT,
+        derived_audio_dir: Optional[Path] = None,
     ) -> None:
         self.output_dir = _ensure_directory(Path(output_dir))
         self.transcript_model = transcript_model
         self.tts_model = tts_model
         self.speakers = tuple(speakers)
-        self._jobs: Dict[str, AudioJob] = {}
+        self._jobs: "OrderedDict[str, AudioJob]" = OrderedDict()
+        self.max_jobs = max(1, max_jobs)
+        self.max_job_bytes = max_job_bytes
+        self.job_idle_ttl_seconds = job_idle_ttl_seconds
+        self._job_evictions = 0
         self._jobs_lock = asyncio.Lock()
-        self._client: Optional[genai.Client] = None
-        self._explicit_fake_audio = use_fake_audio
-
-    def _using_fake_audio(self) -> bool:
-        if self._explicit_fake_audio is not None:
-            return bool(self._explicit_fake_audio)
-        return _env_fake_audio_flag()
-
-    def _client_guard(self) -> genai.Client:
-        if self._using_fake_audio():
-            raise RuntimeError("Client guard should not be used when fake audio is enabled.")
-        if self._client is None:
-            if genai is None:
-                raise RuntimeError("google-genai package not available; disable PODCAST_FAKE_AUDIO or install dependency.")
-            api_key = os.getenv("GEMINI_API_KEY")
-            if not api_key:
-                raise RuntimeError("GEMINI_API_KEY environment variable not set")
-            self._client = genai.Client(api_key=api_key)
-        return self._client
-
-    async def ensure_audio(self, feed_url: str, channel_title: str, articles: List[Dict[str, str]]) -> AudioJob:
-        content_hash = _articles_digest(articles)
+        self._story_tasks: Dict[str, asyncio.Task] = {}
+        self._access_touches: "OrderedDict[str, float]" = OrderedDict()
+        self._subscriptions: Set[AudioStatusSubscription] = set()
+        if backend is None:
+            if use_fake_audio is not None:
+                kind = "synthetic" if use_fake_audio else "gemini"
+            else:
+                kind = GENERATION_BACKEND or ("synthetic" if _env_fake_audio_flag() else "gemini")
+            backend = create_generation_backend(
+                kind, transcript_model, tts_model, self.speakers, replay_dir=REPLAY_DIR, record=REPLAY_RECORD
+            )
+        self.backend = backend
+        self._index: Optional[PodcastIndex] = PodcastIndex(index_path) if index_path else None
+        if job_store is None:
+            if index_path:
+                store_path = Path(JOB_STORE_PATH) if JOB_STORE_PATH else Path(index_path).with_name("podcast_jobs.sqlite3")
+                job_store = create_job_store(JOB_STORE_BACKEND, store_path)
+            else:
+                job_store = MemoryJobStore()
+        self._job_store = job_store
+        self.job_lease_seconds = job_lease_seconds
+        self.remote_poll_seconds = remote_poll_seconds
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._transcript_cache: Optional[GenerationCache] = None
+        self._tts_cache: Optional[GenerationCache] = None
+        if index_path:
+            cache_path = Path(index_path).with_name("generation_cache.sqlite3")
+            self._transcript_cache = GenerationCache(
+                cache_path, "transcript", TRANSCRIPT_CACHE_TTL_SECONDS, TRANSCRIPT_CACHE_MAX_BYTES
+            )
+            if self.backend.remote:
+                tts_cache_bytes = TTS_CACHE_MAX_BYTES
+                if storage_quota_bytes:
+                    tts_cache_bytes = min(tts_cache_bytes, int(storage_quota_bytes * TTS_CACHE_QUOTA_SHARE))
+                    storage_quota_bytes = max(1, storage_quota_bytes - tts_cache_bytes)
+                self._tts_cache = GenerationCache(cache_path, "tts", TTS_CACHE_TTL_SECONDS, tts_cache_bytes)
+        self.storage_format = storage_format
+        if derived_audio_dir is None:
+            derived_audio_dir = Path(index_path).with_name("derived_audio") if index_path else self.output_dir / ".derived"
+        self.derived_audio = DerivedAudioCache(derived_audio_dir, DERIVED_AUDIO_MAX_BYTES)
+        self.storage = PodcastStorage(
+            self.output_dir,
+            self._index,
+            quota_bytes=storage_quota_bytes,
+            orphan_grace_seconds=STORAGE_ORPHAN_GRACE_SECONDS,
+            sweep_interval_seconds=STORAGE_SWEEP_INTERVAL_SECONDS,
+            derived=self.derived_audio,
+        )
+        self._scheduler = scheduler or GenerationScheduler(
+            {
+                "transcript": StageConfig(
+                    model=transcript_model,
+                    max_concurrency=MAX_CONCURRENT_TRANSCRIPTS,
+                    requests_per_minute=TRANSCRIPT_REQUESTS_PER_MINUTE,
+                    burst=MAX_CONCURRENT_TRANSCRIPTS,
+                ),
+                "tts": StageConfig(
+                    model=tts_model,
+                    max_concurrency=MAX_CONCURRENT_TTS,
+                    requests_per_minute=TTS_REQUESTS_PER_MINUTE,
+                    burst=MAX_CONCURRENT_TTS,
+                ),
+            },
+            max_attempts=GENERATION_MAX_ATTEMPTS,
+        )
+
+    async def ensure_audio(
+        self,
+        feed_url: str,
+        channel_title: str,
+        articles: List[Dict[str, str]],
+        content_hash: Optional[str] = None,
+        priority: int = PRIORITY_INTERACTIVE,
+    ) -> AudioJob:
+        content_hash = content_hash or articles_digest(articles)
+        async with self._jobs_lock:
+            job = self._touch_job(feed_url)
+            current = job is not None and job.content_hash == content_hash and self._job_is_current(job)
+        if current:
+            if job.status == "ready":
+                await self._note_access(job.audio_path.name)
+            return job
+        cache_key = self._episode_key(content_hash, channel_title)
+        record = await self._lookup_episode(cache_key)
+
         async with self._jobs_lock:
             job = self._jobs.get(feed_url)
             if job and job.content_hash == content_hash:
-                if job.status in {"pending", "generating"} and job.task and not job.task.done():
-                    return job
-                if job.status == "ready" and job.audio_path and job.audio_path.exists():
+                if self._job_is_current(job):
                     return job
                 if job.status == "error":
                     LOGGER.info("Retrying audio generation for feed %s", feed_url)
             elif job and job.content_hash != content_hash:
-                if job.task and not job.task.done():
+                if job.active:
                     job.task.cancel()
             job = AudioJob(
                 feed_url=feed_url,
                 channel_title=channel_title,
                 content_hash=content_hash,
                 articles=list(articles),
+                cache_key=cache_key,
             )
-            job.task = asyncio.create_task(self._run_job(job))
-            self._jobs[feed_url] = job
-            return job
+            if record is not None:
+                LOGGER.info("Serving stored episode %s for feed %s", cache_key[:12], feed_url)
+                self._apply_episode(job, record)
+            else:
+                job.task = start_background_task(self._run_job(job, priority))
+            self._track_job(job)
+        if record is not None:
+            await self._remember_feed_episode(job)
+        return job
+
+    @staticmethod
+    def _job_is_current(job: AudioJob) -> bool:
+        if job.status in {"pending", "generating"} and job.active:
+            return True
+        return job.status == "ready" and job.audio_path is not None and job.audio_path.exists()
 
-    async def _run_job(self, job: AudioJob) -> None:
+    def _episode_key(self, content_hash: str, channel_title: str) -> str:
+        return episode_cache_key(
+            content_hash,
+            channel_title,
+            self.transcript_model,
+            self.tts_model,
+            self.speakers,
+            self.backend.name,
+        )
+
+    async def _lookup_episode(self, cache_key: str) -> Optional[EpisodeRecord]:
+        if self._index is None:
+            return None
+        record = await asyncio.to_thread(self._index.get_episode, cache_key)
+        if record is None:
+            return None
+        if not (self.output_dir / record.audio_filename).exists():
+            await asyncio.to_thread(self._index.delete_episode, cache_key)
+            return None
+        await asyncio.to_thread(self._index.touch_episode, cache_key)
+        return record
+
+    async def _note_access(self, filename: str) -> None:
+        """Refresh the eviction order of a stored file that was just requested, throttled per file."""
+        if self._index is None:
+            return
+        now = time.time()
+        last = self._access_touches.get(filename)
+        if last is not None and now - last < ACCESS_TOUCH_INTERVAL_SECONDS:
+            return
+        self._access_touches[filename] = now
+        self._access_touches.move_to_end(filename)
+        while len(self._access_touches) > MAX_TRACKED_ACCESS_TOUCHES:
+            self._access_touches.popitem(last=False)
+        await asyncio.to_thread(self._index.touch_audio_file, filename, now)
+
+    def _apply_episode(self, job: AudioJob, record: EpisodeRecord) -> None:
+        job.cache_key = record.cache_key
+        job.audio_path = self.output_dir / record.audio_filename
+        job.audio_url = audio_url(record.audio_filename)
+        job.audio_mime_type = record.mime_type
+        # The transcript stays in the index and is loaded when a status is requested.
+        job.transcript = record.transcript if self._index is None else None
+        job.articles = []
+        job.status = "ready"
+        self._publish(job)
+
+    async def _store_episode(self, job: AudioJob) -> None:
+        if self._index is None or job.audio_path is None or job.audio_mime_type is None:
+            return
+        now = time.time()
+        record = EpisodeRecord(
+            cache_key=job.cache_key,
+            content_hash=job.content_hash,
+            audio_filename=job.audio_path.name,
+            mime_type=job.audio_mime_type,
+            transcript=job.transcript,
+            created_at=now,
+            last_accessed_at=now,
+        )
+        await asyncio.to_thread(self._index.put_episode, record)
+        await self._remember_feed_episode(job)
+
+    async def _remember_feed_episode(self, job: AudioJob) -> None:
+        if self._index is None:
+            return
+        await asyncio.to_thread(self._index.set_feed_episode, job.feed_url, job.cache_key, job.channel_title)
+
+    async def _run_job(self, job: AudioJob, priority: int = PRIORITY_INTERACTIVE) -> None:
+        """
+        Generate ``job``'s episode unless another worker already holds the lease for it.
+
+        Workers that lose the claim mirror the owner's progress from the job store and pick up
+        the finished episode from the index, taking over only if the owner's lease lapses.
+        """
+        started_at = time.time()
+        # Leases belong to this run, so two jobs for one episode in this process coordinate too.
+        job.lease_owner = f"{self.worker_id}:{uuid.uuid4().hex[:8]}"
+        try:
+            while not await asyncio.to_thread(
+                self._job_store.claim, job.cache_key, job.lease_owner, self.job_lease_seconds
+            ):
+                if await self._follow_remote_job(job, started_at):
+                    return
+                await asyncio.sleep(self.remote_poll_seconds)
+            await self._run_leased_job(job, priority)
+        except asyncio.CancelledError:
+            if job.status != "cancelled":
+                job.status = "cancelled"
+                self._publish(job)
+            raise
+        finally:
+            # Finished jobs only need enough state to report status; callers resupply articles.
+            job.articles = []
+            job.task = None
+
+    async def _run_leased_job(self, job: AudioJob, priority: int) -> None:
+        job.leased = True
+        renewal = asyncio.create_task(self._renew_lease(job))
+        try:
+            await self._generate_episode(job, priority)
+        finally:
+            renewal.cancel()
+            job.leased = False
+            await asyncio.to_thread(
+                self._job_store.release,
+                job.cache_key,
+                job.lease_owner,
+                job.feed_url,
+                job.to_dict(include_transcript=False),
+            )
+
+    async def _renew_lease(self, job: AudioJob) -> None:
+        while True:
+            await asyncio.sleep(self.job_lease_seconds / 3)
+            renewed = await asyncio.to_thread(
+                self._job_store.renew, job.cache_key, job.lease_owner, self.job_lease_seconds
+            )
+            if not renewed:
+                LOGGER.warning("Lost generation lease for %s; another worker may take over", job.feed_url)
+
+    async def _follow_remote_job(self, job: AudioJob, since: float) -> bool:
+        """Poll another worker's generation once; returns True when the job has settled."""
+        record = await self._lookup_episode(job.cache_key)
+        if record is not None:
+            LOGGER.info("Episode %s for %s was generated by another worker", job.cache_key[:12], job.feed_url)
+            self._apply_episode(job, record)
+            await self._remember_feed_episode(job)
+            return True
+        remote = await asyncio.to_thread(self._job_store.get_job_status, job.cache_key)
+        if remote is None or remote.updated_at < since:
+            return False
+        remote_status = remote.status.get("status")
+        if remote_status == "error" and not remote.leased:
+            job.status = "error"
+            job.error = remote.status.get("error")
+            self._publish(job)
+            return True
+        if remote_status in {"pending", "generating"} and remote.leased:
+            job.status = remote_status
+            job.segments = [
+                AudioSegment(
+                    index=segment.get("index", position),
+                    kind=segment.get("kind", "story"),
+                    status=segment.get("status", "pending"),
+                    audio_url=segment.get("audio_url"),
+                    reused=bool(segment.get("reused")),
+                )
+                for position, segment in enumerate(remote.status.get("segments") or [])
+            ]
+            self._publish(job)
+        return False
+
+    async def _generate_episode(self, job: AudioJob, priority: int) -> None:
         job.status = "generating"
-        job.updated_at = time.time()
+        job.error = None
+        job.segments = []
+        self._publish(job)
         try:
-            fake_audio_mode = self._using_fake_audio()
+            LOGGER.info("Starting %s audio generation for feed %s", self.backend.name, job.feed_url)
+            articles = job.articles[:MAX_PROMPT_ARTICLES]
+            story_keys = [self._story_key(article_hash(article)) for article in articles]
+            job.segments = (
+                [AudioSegment(index=0, kind="intro")]
+                + [AudioSegment(index=position, kind="story") for position in range(1, len(articles) + 1)]
+                + [AudioSegment(index=len(articles) + 1, kind="outro")]
+            )
+            stored_stories = await self._lookup_story_segments(story_keys)
+            for position, key in enumerate(story_keys, start=1):
+                record = stored_stories.get(key)
+                if record is not None:
+                    segment = job.segments[position]
+                    segment.status = "ready"
+                    segment.reused = True
+                    segment.audio_url = audio_url(record.audio_filename)
+            self._publish(job)
             LOGGER.info(
-                "Starting %s audio generation for feed %s",
-                "fake" if fake_audio_mode else "Gemini",
+                "Reusing %d of %d story segments for feed %s",
+                len(stored_stories),
+                len(story_keys),
                 job.feed_url,
             )
-            if fake_audio_mode:
-                transcript = self._generate_dummy_transcript(job.channel_title, job.articles)
-                job.transcript = transcript
-                audio_bytes, mime_type = self._generate_dummy_audio(transcript)
-            else:
-                transcript = await asyncio.to_thread(self._generate_transcript, job.channel_title, job.articles)
-                job.transcript = transcript
-                audio_bytes, mime_type = await asyncio.to_thread(self._synthesise_audio, transcript)
-            audio_bytes, mime_type = await asyncio.to_thread(_normalise_audio_bytes, audio_bytes, mime_type)
-            audio_path = self._write_audio(job.feed_url, audio_bytes, mime_type)
+
+            async def transitions() -> List[Optional[tuple[str, AudioBuffers, str]]]:
+                LOGGER.info(
+                    "Requesting %s intro/outro for feed '%s' with %d articles",
+                    self.backend.name,
+                    job.channel_title,
+                    len(articles),
+                )
+                prompt = self._transitions_prompt(job.channel_title, articles)
+                intro, outro = _split_transitions(await self._generate_cached_text(prompt, priority))
+                stem = self._audio_stem(job)
+                return list(
+                    await asyncio.gather(
+                        self._publish_segment(job, job.segments[0], f"{stem}_intro", intro, priority),
+                        self._publish_segment(job, job.segments[-1], f"{stem}_outro", outro, priority),
+                    )
+                )
+
+            async def story(position: int, article: Dict[str, str], key: str) -> tuple[str, AudioBuffers, str]:
+                segment = job.segments[position]
+                record = stored_stories.get(key)
+                if record is not None:
+                    try:
+                        return record.transcript or "", await self._read_audio(record.audio_filename), record.mime_type
+                    except FileNotFoundError:
+                        # Evicted by a storage sweep since the lookup; generate it again.
+                        LOGGER.info("Stored story %s disappeared; regenerating it", key[:12])
+                        segment.reused = False
+                segment.status = "generating"
+                self._publish(job)
+                record = await self._story_segment(key, article, priority)
+                segment.audio_url = audio_url(record.audio_filename)
+                segment.status = "ready"
+                self._publish(job)
+                return record.transcript or "", await self._read_audio(record.audio_filename), record.mime_type
+
+            tasks = [asyncio.create_task(transitions())] + [
+                asyncio.create_task(story(position, article, key))
+                for position, (article, key) in enumerate(zip(articles, story_keys), start=1)
+            ]
+            try:
+                results = await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                for segment in job.segments:
+                    if segment.status != "ready":
+                        segment.status = "error"
+                raise
+            intro_part, outro_part = results[0]
+            ordered = [part for part in (intro_part, *results[1:], outro_part) if part is not None]
+            job.transcript = "\n\n".join(text for text, _, _ in ordered if text)
+            audio_buffers, mime_type = _stitch_audio_segments([(buffers, mime) for _, buffers, mime in ordered])
+            audio_path = await self._write_audio(self._audio_stem(job), audio_buffers, mime_type)
             job.audio_path = audio_path
-            job.audio_url = f"/static/podcasts/{audio_path.name}"
+            job.audio_url = audio_url(audio_path.name)
             job.audio_mime_type = mime_type
+            await self._store_episode(job)
+            if self._index is not None:
+                job.transcript = None
             job.status = "ready"
-            job.updated_at = time.time()
+            self._publish(job)
+            JOB_OUTCOMES.inc(status="ready")
             LOGGER.info(
                 "Completed %s audio generation for %s (%s)",
-                "fake" if fake_audio_mode else "Gemini",
+                self.backend.name,
                 job.feed_url,
                 job.audio_mime_type,
             )
         except asyncio.CancelledError:
             job.status = "cancelled"
-            job.updated_at = time.time()
+            self._publish(job)
+            JOB_OUTCOMES.inc(status="cancelled")
             LOGGER.debug("Audio generation cancelled for %s", job.feed_url)
             raise
         except Exception as exc:
             job.status = "error"
             job.error = str(exc)
-            job.updated_at = time.time()
+            self._publish(job)
+            JOB_OUTCOMES.inc(status="error")
             LOGGER.exception("Audio generation failed for %s", job.feed_url)
 
-    def _generate_transcript(self, channel_title: str, articles: List[Dict[str, str]]) -> str:
-        if genai is None or types is None:
-            raise RuntimeError("google-genai package is required for real transcript generation.")
-        LOGGER.info("Requesting Gemini transcript for feed '%s' with %d articles", channel_title, len(articles))
-        prompt = (
-            "Generate a conversational podcast dialogue between two news anchors named Liam and Anya. "
-            "Liam is serious and concise, while Anya is witty and energetic. "
-            "Blend the provided article summaries into a cohesive 2-3 minute script. "
-            "Avoid repeating the feed title verbatim more than once and include smooth transitions between stories.\n\n"
-            f"Feed: {channel_title}\n\nArticles:\n{_articles_prompt_snippet(articles)}\n"
+    def _story_key(self, story_hash: str) -> str:
+        return story_cache_key(story_hash, self.transcript_model, self.tts_model, self.speakers, self.backend.name)
+
+    async def _lookup_story_segments(self, story_keys: List[str]) -> Dict[str, StorySegmentRecord]:
+        if self._index is None or not story_keys:
+            return {}
+        records = await asyncio.to_thread(self._index.get_story_segments, story_keys)
+        available = {
+            key: record
+            for key, record in records.items()
+            if (self.output_dir / record.audio_filename).exists()
+        }
+        if available:
+            await asyncio.to_thread(self._index.touch_story_segments, list(available))
+        return available
+
+    async def _story_segment(
+        self,
+        key: str,
+        article: Dict[str, str],
+        priority: int,
+    ) -> StorySegmentRecord:
+        """
+        Generate (or join the in-flight generation of) one story's transcript and audio.
+
+        Story work is shared between jobs and shielded from their cancellation, so an episode
+        superseded mid-generation still leaves its finished stories in the cache for the next one.
+        """
+        task = self._story_tasks.get(key)
+        if task is None:
+            task = asyncio.create_task(
+                self._generate_story_segment(key, article, priority)
+            )
+            self._story_tasks[key] = task
+
+            def forget(done: asyncio.Task, key: str = key) -> None:
+                if self._story_tasks.get(key) is done:
+                    del self._story_tasks[key]
+                if not done.cancelled():
+                    done.exception()
+
+            task.add_done_callback(forget)
+        return await asyncio.shield(task)
+
+    async def _generate_story_segment(
+        self,
+        key: str,
+        article: Dict[str, str],
+        priority: int,
+    ) -> StorySegmentRecord:
+        LOGGER.info(
+            "Requesting %s story dialogue for '%s'", self.backend.name, (article.get("title") or "").strip()[:80]
         )
-        client = self._client_guard()
-        response = client.models.generate_content(
-            model=self.transcript_model,
-            contents=prompt,
+        transcript = await self._generate_cached_text(self._story_prompt(article), priority)
+        audio_buffers, mime_type = await self._synthesise_text(transcript, priority)
+        path = await self._write_audio(f"story_{key[:16]}", audio_buffers, mime_type)
+        now = time.time()
+        record = StorySegmentRecord(
+            segment_key=key,
+            article_hash=article_hash(article),
+            transcript=transcript,
+            audio_filename=path.name,
+            mime_type=mime_type,
+            created_at=now,
+            last_accessed_at=now,
         )
-        if not response.text:
-            raise ValueError("Transcript generation returned empty content.")
-        return response.text.strip()
-
-    def _synthesise_audio(self, transcript: str) -> tuple[bytes, str]:
-        if genai is None or types is None:
-            raise RuntimeError("google-genai package is required for real audio synthesis.")
-        LOGGER.info("Requesting Gemini TTS synthesis for transcript (%d chars)", len(transcript))
-        client = self._client_guard()
-        speaker_configs = []
-        for speaker_name, voice_name in self.speakers:
-            speaker_configs.append(
-                types.SpeakerVoiceConfig(
-                    speaker=speaker_name,
-                    voice_config=types.VoiceConfig(
-                        prebuilt_voice_config=types.PrebuiltVoiceConfig(voice_name=voice_name)
-                    ),
-                )
-            )
-        response = client.models.generate_content(
-            model=self.tts_model,
-            contents=transcript,
-            config=types.GenerateContentConfig(
-                response_modalities=["AUDIO"],
-                speech_config=types.SpeechConfig(
-                    multi_speaker_voice_config=types.MultiSpeakerVoiceConfig(
-                        speaker_voice_configs=speaker_configs
-                    )
-                ),
-            ),
+        if self._index is not None:
+            await asyncio.to_thread(self._index.put_story_segment, record)
+        return record
+
+    async def _publish_segment(
+        self,
+        job: AudioJob,
+        segment: AudioSegment,
+        stem: str,
+        text: str,
+        priority: int,
+    ) -> Optional[tuple[str, AudioBuffers, str]]:
+        if not text:
+            # The model left this part out; an empty TTS request would fail the whole episode.
+            LOGGER.warning("No %s text was generated for %s; leaving it out", segment.kind, job.feed_url)
+            segment.status = "skipped"
+            self._publish(job)
+            return None
+        segment.status = "generating"
+        self._publish(job)
+        audio_buffers, mime_type = await self._synthesise_text(text, priority)
+        path = await self._write_audio(stem, audio_buffers, mime_type)
+        segment.audio_url = audio_url(path.name)
+        segment.status = "ready"
+        self._publish(job)
+        return text, audio_buffers, mime_type
+
+    async def _synthesise_text(self, text: str, priority: int) -> tuple[AudioBuffers, str]:
+        """Synthesise one segment, splitting overly long text at speaker turns and stitching the parts."""
+        chunks = _split_transcript_segments(text, (name for name, _ in self.speakers)) or [text]
+
+        async def synthesise(chunk: str) -> tuple[AudioBuffers, str]:
+            audio_bytes, mime_type = await self._synthesise_cached_audio(chunk, priority)
+            with timed("normalise"):
+                return _normalise_audio_bytes(audio_bytes, mime_type)
+
+        parts = await asyncio.gather(*(synthesise(chunk) for chunk in chunks))
+        return _stitch_audio_segments(list(parts))
+
+    @staticmethod
+    def _audio_stem(job: AudioJob) -> str:
+        return f"podcast_{(job.cache_key or job.content_hash)[:16]}"
+
+    async def _generate_cached_text(self, prompt: str, priority: int) -> str:
+        """Generate text for ``prompt``, reusing any earlier remote response to the identical prompt."""
+        if not self.backend.remote:
+            with timed("transcript"):
+                return await asyncio.to_thread(self.backend.generate_text, prompt)
+        key = prompt_cache_key(self.transcript_model, prompt)
+        if self._transcript_cache is not None:
+            cached = await asyncio.to_thread(self._transcript_cache.get, key)
+            CACHE_LOOKUPS.inc(cache="transcript", result="miss" if cached is None else "hit")
+            if cached is not None:
+                return cached[0].decode("utf-8")
+        # The scheduler times the provider call and its queueing separately.
+        text = await self._scheduler.run("transcript", priority, self.backend.generate_text, prompt)
+        if self._transcript_cache is not None:
+            await asyncio.to_thread(self._transcript_cache.put, key, text.encode("utf-8"))
+        return text
+
+    async def _synthesise_cached_audio(self, transcript: str, priority: int) -> tuple[Union[bytes, bytearray], str]:
+        """Synthesise ``transcript``, reusing earlier remote audio for the same text, model and voices."""
+        if not self.backend.remote:
+            with timed("tts"):
+                return await asyncio.to_thread(self.backend.synthesise, transcript)
+        key = tts_cache_key(self.tts_model, self.speakers, transcript)
+        if self._tts_cache is not None:
+            cached = await asyncio.to_thread(self._tts_cache.get, key)
+            CACHE_LOOKUPS.inc(cache="tts", result="miss" if cached is None else "hit")
+            if cached is not None:
+                return cached
+        audio_bytes, mime_type = await self._scheduler.run("tts", priority, self.backend.synthesise, transcript)
+        if self._tts_cache is not None:
+            await asyncio.to_thread(self._tts_cache.put, key, audio_bytes, mime_type)
+        return audio_bytes, mime_type
+
+    @staticmethod
+    def _transitions_prompt(channel_title: str, articles: List[Dict[str, str]]) -> str:
+        return (
+            "Write the opening and closing of a news podcast hosted by two anchors named Liam and Anya. "
+            "Liam is serious and concise, while Anya is witty and energetic. "
+            "The stories themselves are covered separately; the opening should welcome listeners, "
+            "name the feed once and tease the headlines, and the closing should wrap up briefly. "
+            f"Write each line as 'Speaker: text'. Start the opening with a line '{INTRO_MARKER}' "
+            f"and the closing with a line '{OUTRO_MARKER}'.\n\n"
+            f"Feed: {channel_title}\n\nArticles:\n{_articles_prompt_snippet(articles)}\n"
         )
-        return _extract_audio_bytes(response)
 
-    def _generate_dummy_transcript(self, channel_title: str, articles: List[Dict[str, str]]) -> str:
-        headlines = ", ".join(article.get("title") or "Untitled story" for article in articles[:MAX_PROMPT_ARTICLES])
-        timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+    @staticmethod
+    def _story_prompt(article: Dict[str, str]) -> str:
+        title = (article.get("title") or "").strip()
         return (
-            f"[FAKE PODCAST SCRIPT]\n"
-            f"Feed: {channel_title}\n"
-            f"Generated: {timestamp}\n"
-            f"Stories discussed: {headlines or 'No stories available'}\n"
-            "Hosts Liam and Anya share highlights in this simulated recording."
+            "Write a short podcast dialogue (about 20-30 seconds) between two news anchors named Liam and Anya "
+            "discussing a single story. Liam is serious and concise, while Anya is witty and energetic. "
+            "Do not greet listeners, name the show or refer to other stories; the segment is placed between "
+            "other segments. Write each line as 'Speaker: text'.\n\n"
+            f"Story: {title}\nSummary: {(article.get('description') or '').strip()}\n"
         )
 
-    def _generate_dummy_audio(self, transcript: str) -> tuple[bytes, str]:
-        duration = max(2, int(FAKE_AUDIO_SECONDS))
-        LOGGER.info("Generating fake sine-wave audio for %d seconds", duration)
-        audio_bytes = _sine_wave_pcm(duration, DEFAULT_SAMPLE_RATE, FAKE_AUDIO_FREQUENCY)
-        header = _wrap_pcm_as_wav(audio_bytes)
-        return header, "audio/wav"
-
-    def _write_audio(self, feed_url: str, audio_bytes: bytes, mime_type: str) -> Path:
-        ext = self._extension_for_mime(mime_type)
-        filename_hash = hashlib.sha256(feed_url.encode("utf-8")).hexdigest()[:16]
-        filename = f"podcast_{filename_hash}{ext}"
+    async def _compact(self, audio_buffers: AudioBuffers, mime_type: str) -> Optional[AudioBuffers]:
+        if self.storage_format != "adpcm" or mime_type != "audio/wav":
+            return None
+        pcm_buffers, (channels, sample_width, sample_rate) = _wav_pcm_buffers(audio_buffers)
+        if not can_encode(channels, sample_width):
+            return None
+        with timed("encode"):
+            encoded = await asyncio.to_thread(encode_adpcm, pcm_buffers, channels, sample_width, sample_rate)
+        return [memoryview(encoded)]
+
+    async def _read_audio(self, filename: str) -> AudioBuffers:
+        """Read a stored file back as the buffers it was written from (compact files are decoded)."""
+        async with aiofiles.open(self.output_dir / filename, "rb") as handle:
+            audio_bytes = await handle.read()
+        if not filename.endswith(COMPACT_EXTENSION):
+            return [memoryview(audio_bytes)]
+        pcm, info = await asyncio.to_thread(decode_adpcm, audio_bytes)
+        header = _wav_header(len(pcm), info.channels, info.sample_width, info.sample_rate)
+        return [memoryview(header), memoryview(pcm)]
+
+    async def resolve_audio(self, name: str) -> Optional[tuple[Path, str, Optional[str]]]:
+        """
+        Locate the file to serve for ``name`` (as produced by ``audio_url``): the stored file itself,
+        or the WAV derived from its compact form. Returns the path, media type and a content digest
+        when one is known.
+        """
+        path = self.output_dir / name
+        media_type = SERVED_AUDIO_TYPES.get(path.suffix)
+        if media_type is None:
+            return None
+        compact = path.with_suffix(COMPACT_EXTENSION)
+        if media_type == "audio/wav" and compact.exists():
+            await self._note_access(compact.name)
+            derived, digest = await self.derived_audio.wav_for(compact)
+            return derived, media_type, digest
+        if path.exists():
+            await self._note_access(path.name)
+            return path, media_type, None
+        return None
+
+    async def _write_audio(self, stem: str, audio_buffers: AudioBuffers, mime_type: str) -> Path:
+        """
+        Stream ``audio_buffers`` to a temporary file off the event loop, then rename it into place.
+
+        WAV audio is stored in compact form when enabled. The rename is atomic, so the audio
+        route never hands out a partially written file.
+        """
+        compact = await self._compact(audio_buffers, mime_type)
+        if compact is not None:
+            audio_buffers = compact
+        ext = COMPACT_EXTENSION if compact is not None else self._extension_for_mime(mime_type)
+        filename = f"{stem}{ext}"
         path = self.output_dir / filename
-        with open(path, "wb") as handle:
-            handle.write(audio_bytes)
+        temp_path = self.output_dir / f".{filename}.{uuid.uuid4().hex}.tmp"
+        try:
+            with timed("write"):
+                async with aiofiles.open(temp_path, "wb") as handle:
+                    for buffer in audio_buffers:
+                        await handle.write(buffer)
+                await aiofiles.os.replace(temp_path, path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        AUDIO_BYTES_WRITTEN.inc(sum(buffer.nbytes for buffer in audio_buffers))
         return path
 
     @staticmethod
@@ -349,9 +1019,25 @@ class AudioPodcastManager:
         }
         return mapping.get(mime_type.lower(), ".mp3")
 
-    async def get_status(self, feed_url: str) -> Dict[str, Optional[str]]:
+    async def get_status(self, feed_url: str, include_transcript: bool = True) -> Dict[str, Optional[str]]:
+        """
+        Report the episode for ``feed_url`` without starting any work. Finished jobs keep no
+        articles, so an episode whose file has gone is reported as ``missing`` and is regenerated
+        the next time ``ensure_audio`` supplies the feed's articles.
+        """
         async with self._jobs_lock:
-            job = self._jobs.get(feed_url)
+            job = self._touch_job(feed_url)
+        if not job:
+            job = await self._restore_job(feed_url)
+        if not job:
+            remote = await asyncio.to_thread(self._job_store.get_feed_status, feed_url)
+            if remote is not None and (remote.leased or remote.status.get("status") == "error"):
+                # Generating (or failed) on another worker; report its shared status.
+                return dict(remote.status, transcript=None)
+        async with self._jobs_lock:
+            if job and job.status == "ready" and job.audio_path and not job.audio_path.exists():
+                self._jobs.pop(feed_url, None)
+                job = None
             if not job:
                 return {
                     "feed": feed_url,
@@ -360,32 +1046,233 @@ class AudioPodcastManager:
                     "mime_type": None,
                     "transcript": None,
                     "error": None,
+                    "segments": [],
                     "updated_at": None,
                 }
-            if job.status == "ready" and job.audio_path and not job.audio_path.exists():
-                job.status = "pending"
-                job.audio_path = None
-                job.audio_url = None
-                job.audio_mime_type = None
-                job.task = asyncio.create_task(self._run_job(job))
-            return job.to_dict()
+        return await self.describe(job, include_transcript)
+
+    async def restore_recent_jobs(self, max_feeds: int) -> List[str]:
+        """Load the most recently generated episodes from the index; returns every feed it saw."""
+        if self._index is None or max_feeds <= 0:
+            return []
+        feeds = await asyncio.to_thread(self._index.recent_feeds, max_feeds)
+        for feed_url in feeds:
+            await self._restore_job(feed_url)
+        return feeds
+
+    async def _restore_job(self, feed_url: str) -> Optional[AudioJob]:
+        """Rebuild a ready job from the persisted index, e.g. after a restart."""
+        if self._index is None:
+            return None
+        stored = await asyncio.to_thread(self._index.get_feed_episode, feed_url)
+        if stored is None:
+            return None
+        channel_title, record = stored
+        if not (self.output_dir / record.audio_filename).exists():
+            return None
+        async with self._jobs_lock:
+            job = self._jobs.get(feed_url)
+            if job is None:
+                job = AudioJob(
+                    feed_url=feed_url,
+                    channel_title=channel_title,
+                    content_hash=record.content_hash,
+                    articles=[],
+                )
+                self._apply_episode(job, record)
+                self._track_job(job)
+        await self._note_access(record.audio_filename)
+        return job
+
+    def _publish(self, job: AudioJob) -> None:
+        job.updated_at = time.time()
+        if not self._subscriptions and not job.leased:
+            return
+        status = job.to_dict(include_transcript=False)
+        if job.leased:
+            # Share progress with other workers; the store ignores writes older than what it holds.
+            write = asyncio.get_running_loop().run_in_executor(
+                None, self._job_store.put_status, job.cache_key, job.feed_url, status, job.updated_at
+            )
+            write.add_done_callback(_log_status_write_failure)
+        for subscription in self._subscriptions:
+            if subscription.wants(job.feed_url):
+                subscription.push(status)
+
+    async def subscribe(self, feeds: Optional[Iterable[str]] = None) -> AudioStatusSubscription:
+        """Register for status changes; the current state of matching jobs is queued immediately."""
+        subscription = AudioStatusSubscription(feeds)
+        async with self._jobs_lock:
+            for job in self._jobs.values():
+                if subscription.wants(job.feed_url):
+                    subscription.push(job.to_dict(include_transcript=False))
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: AudioStatusSubscription) -> None:
+        self._subscriptions.discard(subscription)
+
+    async def describe(self, job: AudioJob, include_transcript: bool = True) -> Dict[str, Optional[str]]:
+        """Serialise ``job``, loading a finished episode's transcript from the index if wanted."""
+        status = job.to_dict(include_transcript)
+        if not include_transcript:
+            return status
+        if job.status == "ready" and job.transcript is None and self._index is not None and job.cache_key:
+            record = await asyncio.to_thread(self._index.get_episode, job.cache_key)
+            if record is not None:
+                status["transcript"] = record.transcript
+        return status
+
+    def _touch_job(self, feed_url: str) -> Optional[AudioJob]:
+        job = self._jobs.get(feed_url)
+        if job is not None:
+            job.accessed_at = time.monotonic()
+            self._jobs.move_to_end(feed_url)
+        return job
+
+    def _track_job(self, job: AudioJob) -> None:
+        self._jobs[job.feed_url] = job
+        self._jobs.move_to_end(job.feed_url)
+        self._evict_jobs()
+
+    def _evict_jobs(self) -> None:
+        """
+        Drop idle or least recently used finished jobs until the registry fits its bounds.
+
+        Jobs still generating are never evicted; ready episodes can be restored from the index.
+        """
+        now = time.monotonic()
+        total_bytes = sum(job.approx_bytes() for job in self._jobs.values())
+        for feed_url, job in list(self._jobs.items()):
+            over_limit = len(self._jobs) > self.max_jobs or total_bytes > self.max_job_bytes
+            expired = now - job.accessed_at > self.job_idle_ttl_seconds
+            if not over_limit and not expired:
+                continue
+            if job.active:
+                continue
+            del self._jobs[feed_url]
+            total_bytes -= job.approx_bytes()
+            self._job_evictions += 1
+
+    def registry_stats(self) -> Dict[str, object]:
+        return {
+            "tracked": len(self._jobs),
+            "active": sum(1 for job in self._jobs.values() if job.active),
+            "approx_bytes": sum(job.approx_bytes() for job in self._jobs.values()),
+            "max_jobs": self.max_jobs,
+            "max_bytes": self.max_job_bytes,
+            "idle_ttl_seconds": self.job_idle_ttl_seconds,
+            "evictions": self._job_evictions,
+        }
+
+    async def stats(self) -> Dict[str, object]:
+        # Cache statistics query SQLite, so they are gathered off the event loop.
+        caches = {"transcript": self._transcript_cache, "tts": self._tts_cache}
+        cache_stats = {name: await asyncio.to_thread(cache.stats) if cache else None for name, cache in caches.items()}
+        return {
+            "scheduler": self._scheduler.stats(),
+            "jobs": self.registry_stats(),
+            "storage": self.storage.report(),
+            "caches": cache_stats,
+            "subscribers": len(self._subscriptions),
+            "worker": self.worker_id,
+            "backend": self.backend.name,
+            "derived_audio": self.derived_audio.stats(),
+        }
 
     async def list_statuses(self) -> List[Dict[str, Optional[str]]]:
         async with self._jobs_lock:
-            return [job.to_dict() for job in self._jobs.values()]
+            jobs = list(self._jobs.values())
+        return [await self.describe(job) for job in jobs]
+
+
+# Built on first use (or by ``warm_up_audio``) so importing the app opens no databases.
+audio_manager: Optional[AudioPodcastManager] = None
+_maintenance_requested = False
+
+
+def get_audio_manager() -> AudioPodcastManager:
+    global audio_manager
+    if audio_manager is None:
+        audio_manager = AudioPodcastManager()
+        if _maintenance_requested:
+            # Tracked by the storage itself, so stop_audio_maintenance cancels and awaits it.
+            audio_manager.storage.start()
+    return audio_manager
+
+
+REGISTRY.callback(
+    "news_podcast_audio_jobs_in_flight",
+    "Podcast generation jobs currently pending or generating in this worker.",
+    "gauge",
+    lambda: [({}, audio_manager.registry_stats()["active"] if audio_manager is not None else 0)],
+)
+
+
+async def warm_up_audio(max_feeds: int) -> List[str]:
+    """
+    Build the manager, load the generation backend and restore recent episodes from the index.
+
+    Returns the feeds of those episodes so the caller can prefetch them.
+    """
+    with STARTUP.phase("audio_manager"):
+        manager = get_audio_manager()
+    with STARTUP.phase("generation_backend"):
+        try:
+            await asyncio.to_thread(manager.backend.warm_up)
+        except Exception as exc:
+            LOGGER.warning("Warm-up of the %s generation backend failed: %s", manager.backend.name, exc)
+    with STARTUP.phase("job_index"):
+        return await manager.restore_recent_jobs(max_feeds)
+
+
+async def ensure_audio_for_feed(
+    feed_url: str,
+    channel_title: str,
+    articles: List[Dict[str, str]],
+    content_hash: Optional[str] = None,
+    priority: int = PRIORITY_INTERACTIVE,
+    include_transcript: bool = True,
+) -> Dict[str, Optional[str]]:
+    manager = get_audio_manager()
+    job = await manager.ensure_audio(feed_url, channel_title, articles, content_hash=content_hash, priority=priority)
+    return await manager.describe(job, include_transcript)
+
+
+async def subscribe_audio_events(feeds: Optional[Iterable[str]] = None) -> AudioStatusSubscription:
+    return await get_audio_manager().subscribe(feeds)
+
+
+def unsubscribe_audio_events(subscription: AudioStatusSubscription) -> None:
+    get_audio_manager().unsubscribe(subscription)
+
+
+async def start_audio_maintenance() -> None:
+    """Run storage sweeps once the manager exists, without building it just for that."""
+    global _maintenance_requested
+    _maintenance_requested = True
+    if audio_manager is not None:
+        audio_manager.storage.start()
+
+
+async def stop_audio_maintenance() -> None:
+    global _maintenance_requested
+    _maintenance_requested = False
+    if audio_manager is not None:
+        await audio_manager.storage.close()
 
 
-audio_manager = AudioPodcastManager()
+async def get_audio_stats() -> Dict[str, object]:
+    return await get_audio_manager().stats()
 
 
-async def ensure_audio_for_feed(feed_url: str, channel_title: str, articles: List[Dict[str, str]]) -> Dict[str, Optional[str]]:
-    job = await audio_manager.ensure_audio(feed_url, channel_title, articles)
-    return job.to_dict()
+async def get_audio_status(feed_url: str, include_transcript: bool = True) -> Dict[str, Optional[str]]:
+    return await get_audio_manager().get_status(feed_url, include_transcript)
 
 
-async def get_audio_status(feed_url: str) -> Dict[str, Optional[str]]:
-    return await audio_manager.get_status(feed_url)
+async def resolve_audio_file(name: str) -> Optional[tuple[Path, str, Optional[str]]]:
+    return await get_audio_manager().resolve_audio(name)
 
 
 async def get_all_audio_statuses() -> List[Dict[str, Optional[str]]]:
-    return await audio_manager.list_statuses()
+    return await get_audio_manager().list_statuses()
@@ -0,0 +1,254 @@
+"""
+Offline load scenarios for the articles endpoint and the podcast generation pipeline.
+
+Feeds come from a local stub RSS server (fixture feeds plus generated archives) and model calls
+go to a stub Gemini client with configurable latency, error and 429 rates, so runs are repeatable
+and free. Each scenario drives its target at a fixed concurrency and reports throughput, p50 and
+p99 latency, followed by the per-stage timings recorded in ``metrics``.
+
+Usage::
+
+    python -m benchmarks.bench_load [--scenario articles|articles-cold|timeline|audio|all]
+        [--requests N] [--concurrency N] [--audio-jobs N] [--max-p99-ms MS]
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+import math
+import os
+import sys
+import tempfile
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Awaitable, Callable, Dict, List
+
+SCENARIOS = ("articles", "articles-cold", "timeline", "audio")
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of ``samples``."""
+    if not samples:
+        return float("nan")
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+@dataclass
+class ScenarioResult:
+    name: str
+    elapsed: float = 0.0
+    failures: int = 0
+    latencies: List[float] = field(default_factory=list)
+
+    @property
+    def requests(self) -> int:
+        return len(self.latencies)
+
+    def report(self) -> str:
+        rate = self.requests / self.elapsed if self.elapsed else float("inf")
+        return (
+            f"{self.name:<16}{self.requests:>8}{self.failures:>8}{rate:>10.1f}"
+            f"{percentile(self.latencies, 50) * 1000:>10.1f}{percentile(self.latencies, 99) * 1000:>10.1f}"
+        )
+
+
+async def drive(name: str, operation: Callable[[int], Awaitable[bool]], requests: int, concurrency: int) -> ScenarioResult:
+    """Run ``operation(i)`` for ``i`` in ``range(requests)`` with ``concurrency`` workers."""
+    result = ScenarioResult(name=name)
+    counter = iter(range(requests))
+
+    async def worker() -> None:
+        for index in counter:
+            started = time.perf_counter()
+            try:
+                ok = await operation(index)
+            except Exception:
+                ok = False
+            result.latencies.append(time.perf_counter() - started)
+            if not ok:
+                result.failures += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(max(1, concurrency))))
+    result.elapsed = time.perf_counter() - started
+    return result
+
+
+def synthetic_articles(feed_index: int, count: int) -> List[Dict[str, str]]:
+    return [
+        {
+            "title": f"Benchmark story {feed_index}-{position}",
+            "link": f"https://news.example.com/{feed_index}/{position}",
+            "description": f"Summary of benchmark story {position} for feed {feed_index}.",
+        }
+        for position in range(count)
+    ]
+
+
+def stage_report() -> List[str]:
+    from metrics import STAGE_SECONDS
+
+    lines = [f"{'stage':<16}{'count':>8}{'mean ms':>10}"]
+    for (stage,), (count, total) in sorted(STAGE_SECONDS.totals().items()):
+        lines.append(f"{stage:<16}{count:>8}{total / count * 1000 if count else 0.0:>10.1f}")
+    return lines
+
+
+async def run(args: argparse.Namespace, workdir: Path) -> int:
+    import httpx
+
+    import audio_podcast_backend
+    import rss_viewer
+    from benchmarks.stub_genai import StubGenaiClient
+    from benchmarks.stub_rss import StubRSSServer, fixture_feeds
+    from generation_backends import GeminiBackend, SyntheticBackend
+    from generation_scheduler import GenerationScheduler, StageConfig
+    from job_store import MemoryJobStore
+
+    client = StubGenaiClient(
+        text_latency_seconds=args.text_latency,
+        tts_latency_seconds=args.tts_latency,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        seed=args.seed,
+    )
+
+    def stage(model: str) -> StageConfig:
+        return StageConfig(
+            model=model,
+            max_concurrency=args.model_concurrency,
+            requests_per_minute=args.rpm,
+            burst=args.model_concurrency,
+        )
+
+    speakers = audio_podcast_backend.DEFAULT_SPEAKERS
+    if args.backend == "synthetic":
+        backend = SyntheticBackend(speakers)
+    else:
+        backend = GeminiBackend(
+            audio_podcast_backend.TRANSCRIPT_MODEL, audio_podcast_backend.TTS_MODEL, speakers, client=client
+        )
+    manager = audio_podcast_backend.AudioPodcastManager(
+        output_dir=workdir / "podcasts",
+        index_path=workdir / "podcast_index.sqlite3",
+        backend=backend,
+        job_store=MemoryJobStore(),
+        storage_quota_bytes=0,
+        scheduler=GenerationScheduler(
+            {"transcript": stage(audio_podcast_backend.TRANSCRIPT_MODEL), "tts": stage(audio_podcast_backend.TTS_MODEL)},
+            max_attempts=audio_podcast_backend.GENERATION_MAX_ATTEMPTS,
+            base_backoff_seconds=args.backoff,
+        ),
+    )
+    # The module-level wrappers used by the app resolve ``audio_manager`` at call time.
+    audio_podcast_backend.audio_manager = manager
+
+    server = StubRSSServer(fixture_feeds(args.archive_items), latency_seconds=args.rss_latency).start()
+    feed_urls = [server.url(name) for name in server.names]
+    scenarios = SCENARIOS if args.scenario == "all" else (args.scenario,)
+    results: List[ScenarioResult] = []
+    try:
+        transport = httpx.ASGITransport(app=rss_viewer.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as http:
+
+            async def articles(index: int, cold: bool = False) -> bool:
+                if cold:
+                    rss_viewer.feed_cache.clear()
+                response = await http.get("/api/articles", params={"feed": feed_urls[index % len(feed_urls)]})
+                return response.status_code == 200
+
+            async def timeline(index: int) -> bool:
+                # Every feed merged; odd requests follow the first page's cursor to the second page.
+                params = {"feed": feed_urls, "omit": "transcript"}
+                response = await http.get("/api/timeline", params=params)
+                cursor = response.json().get("next_cursor") if response.status_code == 200 else None
+                if index % 2 and cursor:
+                    response = await http.get("/api/timeline", params={**params, "cursor": cursor})
+                return response.status_code == 200
+
+            async def audio(index: int) -> bool:
+                job = await manager.ensure_audio(
+                    f"https://bench.example.com/feed/{index}",
+                    f"Benchmark feed {index}",
+                    synthetic_articles(index, args.articles_per_feed),
+                )
+                if job.task is not None:
+                    await asyncio.shield(job.task)
+                return job.status == "ready"
+
+            for name in scenarios:
+                if name == "audio":
+                    result = await drive(name, audio, args.audio_jobs, args.audio_concurrency)
+                elif name == "timeline":
+                    result = await drive(name, timeline, args.requests, args.concurrency)
+                else:
+                    cold = name == "articles-cold"
+                    result = await drive(name, lambda index: articles(index, cold), args.requests, args.concurrency)
+                results.append(result)
+    finally:
+        pending = [job.task for job in manager._jobs.values() if job.task is not None]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        await rss_viewer.feed_fetcher.close()
+        server.close()
+
+    print(f"{'scenario':<16}{'requests':>8}{'failed':>8}{'req/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+    for result in results:
+        print(result.report())
+    print()
+    print("\n".join(stage_report()))
+    print()
+    print(f"stub model calls: {client.calls}; stub RSS requests: {server.requests} ({server.not_modified} not modified)")
+
+    if args.max_p99_ms is not None:
+        slow = [result.name for result in results if percentile(result.latencies, 99) * 1000 > args.max_p99_ms]
+        if slow:
+            print(f"p99 above {args.max_p99_ms:.0f} ms: {', '.join(slow)}")
+            return 1
+    return 0
+
+
+def main(argv: List[str] | None = None) -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--scenario", choices=(*SCENARIOS, "all"), default="all")
+    arg_parser.add_argument(
+        "--backend",
+        choices=("stub-gemini", "synthetic"),
+        default="stub-gemini",
+        help="Gemini backend over the stub client, or the offline synthetic backend.",
+    )
+    arg_parser.add_argument("--requests", type=int, default=200, help="Requests per articles scenario.")
+    arg_parser.add_argument("--concurrency", type=int, default=16, help="Concurrent articles requests.")
+    arg_parser.add_argument("--audio-jobs", type=int, default=12, help="Episodes generated by the audio scenario.")
+    arg_parser.add_argument("--audio-concurrency", type=int, default=4, help="Episodes generated at once.")
+    arg_parser.add_argument("--articles-per-feed", type=int, default=5)
+    arg_parser.add_argument("--archive-items", type=int, default=2000, help="Items in the generated archive feed.")
+    arg_parser.add_argument("--rss-latency", type=float, default=0.0, help="Stub RSS response delay (s).")
+    arg_parser.add_argument("--text-latency", type=float, default=0.05, help="Stub transcript call latency (s).")
+    arg_parser.add_argument("--tts-latency", type=float, default=0.2, help="Stub TTS call latency (s).")
+    arg_parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of stub calls failing with 503.")
+    arg_parser.add_argument("--rate-limit-rate", type=float, default=0.05, help="Fraction of stub calls failing with 429.")
+    arg_parser.add_argument("--model-concurrency", type=int, default=4, help="Scheduler slots per stage.")
+    arg_parser.add_argument("--rpm", type=float, default=6000, help="Scheduler requests per minute per model.")
+    arg_parser.add_argument("--backoff", type=float, default=0.05, help="Scheduler base backoff (s).")
+    arg_parser.add_argument("--seed", type=int, default=1)
+    arg_parser.add_argument("--log-level", default="ERROR", help="Log level for the app's loggers (retries log at WARNING).")
+    arg_parser.add_argument("--max-p99-ms", type=float, default=None, help="Exit non-zero if any scenario's p99 exceeds this.")
+    args = arg_parser.parse_args(argv)
+    logging.basicConfig(level=args.log_level.upper())
+
+    with tempfile.TemporaryDirectory(prefix="news_podcast_bench_") as tmp:
+        workdir = Path(tmp)
+        # Keep the app's default index, job store and caches out of the working tree.
+        os.environ.setdefault("PODCAST_INDEX_PATH", str(workdir / "default" / "podcast_index.sqlite3"))
+        os.environ.setdefault("PODCAST_JOB_STORE", "memory")
+        return asyncio.run(run(args, workdir))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
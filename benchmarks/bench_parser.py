@@ -0,0 +1,135 @@
+"""
+Regression check and throughput benchmark for feed item extraction.
+
+Every fixture feed in ``benchmarks/fixtures`` (plus a generated multi-megabyte archive) is
+parsed with both the legacy multi-scan extractor and ``feed_parser.parse_item``. The run fails
+if any item differs, then reports items/sec for each implementation.
+
+Usage::
+
+    python -m benchmarks.bench_parser [--repeat N] [--archive-items N]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+from xml.etree import ElementTree as ET
+
+from benchmarks.legacy_parser import legacy_parse_item
+from feed_parser import StreamingFeedParser, parse_item
+
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures"
+
+
+def generate_archive(item_count: int) -> bytes:
+    """Build a large feed mixing every image source shape the extractor handles."""
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<rss version="2.0" xmlns:media="https://search.yahoo.com/mrss/" '
+        'xmlns:content="http://purl.org/rss/1.0/modules/content/">\n'
+        "<channel><title>Archive</title>\n"
+    ]
+    for index in range(item_count):
+        shape = index % 5
+        extra = ""
+        if shape == 0:
+            extra = f'<media:content url="https://cdn.example.com/{index}.jpg" type="image/jpeg"/>'
+        elif shape == 1:
+            extra = (
+                "<content:encoded><![CDATA[<p>Body text for the story.</p>"
+                f'<img src="https://cdn.example.com/{index}.png">]]></content:encoded>'
+            )
+        elif shape == 2:
+            extra = f'<enclosure url="https://cdn.example.com/{index}.webp" type="image/webp"/>'
+        elif shape == 3:
+            extra = f'<source url="https://wire.example.com/{index}.gif">Wire</source>'
+        parts.append(
+            "<item>"
+            f"<title>Story number {index} &amp; more</title>"
+            f"<link>https://news.example.com/{index}</link>"
+            f"<description>&lt;p&gt;Summary for story {index} with some   spacing.&lt;/p&gt;</description>"
+            "<pubDate>Mon, 06 Jan 2025 09:15:00 +0000</pubDate>"
+            "<category>News</category><category>Archive</category>"
+            f"{extra}</item>\n"
+        )
+    parts.append("</channel></rss>\n")
+    return "".join(parts).encode("utf-8")
+
+
+def load_corpus(archive_items: int) -> List[Tuple[str, List[ET.Element]]]:
+    corpus = []
+    for path in sorted(FIXTURES_DIR.glob("*.xml")):
+        corpus.append((path.name, _items(path.read_bytes())))
+    if archive_items:
+        corpus.append((f"generated_archive[{archive_items}]", _items(generate_archive(archive_items))))
+    return corpus
+
+
+def _items(body: bytes) -> List[ET.Element]:
+    channel = ET.fromstring(body).find("channel")
+    return list(channel.findall("item")) if channel is not None else []
+
+
+def check_parity(corpus: List[Tuple[str, List[ET.Element]]]) -> int:
+    mismatches = 0
+    for name, items in corpus:
+        for position, item in enumerate(items):
+            expected = legacy_parse_item(item)
+            actual = parse_item(item)
+            if expected != actual:
+                mismatches += 1
+                print(f"MISMATCH {name} item {position}:\n  legacy: {expected}\n  new:    {actual}")
+    return mismatches
+
+
+def measure(extract: Callable[[ET.Element], Dict], items: List[ET.Element], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for item in items:
+            extract(item)
+    elapsed = time.perf_counter() - start
+    return (len(items) * repeat) / elapsed if elapsed else float("inf")
+
+
+def measure_streaming(body: bytes, chunk_size: int = 64 * 1024) -> Tuple[int, float]:
+    parser = StreamingFeedParser(max_items=sys.maxsize, max_bytes=len(body) + 1)
+    start = time.perf_counter()
+    for offset in range(0, len(body), chunk_size):
+        parser.feed(body[offset:offset + chunk_size])
+    parser.close()
+    return len(parser.items), time.perf_counter() - start
+
+
+def main(argv: List[str] | None = None) -> int:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--repeat", type=int, default=20, help="Passes over the fixture corpus.")
+    arg_parser.add_argument("--archive-items", type=int, default=5000, help="Items in the generated archive feed.")
+    args = arg_parser.parse_args(argv)
+
+    corpus = load_corpus(args.archive_items)
+    mismatches = check_parity(corpus)
+    total_items = sum(len(items) for _, items in corpus)
+    print(f"parity: {total_items - mismatches}/{total_items} items identical")
+    if mismatches:
+        return 1
+
+    print(f"{'corpus':<32}{'items':>7}{'legacy it/s':>14}{'single-pass it/s':>18}{'speed-up':>10}")
+    for name, items in corpus:
+        repeat = max(1, args.repeat if len(items) < 100 else args.repeat // 10)
+        legacy_rate = measure(legacy_parse_item, items, repeat)
+        new_rate = measure(parse_item, items, repeat)
+        print(f"{name:<32}{len(items):>7}{legacy_rate:>14.0f}{new_rate:>18.0f}{new_rate / legacy_rate:>9.2f}x")
+
+    if args.archive_items:
+        body = generate_archive(args.archive_items)
+        count, elapsed = measure_streaming(body)
+        print(f"streaming parse of {len(body) / 1e6:.1f} MB archive: {count} items in {elapsed * 1000:.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
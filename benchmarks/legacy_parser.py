@@ -0,0 +1,98 @@
+"""
+Reference item extractor as it stood before the single-pass rewrite in ``feed_parser``.
+
+Kept verbatim so the parser benchmark can assert identical output and report the speed-up.
+"""
+from __future__ import annotations
+
+import re
+from html import unescape
+from typing import Any, Dict, Optional
+from xml.etree import ElementTree as ET
+
+from feed_parser import NAMESPACES, _parse_datetime as _cached_parse_datetime
+
+# The legacy path parsed every date afresh; bypass the memoisation added alongside the rewrite.
+_parse_datetime = _cached_parse_datetime.__wrapped__
+
+
+def _strip_html(value: Optional[str]) -> str:
+    if not value:
+        return ""
+
+    text = re.sub(r"<[^>]+>", "", value)
+    text = re.sub(r"\s+", " ", text)
+    return unescape(text).strip()
+
+
+def _extract_image(item: ET.Element) -> Optional[str]:
+    import re
+
+    # Try media namespace sources first - check all media: elements
+    for media_elem in item.findall(".//media:*", NAMESPACES):
+        if media_elem.attrib.get("url"):
+            url = media_elem.attrib["url"]
+            media_type = media_elem.attrib.get("type", "")
+            # Accept any media content, prioritize images
+            if media_type.startswith("image") or "jpg" in url or "png" in url or "jpeg" in url or not media_type:
+                return url
+
+    # Look for images in description content
+    description = item.findtext("description", default="")
+    if description:
+        img_matches = re.findall(r'<img[^>]+src=["\']([^"\']+)["\']', description, re.IGNORECASE)
+        for img_url in img_matches:
+            return img_url
+
+    # Check for content:encoded which often contains full HTML
+    content_encoded = item.find("content:encoded", NAMESPACES)
+    if content_encoded is not None and content_encoded.text:
+        img_matches = re.findall(r'<img[^>]+src=["\']([^"\']+)["\']', content_encoded.text, re.IGNORECASE)
+        for img_url in img_matches:
+            return img_url
+
+    # Check all enclosure tags
+    for enclosure in item.findall("enclosure"):
+        url = enclosure.attrib.get("url", "")
+        enc_type = enclosure.attrib.get("type", "")
+        if enc_type.startswith("image") or any(ext in url.lower() for ext in ['.jpg', '.jpeg', '.png', '.gif', '.webp']):
+            return url
+
+    # Look for any element that might contain an image URL
+    for child in item.iter():
+        # Check attributes for image URLs
+        for attr_name, attr_value in child.attrib.items():
+            if attr_value and any(ext in attr_value.lower() for ext in ['jpg', 'jpeg', 'png', 'gif', 'webp']):
+                if attr_value.startswith('http'):
+                    return attr_value
+
+    return None
+
+
+def legacy_parse_item(item: ET.Element) -> Dict[str, Any]:
+    title = _strip_html(item.findtext("title", default="Untitled"))
+    description = _strip_html(item.findtext("description", default=""))
+    link = item.findtext("link", default="").strip()
+    published = _parse_datetime(item.findtext("pubDate"))
+    author = _strip_html(item.findtext("dc:creator", default="") or item.findtext("author"))
+    categories = [
+        _strip_html(cat.text) for cat in item.findall("category") if cat.text
+    ]
+
+    image_url = _extract_image(item)
+
+    if not image_url:
+        import hashlib
+        article_hash = hashlib.md5(f"{title}{link}".encode()).hexdigest()[:6]
+        seed = int(article_hash, 16) % 1000
+        image_url = f"https://picsum.photos/400/300?random={seed}"
+
+    return {
+        "title": title,
+        "description": description,
+        "link": link,
+        "published": published,
+        "author": author,
+        "categories": categories,
+        "image": image_url,
+    }
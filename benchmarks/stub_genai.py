@@ -0,0 +1,105 @@
+"""
+Stand-in for ``google.genai.Client`` with configurable latency, failure and rate-limit rates.
+
+Only the surface the podcast backend uses is implemented: ``client.models.generate_content``
+returning text responses, or inline PCM audio when the config asks for the AUDIO modality.
+Synthesised audio is silence whose length grows with the transcript, as real speech would.
+"""
+from __future__ import annotations
+
+import random
+import threading
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, Optional
+
+from audio_podcast_backend import DEFAULT_SAMPLE_RATE, DEFAULT_SAMPLE_WIDTH
+from generation_backends import INTRO_MARKER, OUTRO_MARKER
+
+
+SPEECH_CHARS_PER_SECOND = 15.0
+PCM_MIME_TYPE = f"audio/L16;codec=pcm;rate={DEFAULT_SAMPLE_RATE}"
+
+
+class StubAPIError(Exception):
+    """Mirrors the ``code``/``status`` attributes of ``google.genai.errors.APIError``."""
+
+    def __init__(self, code: int, status: str, message: str) -> None:
+        super().__init__(f"{code} {status}. {message}")
+        self.code = code
+        self.status = status
+
+
+class _StubModels:
+    def __init__(self, client: "StubGenaiClient") -> None:
+        self._client = client
+
+    def generate_content(self, model: str, contents: Any, config: Any = None) -> SimpleNamespace:
+        return self._client._generate(model, str(contents), config)
+
+
+class StubGenaiClient:
+    def __init__(
+        self,
+        text_latency_seconds: float = 0.5,
+        tts_latency_seconds: float = 1.5,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        jitter: float = 0.2,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.text_latency_seconds = text_latency_seconds
+        self.tts_latency_seconds = tts_latency_seconds
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.jitter = jitter
+        self.models = _StubModels(self)
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.calls: Dict[str, int] = {"text": 0, "tts": 0, "errors": 0, "rate_limited": 0}
+
+    def _roll(self) -> float:
+        with self._lock:
+            return self._random.random()
+
+    def _sleep(self, latency: float) -> None:
+        if latency > 0:
+            spread = latency * self.jitter
+            time.sleep(max(0.0, latency + (self._roll() * 2 - 1) * spread))
+
+    def _generate(self, model: str, contents: str, config: Any) -> SimpleNamespace:
+        wants_audio = "AUDIO" in (getattr(config, "response_modalities", None) or [])
+        kind = "tts" if wants_audio else "text"
+        with self._lock:
+            self.calls[kind] += 1
+        self._sleep(self.tts_latency_seconds if wants_audio else self.text_latency_seconds)
+        roll = self._roll()
+        if roll < self.rate_limit_rate:
+            with self._lock:
+                self.calls["rate_limited"] += 1
+            raise StubAPIError(429, "RESOURCE_EXHAUSTED", f"Quota exceeded for {model}.")
+        if roll < self.rate_limit_rate + self.error_rate:
+            with self._lock:
+                self.calls["errors"] += 1
+            raise StubAPIError(503, "UNAVAILABLE", "The model is overloaded.")
+        if wants_audio:
+            return self._audio_response(contents)
+        return SimpleNamespace(text=self._dialogue(contents), candidates=[])
+
+    @staticmethod
+    def _dialogue(prompt: str) -> str:
+        if INTRO_MARKER in prompt:
+            return (
+                f"{INTRO_MARKER}\nLiam: Welcome to the briefing.\nAnya: Plenty to get through today.\n"
+                f"{OUTRO_MARKER}\nLiam: That's all for now.\nAnya: See you next time."
+            )
+        story = prompt.rsplit("Story:", 1)[-1].strip().splitlines()[0] if "Story:" in prompt else "the news"
+        return f"Liam: Next up, {story}.\nAnya: A story worth a closer look.\nLiam: Indeed."
+
+    @staticmethod
+    def _audio_response(transcript: str) -> SimpleNamespace:
+        seconds = max(1.0, len(transcript) / SPEECH_CHARS_PER_SECOND)
+        frames = int(seconds * DEFAULT_SAMPLE_RATE)
+        inline = SimpleNamespace(data=bytes(frames * DEFAULT_SAMPLE_WIDTH), mime_type=PCM_MIME_TYPE)
+        part = SimpleNamespace(inline_data=inline)
+        return SimpleNamespace(text=None, candidates=[SimpleNamespace(content=SimpleNamespace(parts=[part]))])
@@ -0,0 +1,107 @@
+"""
+Local RSS server for benchmarks, serving fixture feeds and generated feeds of various sizes.
+
+Responses carry an ``ETag`` and answer ``If-None-Match`` with 304, like most real publishers,
+and an optional per-request latency stands in for a slow upstream.
+"""
+from __future__ import annotations
+
+import hashlib
+import http.server
+import socketserver
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from benchmarks.bench_parser import FIXTURES_DIR, generate_archive
+
+
+def fixture_feeds(archive_items: int = 5000) -> Dict[str, bytes]:
+    """Fixture feeds keyed by name, plus generated small, medium and archive-sized feeds."""
+    feeds = {path.stem: path.read_bytes() for path in sorted(Path(FIXTURES_DIR).glob("*.xml"))}
+    feeds["small"] = generate_archive(20)
+    feeds["medium"] = generate_archive(200)
+    if archive_items:
+        feeds["archive"] = generate_archive(archive_items)
+    return feeds
+
+
+class _ThreadingServer(socketserver.ThreadingMixIn, http.server.HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class StubRSSServer:
+    def __init__(self, feeds: Dict[str, bytes], latency_seconds: float = 0.0) -> None:
+        self.latency_seconds = latency_seconds
+        self.requests = 0
+        self.not_modified = 0
+        self._feeds: Dict[str, bytes] = {}
+        self._etags: Dict[str, str] = {}
+        self._lock = threading.Lock()
+        self._server: Optional[_ThreadingServer] = None
+        for name, body in feeds.items():
+            self.set_feed(name, body)
+
+    def set_feed(self, name: str, body: bytes) -> None:
+        with self._lock:
+            self._feeds[name] = body
+            self._etags[name] = '"%s"' % hashlib.sha1(body).hexdigest()
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._feeds)
+
+    def url(self, name: str) -> str:
+        if self._server is None:
+            raise RuntimeError("Stub RSS server is not running.")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/{name}.xml"
+
+    def start(self) -> "StubRSSServer":
+        stub = self
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args: object) -> None:
+                pass
+
+            def do_GET(self) -> None:
+                name = self.path.lstrip("/").split("?", 1)[0].removesuffix(".xml")
+                with stub._lock:
+                    stub.requests += 1
+                    body = stub._feeds.get(name)
+                    etag = stub._etags.get(name)
+                if stub.latency_seconds:
+                    time.sleep(stub.latency_seconds)
+                if body is None:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                if self.headers.get("If-None-Match") == etag:
+                    with stub._lock:
+                        stub.not_modified += 1
+                    self.send_response(304)
+                    self.send_header("ETag", etag)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "application/rss+xml; charset=utf-8")
+                self.send_header("ETag", etag)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        self._server = _ThreadingServer(("127.0.0.1", 0), Handler)
+        threading.Thread(target=self._server.serve_forever, name="stub-rss", daemon=True).start()
+        return self
+
+    def close(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import zlib
+from typing import Dict, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # Brotli is optional; gzip is always available.
+    brotli = None
+
+
+COMPRESSIBLE_TYPES = (
+    "application/json",
+    "application/x-ndjson",
+    "text/html",
+    "text/css",
+    "text/plain",
+    "text/javascript",
+    "application/javascript",
+)
+
+
+def _accepted_encodings(accept_encoding: str) -> Dict[str, float]:
+    accepted: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name.strip().lower()] = quality
+    return accepted
+
+
+def choose_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick brotli when the client accepts it and the module is installed, else gzip."""
+    accepted = _accepted_encodings(accept_encoding)
+    if brotli is not None and accepted.get("br", 0.0) > 0:
+        return "br"
+    if accepted.get("gzip", 0.0) > 0:
+        return "gzip"
+    return None
+
+
+def strip_encoding_suffix(etag: str) -> str:
+    """Undo the suffix added to ETags of compressed responses, for If-None-Match comparisons."""
+    for encoding in ("br", "gzip"):
+        suffix = f'-{encoding}"'
+        if etag.endswith(suffix):
+            return etag[: -len(suffix)] + '"'
+    return etag
+
+
+class _Encoder:
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int) -> None:
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._compressor = zlib.compressobj(gzip_level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def chunk(self, data: bytes) -> bytes:
+        # Flush each chunk so streamed records (NDJSON) reach the client as they are produced.
+        if self.encoding == "br":
+            return self._compressor.process(data) + self._compressor.flush()
+        return self._compressor.compress(data) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        if self.encoding == "br":
+            return self._compressor.process(data) + self._compressor.finish()
+        return self._compressor.compress(data) + self._compressor.flush()
+
+
+def _encoded_etag(etag: str, encoding: str) -> str:
+    return f'{etag[:-1]}-{encoding}"'
+
+
+def _strip_if_none_match(scope: Scope) -> Scope:
+    """
+    Remove encoding suffixes from ``If-None-Match`` before the app sees it, so every route
+    (``StaticFiles`` included) compares the client's ETags against its own unsuffixed ones.
+    """
+    headers = []
+    changed = False
+    for name, value in scope["headers"]:
+        if name == b"if-none-match":
+            tags = value.decode("latin-1").split(",")
+            stripped = ", ".join(strip_encoding_suffix(tag.strip()) for tag in tags)
+            changed = changed or stripped != value.decode("latin-1")
+            value = stripped.encode("latin-1")
+        headers.append((name, value))
+    return dict(scope, headers=headers) if changed else scope
+
+
+class CompressionMiddleware:
+    """
+    Compress API and page responses with brotli or gzip, as negotiated by ``Accept-Encoding``.
+
+    Only textual content types are touched, so audio files and event streams pass through
+    unchanged. Streamed bodies are flushed chunk by chunk rather than buffered, and strong
+    ETags gain an encoding suffix because the compressed bytes are a different representation.
+    The suffix is removed from ``If-None-Match`` on the way in and restored on a 304, so
+    revalidation works for every route without the route knowing about compression.
+    """
+
+    def __init__(self, app: ASGIApp, minimum_size: int = 512, gzip_level: int = 6, brotli_quality: int = 5) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        request_headers = Headers(scope=scope)
+        encoding = choose_encoding(request_headers.get("accept-encoding", ""))
+        if_none_match = request_headers.get("if-none-match", "")
+        scope = _strip_if_none_match(scope)
+        start: Optional[Message] = None
+        encoder: Optional[_Encoder] = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, encoder, passthrough
+            if message["type"] == "http.response.start":
+                start = message
+                if message["status"] == 304:
+                    # A 304 names the representation the client holds: the compressed one if
+                    # that is what it revalidated.
+                    headers = MutableHeaders(raw=message["headers"])
+                    etag = headers.get("etag")
+                    if encoding and etag and etag.endswith('"') and not etag.startswith("W/"):
+                        if _encoded_etag(etag, encoding) in if_none_match:
+                            headers["ETag"] = _encoded_etag(etag, encoding)
+                            headers.add_vary_header("Accept-Encoding")
+                    passthrough = True
+                    await send(message)
+                    return
+                headers = Headers(raw=message["headers"])
+                content_type = headers.get("content-type", "").split(";", 1)[0].strip().lower()
+                compressible = content_type in COMPRESSIBLE_TYPES and "content-encoding" not in headers
+                if compressible:
+                    MutableHeaders(raw=message["headers"]).add_vary_header("Accept-Encoding")
+                passthrough = not compressible or encoding is None
+                if passthrough:
+                    await send(message)
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if start is not None:
+                initial, start = start, None
+                if not more_body and len(body) < self.minimum_size:
+                    passthrough = True
+                    await send(initial)
+                    await send(message)
+                    return
+                encoder = _Encoder(encoding, self.gzip_level, self.brotli_quality)
+                headers = MutableHeaders(raw=initial["headers"])
+                headers["Content-Encoding"] = encoding
+                etag = headers.get("etag")
+                if etag and etag.endswith('"') and not etag.startswith("W/"):
+                    headers["ETag"] = _encoded_etag(etag, encoding)
+                if "content-length" in headers:
+                    del headers["Content-Length"]
+                if not more_body:
+                    body = encoder.finish(body)
+                    headers["Content-Length"] = str(len(body))
+                    await send(initial)
+                    await send({"type": "http.response.body", "body": body})
+                    return
+                await send(initial)
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": encoder.chunk(body) if more_body else encoder.finish(body),
+                    "more_body": more_body,
+                }
+            )
+
+        await self.app(scope, receive, send_compressed)
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Generic, Optional, TypeVar
+from urllib.parse import urlsplit, urlunsplit
+
+
+T = TypeVar("T")
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalise_feed_url(feed_url: str) -> str:
+    """
+    Canonicalise a feed URL so trivially different spellings share one cache entry.
+    """
+    parts = urlsplit(feed_url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    if parts.username:
+        credentials = parts.username if parts.password is None else f"{parts.username}:{parts.password}"
+        host = f"{credentials}@{host}"
+    return urlunsplit((scheme, host, parts.path or "/", parts.query, ""))
+
+
+@dataclass
+class _CacheEntry(Generic[T]):
+    value: T
+    stored_at: float
+
+
+class FeedCache(Generic[T]):
+    """
+    Bounded LRU cache with a freshness TTL, stale-while-revalidate and single-flight loading.
+
+    Concurrent misses for the same key share one in-flight load; entries older than the TTL
+    but within the stale window are served immediately while a background refresh runs.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        stale_seconds: float = 0.0,
+        max_entries: int = 256,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.ttl_seconds = max(0.0, ttl_seconds)
+        self.stale_seconds = max(0.0, stale_seconds)
+        self.max_entries = max(1, max_entries)
+        self._clock = clock
+        self._entries: "OrderedDict[str, _CacheEntry[T]]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.refreshes = 0
+        self.evictions = 0
+        self.errors = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str, loader: Callable[[], Awaitable[T]]) -> T:
+        entry = self._entries.get(key)
+        if entry is not None:
+            age = self._clock() - entry.stored_at
+            if age < self.ttl_seconds:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry.value
+            if age < self.ttl_seconds + self.stale_seconds:
+                self.stale_hits += 1
+                self._entries.move_to_end(key)
+                self._refresh_in_background(key, loader)
+                return entry.value
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            task = self._start_load(key, loader)
+        # Shield the shared load so one disconnecting caller does not cancel it for everyone.
+        return await asyncio.shield(task)
+
+    async def refresh(self, key: str, loader: Callable[[], Awaitable[T]]) -> T:
+        """Reload ``key`` regardless of freshness, joining a load that is already in flight."""
+        task = self._inflight.get(key)
+        if task is None:
+            self.refreshes += 1
+            task = self._start_load(key, loader)
+        return await asyncio.shield(task)
+
+    def peek(self, key: str) -> Optional[T]:
+        entry = self._entries.get(key)
+        return entry.value if entry is not None else None
+
+    def invalidate(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.stale_hits + self.misses + self.coalesced
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "stale_seconds": self.stale_seconds,
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "refreshes": self.refreshes,
+            "evictions": self.evictions,
+            "errors": self.errors,
+            "inflight": len(self._inflight),
+            "hit_ratio": (self.hits + self.stale_hits + self.coalesced) / lookups if lookups else 0.0,
+        }
+
+    def _start_load(self, key: str, loader: Callable[[], Awaitable[T]]) -> asyncio.Task:
+        task = asyncio.create_task(self._load(key, loader))
+        self._inflight[key] = task
+        return task
+
+    def _refresh_in_background(self, key: str, loader: Callable[[], Awaitable[T]]) -> None:
+        if key in self._inflight:
+            return
+        self.refreshes += 1
+        task = self._start_load(key, loader)
+        # Nobody awaits a background refresh; retrieve its exception so it is not logged as lost.
+        task.add_done_callback(lambda done: done.cancelled() or done.exception())
+
+    async def _load(self, key: str, loader: Callable[[], Awaitable[T]]) -> T:
+        try:
+            value = await loader()
+        except BaseException:
+            self.errors += 1
+            raise
+        finally:
+            self._inflight.pop(key, None)
+        self._store(key, value)
+        return value
+
+    def _store(self, key: str, value: T) -> None:
+        self._entries[key] = _CacheEntry(value=value, stored_at=self._clock())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict, Optional
+
+
+LOGGER = logging.getLogger("feed_refresher")
+
+
+@dataclass
+class _TrackedFeed:
+    feed_url: str
+    requested_at: float
+    interval: float
+    next_refresh_at: float
+    content_hash: Optional[str] = None
+    changed_at: Optional[float] = None
+    refreshes: int = 0
+    changes: int = 0
+    failures: int = 0
+
+
+class FeedRefresher:
+    """
+    Re-fetch recently requested feeds in the background so user requests find warm data.
+
+    Each feed's interval adapts to how often its content actually changes: it halves when a
+    refresh finds new content and grows by half when nothing changed, bounded by
+    ``min_interval``/``max_interval`` and never shorter than the publisher's ``<ttl>`` or cache
+    headers. Feeds nobody has requested for ``idle_seconds`` are dropped.
+    """
+
+    def __init__(
+        self,
+        refresh: Callable[[str], Awaitable[str]],
+        refresh_hint: Callable[[str], Optional[float]] = lambda feed_url: None,
+        min_interval: float = 60.0,
+        max_interval: float = 1800.0,
+        idle_seconds: float = 6 * 3600.0,
+        max_feeds: int = 256,
+        concurrency: int = 4,
+        tick_seconds: float = 5.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._refresh = refresh
+        self._refresh_hint = refresh_hint
+        self.min_interval = max(1.0, min_interval)
+        self.max_interval = max(self.min_interval, max_interval)
+        self.idle_seconds = idle_seconds
+        self.max_feeds = max(1, max_feeds)
+        self.tick_seconds = tick_seconds
+        self._clock = clock
+        self._feeds: "OrderedDict[str, _TrackedFeed]" = OrderedDict()
+        self._semaphore = asyncio.Semaphore(max(1, concurrency))
+        self._running: Dict[str, asyncio.Task] = {}
+        self._task: Optional[asyncio.Task] = None
+
+    def track(self, feed_url: str, content_hash: Optional[str] = None) -> None:
+        """Record a user request for ``feed_url`` (and the content it served)."""
+        now = self._clock()
+        feed = self._feeds.get(feed_url)
+        if feed is None:
+            feed = _TrackedFeed(
+                feed_url=feed_url,
+                requested_at=now,
+                interval=self.min_interval,
+                next_refresh_at=now + self._bounded(self.min_interval, feed_url),
+                content_hash=content_hash,
+                changed_at=now,
+            )
+            self._feeds[feed_url] = feed
+            while len(self._feeds) > self.max_feeds:
+                self._feeds.popitem(last=False)
+        else:
+            feed.requested_at = now
+            if content_hash is not None and content_hash != feed.content_hash:
+                feed.content_hash = content_hash
+                feed.changed_at = now
+        self._feeds.move_to_end(feed_url)
+
+    async def start(self) -> None:
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        tasks = [task for task in (self._task, *self._running.values()) if task is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._task = None
+        self._running.clear()
+
+    def _bounded(self, interval: float, feed_url: str) -> float:
+        interval = min(self.max_interval, max(self.min_interval, interval))
+        hint = self._refresh_hint(feed_url)
+        return max(interval, hint) if hint else interval
+
+    async def _run(self) -> None:
+        while True:
+            now = self._clock()
+            for feed_url, feed in list(self._feeds.items()):
+                if now - feed.requested_at > self.idle_seconds:
+                    del self._feeds[feed_url]
+                    continue
+                if feed.next_refresh_at <= now and feed_url not in self._running:
+                    task = asyncio.create_task(self._refresh_feed(feed))
+                    self._running[feed_url] = task
+                    task.add_done_callback(lambda _, key=feed_url: self._running.pop(key, None))
+            await asyncio.sleep(self.tick_seconds)
+
+    async def _refresh_feed(self, feed: _TrackedFeed) -> None:
+        async with self._semaphore:
+            started = self._clock()
+            try:
+                content_hash = await self._refresh(feed.feed_url)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                feed.failures += 1
+                feed.interval = min(self.max_interval, feed.interval * 2)
+                LOGGER.warning("Background refresh of %s failed: %s", feed.feed_url, exc)
+            else:
+                feed.refreshes += 1
+                feed.failures = 0
+                if content_hash != feed.content_hash:
+                    feed.changes += 1
+                    feed.content_hash = content_hash
+                    feed.changed_at = started
+                    feed.interval = feed.interval / 2
+                else:
+                    feed.interval = feed.interval * 1.5
+            feed.interval = min(self.max_interval, max(self.min_interval, feed.interval))
+            feed.next_refresh_at = self._clock() + self._bounded(feed.interval, feed.feed_url)
+
+    def stats(self) -> Dict[str, object]:
+        now = self._clock()
+        return {
+            "tracked": len(self._feeds),
+            "max_feeds": self.max_feeds,
+            "running": len(self._running),
+            "feeds": [
+                {
+                    "feed": feed.feed_url,
+                    "interval_seconds": round(feed.interval, 1),
+                    "next_refresh_in_seconds": round(max(0.0, feed.next_refresh_at - now), 1),
+                    "refreshes": feed.refreshes,
+                    "changes": feed.changes,
+                    "failures": feed.failures,
+                }
+                for feed in self._feeds.values()
+            ],
+        }
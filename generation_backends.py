@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import logging
+import math
+import os
+import re
+import uuid
+from abc import ABC, abstractmethod
+from array import array
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from google import genai
+    from google.genai import types
+
+
+LOGGER = logging.getLogger("generation_backends")
+
+INTRO_MARKER = "INTRO:"
+OUTRO_MARKER = "OUTRO:"
+SYNTHETIC_SAMPLE_RATE = 24000
+SYNTHETIC_PCM_MIME = f"audio/L16;codec=pcm;rate={SYNTHETIC_SAMPLE_RATE}"
+SYNTHETIC_CHARS_PER_SECOND = float(os.getenv("PODCAST_SYNTHETIC_CHARS_PER_SECOND", "15"))
+SYNTHETIC_TONES = (440, 330, 392, 262)
+SYNTHETIC_AMPLITUDE = 0.32
+# Line durations are rounded to this step, so lines of similar length produce identical audio.
+SYNTHETIC_DURATION_STEP_SECONDS = 0.1
+
+AudioPayload = Tuple[Union[bytes, bytearray], str]
+
+
+@lru_cache(maxsize=1)
+def _load_genai() -> Tuple[Any, Any]:
+    """Import the Gemini SDK on first use: it is slow to import and local backends never need it."""
+    try:
+        from google import genai
+        from google.genai import types
+    except ImportError as exc:
+        raise RuntimeError("google-genai package not available; use the synthetic backend or install it.") from exc
+    return genai, types
+
+
+class GenerationBackend(ABC):
+    """
+    Writes podcast scripts and turns them into speech.
+
+    ``remote`` backends call a paid, rate-limited service: the manager runs them under the
+    generation scheduler and caches their responses. Local backends are called directly.
+    """
+
+    name = "base"
+    remote = False
+
+    @abstractmethod
+    def generate_text(self, prompt: str) -> str:
+        ...
+
+    @abstractmethod
+    def synthesise(self, transcript: str) -> AudioPayload:
+        ...
+
+    def warm_up(self) -> None:
+        """Load whatever the first call would otherwise pay for; optional."""
+
+
+def _extract_audio_bytes(response: types.GenerateContentResponse) -> AudioPayload:
+    candidate = response.candidates[0]
+    if not candidate.content.parts:
+        raise ValueError("No audio parts returned by TTS model.")
+    part = candidate.content.parts[0]
+    inline = getattr(part, "inline_data", None)
+    if inline is None or not inline.data:
+        raise ValueError("TTS response missing inline audio data.")
+    payload = inline.data
+    mime = inline.mime_type or "audio/mpeg"
+    if isinstance(payload, str):
+        try:
+            return base64.b64decode(payload), mime
+        except (ValueError, base64.binascii.Error) as exc:
+            raise ValueError("Unable to decode inline audio payload.") from exc
+    if isinstance(payload, (bytes, bytearray)):
+        return payload, mime
+    raise ValueError("Inline audio payload not in recognised format.")
+
+
+class GeminiBackend(GenerationBackend):
+    name = "gemini"
+    remote = True
+
+    def __init__(
+        self,
+        transcript_model: str,
+        tts_model: str,
+        speakers: Iterable[Tuple[str, str]],
+        client: Optional[genai.Client] = None,
+    ) -> None:
+        self.transcript_model = transcript_model
+        self.tts_model = tts_model
+        self.speakers = tuple(speakers)
+        # Anything with the ``genai.Client`` interface; created from GEMINI_API_KEY when omitted.
+        self._client = client
+
+    def _client_guard(self) -> genai.Client:
+        if self._client is None:
+            genai, _ = _load_genai()
+            api_key = os.getenv("GEMINI_API_KEY")
+            if not api_key:
+                raise RuntimeError("GEMINI_API_KEY environment variable not set")
+            self._client = genai.Client(api_key=api_key)
+        return self._client
+
+    def warm_up(self) -> None:
+        _load_genai()
+        if self._client is None and os.getenv("GEMINI_API_KEY"):
+            self._client_guard()
+
+    def generate_text(self, prompt: str) -> str:
+        client = self._client_guard()
+        response = client.models.generate_content(
+            model=self.transcript_model,
+            contents=prompt,
+        )
+        if not response.text:
+            raise ValueError("Transcript generation returned empty content.")
+        return response.text.strip()
+
+    def synthesise(self, transcript: str) -> AudioPayload:
+        LOGGER.info("Requesting Gemini TTS synthesis for transcript (%d chars)", len(transcript))
+        client = self._client_guard()
+        _, types = _load_genai()
+        speaker_configs = []
+        for speaker_name, voice_name in self.speakers:
+            speaker_configs.append(
+                types.SpeakerVoiceConfig(
+                    speaker=speaker_name,
+                    voice_config=types.VoiceConfig(
+                        prebuilt_voice_config=types.PrebuiltVoiceConfig(voice_name=voice_name)
+                    ),
+                )
+            )
+        response = client.models.generate_content(
+            model=self.tts_model,
+            contents=transcript,
+            config=types.GenerateContentConfig(
+                response_modalities=["AUDIO"],
+                speech_config=types.SpeechConfig(
+                    multi_speaker_voice_config=types.MultiSpeakerVoiceConfig(
+                        speaker_voice_configs=speaker_configs
+                    )
+                ),
+            ),
+        )
+        return _extract_audio_bytes(response)
+
+
+@lru_cache(maxsize=len(SYNTHETIC_TONES))
+def _tone_block(frequency: int) -> bytes:
+    """One second of a sine tone; a whole number of cycles, so copies tile without clicks."""
+    scale = SYNTHETIC_AMPLITUDE * 32767
+    step = 2 * math.pi * frequency / SYNTHETIC_SAMPLE_RATE
+    return array("h", map(int, (scale * math.sin(step * index) for index in range(SYNTHETIC_SAMPLE_RATE)))).tobytes()
+
+
+def _tone_pcm(frames: int, frequency: int) -> bytes:
+    """``frames`` samples of the tone, built by repeating the memoised one-second block."""
+    block = _tone_block(frequency)
+    whole, remainder = divmod(frames, SYNTHETIC_SAMPLE_RATE)
+    return block * whole + block[: remainder * 2]
+
+
+class SyntheticBackend(GenerationBackend):
+    """
+    Offline stand-in for Gemini: scripts are assembled from the prompt and each line of dialogue
+    becomes a tone (one pitch per speaker) lasting as long as the line would take to read aloud.
+    """
+
+    name = "synthetic"
+
+    def __init__(self, speakers: Iterable[Tuple[str, str]], chars_per_second: float = SYNTHETIC_CHARS_PER_SECOND) -> None:
+        self.speaker_names = [name.lower() for name, _ in speakers]
+        self.chars_per_second = max(1.0, chars_per_second)
+
+    def generate_text(self, prompt: str) -> str:
+        if INTRO_MARKER in prompt:
+            feed = re.search(r"^Feed: (.*)$", prompt, re.MULTILINE)
+            headlines = re.findall(r"^\d+\. (.*)$", prompt, re.MULTILINE)
+            return (
+                f"{INTRO_MARKER}\n"
+                f"Liam: Welcome to the {feed.group(1).strip() if feed else 'news'} briefing.\n"
+                f"Anya: Today: {', '.join(headlines) or 'no stories available'}.\n"
+                f"{OUTRO_MARKER}\n"
+                "Liam: That's the news for now.\nAnya: Thanks for listening!"
+            )
+        story = re.search(r"^Story: (.*)$", prompt, re.MULTILINE)
+        summary = re.search(r"^Summary: (.*)$", prompt, re.MULTILINE)
+        title = story.group(1).strip() if story else "Untitled story"
+        description = summary.group(1).strip()[:200] if summary else ""
+        return f"Liam: {title}\nAnya: {description or 'More on that as it develops.'}"
+
+    def _tone_for(self, line: str) -> int:
+        speaker = line.split(":", 1)[0].strip().strip("*").lower() if ":" in line else ""
+        if speaker in self.speaker_names:
+            return SYNTHETIC_TONES[self.speaker_names.index(speaker) % len(SYNTHETIC_TONES)]
+        return SYNTHETIC_TONES[0]
+
+    def synthesise(self, transcript: str) -> AudioPayload:
+        step_frames = int(SYNTHETIC_DURATION_STEP_SECONDS * SYNTHETIC_SAMPLE_RATE)
+        parts = []
+        for line in transcript.splitlines() or [transcript]:
+            steps = max(1, round(len(line.strip()) / self.chars_per_second / SYNTHETIC_DURATION_STEP_SECONDS))
+            parts.append(_tone_pcm(steps * step_frames, self._tone_for(line)))
+        return b"".join(parts), SYNTHETIC_PCM_MIME
+
+
+def _replay_key(kind: str, value: str) -> str:
+    return hashlib.sha256(f"{kind}\0{value}".encode("utf-8")).hexdigest()
+
+
+class ReplayBackend(GenerationBackend):
+    """
+    Serves responses recorded on disk, keyed by a hash of the prompt or transcript.
+
+    With a ``fallback`` backend, misses are generated by it and recorded for the next run;
+    without one, a miss is an error.
+    """
+
+    name = "replay"
+
+    def __init__(self, directory: Path, fallback: Optional[GenerationBackend] = None) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.fallback = fallback
+        self.remote = bool(fallback and fallback.remote)
+
+    def warm_up(self) -> None:
+        if self.fallback is not None:
+            self.fallback.warm_up()
+
+    def _miss(self, kind: str, key: str) -> None:
+        if self.fallback is None:
+            raise LookupError(f"No recorded {kind} response {key[:12]} in {self.directory}")
+        LOGGER.info("Recording %s response %s from %s", kind, key[:12], self.fallback.name)
+
+    def _write(self, path: Path, data: Union[bytes, bytearray]) -> None:
+        # Unique per write: concurrent recordings of the same response must not share a temp file.
+        temp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        try:
+            temp_path.write_bytes(data)
+            os.replace(temp_path, path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+
+    def generate_text(self, prompt: str) -> str:
+        key = _replay_key("text", prompt)
+        path = self.directory / f"{key}.txt"
+        if path.exists():
+            return path.read_text(encoding="utf-8")
+        self._miss("text", key)
+        text = self.fallback.generate_text(prompt)
+        self._write(path, text.encode("utf-8"))
+        return text
+
+    def synthesise(self, transcript: str) -> AudioPayload:
+        key = _replay_key("audio", transcript)
+        path = self.directory / f"{key}.audio"
+        meta_path = self.directory / f"{key}.json"
+        if path.exists() and meta_path.exists():
+            return path.read_bytes(), json.loads(meta_path.read_text(encoding="utf-8"))["mime_type"]
+        self._miss("audio", key)
+        audio_bytes, mime_type = self.fallback.synthesise(transcript)
+        self._write(path, audio_bytes)
+        self._write(meta_path, json.dumps({"mime_type": mime_type}).encode("utf-8"))
+        return audio_bytes, mime_type
+
+
+def create_generation_backend(
+    kind: str,
+    transcript_model: str,
+    tts_model: str,
+    speakers: Iterable[Tuple[str, str]],
+    replay_dir: Optional[Path] = None,
+    record: bool = False,
+) -> GenerationBackend:
+    speakers = tuple(speakers)
+    if kind == "gemini":
+        return GeminiBackend(transcript_model, tts_model, speakers)
+    if kind == "synthetic":
+        return SyntheticBackend(speakers)
+    if kind == "replay":
+        if replay_dir is None:
+            raise ValueError("The replay backend needs a recording directory.")
+        fallback = GeminiBackend(transcript_model, tts_model, speakers) if record else None
+        return ReplayBackend(replay_dir, fallback)
+    raise ValueError(f"Unknown generation backend: {kind!r}")
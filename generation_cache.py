@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS generation_cache (
+    namespace TEXT NOT NULL,
+    cache_key TEXT NOT NULL,
+    value BLOB NOT NULL,
+    meta TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    created_at REAL NOT NULL,
+    last_accessed_at REAL NOT NULL,
+    PRIMARY KEY (namespace, cache_key)
+);
+CREATE INDEX IF NOT EXISTS generation_cache_lru ON generation_cache (namespace, last_accessed_at);
+"""
+
+
+def prompt_cache_key(model: str, prompt: str) -> str:
+    return hashlib.sha256(f"{model}\0{prompt}".encode("utf-8")).hexdigest()
+
+
+def tts_cache_key(model: str, speakers: Iterable[Tuple[str, str]], transcript: str) -> str:
+    payload = {"model": model, "speakers": [list(pair) for pair in speakers], "transcript": transcript}
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+class GenerationCache:
+    """
+    Persistent cache of model responses, keyed by a hash of everything that shaped the output.
+
+    Entries expire after ``ttl_seconds``; once a namespace exceeds ``max_bytes`` the least recently
+    used entries are dropped. Several caches (and worker processes) can share one SQLite file.
+    """
+
+    def __init__(self, path: Path, namespace: str, ttl_seconds: float, max_bytes: int) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), timeout=30.0, check_same_thread=False, isolation_level=None)
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def get(self, key: str) -> Optional[Tuple[bytes, str]]:
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, meta, created_at FROM generation_cache WHERE namespace = ? AND cache_key = ?",
+                (self.namespace, key),
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            value, meta, created_at = row
+            if now - created_at > self.ttl_seconds:
+                self._conn.execute(
+                    "DELETE FROM generation_cache WHERE namespace = ? AND cache_key = ?",
+                    (self.namespace, key),
+                )
+                self.misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE generation_cache SET last_accessed_at = ? WHERE namespace = ? AND cache_key = ?",
+                (now, self.namespace, key),
+            )
+            self.hits += 1
+        return value, meta
+
+    def put(self, key: str, value: Union[bytes, bytearray, memoryview], meta: str = "") -> None:
+        size = len(value)
+        if size > self.max_bytes:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO generation_cache
+                    (namespace, cache_key, value, meta, size, created_at, last_accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (self.namespace, key, value, meta, size, now, now),
+            )
+            self._conn.execute(
+                "DELETE FROM generation_cache WHERE namespace = ? AND created_at < ?",
+                (self.namespace, now - self.ttl_seconds),
+            )
+            self._evict_locked()
+
+    def _evict_locked(self) -> None:
+        (total,) = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM generation_cache WHERE namespace = ?", (self.namespace,)
+        ).fetchone()
+        if total <= self.max_bytes:
+            return
+        rows = self._conn.execute(
+            "SELECT cache_key, size FROM generation_cache WHERE namespace = ? ORDER BY last_accessed_at",
+            (self.namespace,),
+        ).fetchall()
+        doomed = []
+        for cache_key, size in rows:
+            if total <= self.max_bytes:
+                break
+            doomed.append((self.namespace, cache_key))
+            total -= size
+        self._conn.executemany("DELETE FROM generation_cache WHERE namespace = ? AND cache_key = ?", doomed)
+        self.evictions += len(doomed)
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            entries, total = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM generation_cache WHERE namespace = ?",
+                (self.namespace,),
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "entries": entries,
+            "bytes": total,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
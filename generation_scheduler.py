@@ -0,0 +1,269 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+from metrics import observe_stage
+
+
+LOGGER = logging.getLogger("generation_scheduler")
+
+T = TypeVar("T")
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 10
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+RETRYABLE_MARKERS = ("RESOURCE_EXHAUSTED", "UNAVAILABLE", "DEADLINE_EXCEEDED", "rate limit", "Rate limit")
+
+
+def is_retryable_error(exc: BaseException) -> bool:
+    """
+    Classify provider errors worth retrying: rate limits, overload and transient server faults.
+    """
+    for attr in ("code", "status_code"):
+        code = getattr(exc, attr, None)
+        if isinstance(code, int) and code in RETRYABLE_STATUS_CODES:
+            return True
+    if isinstance(exc, (TimeoutError, ConnectionError)):
+        return True
+    message = str(exc)
+    return any(marker in message for marker in RETRYABLE_MARKERS)
+
+
+class TokenBucket:
+    """
+    Asynchronous token bucket: ``rate`` tokens per second with bursts up to ``capacity``.
+    """
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self.rate = max(rate, 1e-9)
+        self.capacity = max(capacity, 1.0)
+        self._clock = clock
+        self._tokens = self.capacity
+        self._updated_at = clock()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    @property
+    def available(self) -> float:
+        self._refill()
+        return self._tokens
+
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """Wait until ``tokens`` are available and take them; returns the time spent waiting."""
+        waited = 0.0
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+                waited += delay
+                await asyncio.sleep(delay)
+
+
+class PrioritySlots:
+    """
+    Concurrency limiter that hands free slots to the highest-priority waiter first.
+
+    Lower numbers win; waiters of equal priority are served in arrival order.
+    """
+
+    def __init__(self, limit: int) -> None:
+        self.limit = max(1, limit)
+        self.active = 0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for _, _, waiter in self._waiters if not waiter.done())
+
+    async def acquire(self, priority: int) -> None:
+        if self.active < self.limit and not self.queued:
+            self.active += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as we were cancelled; pass it on.
+                self.release()
+            raise
+
+    def release(self) -> None:
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self.active = max(0, self.active - 1)
+
+
+@dataclass
+class StageStats:
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    retries: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+    total_run_seconds: float = 0.0
+
+    def record_wait(self, seconds: float) -> None:
+        self.total_wait_seconds += seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+
+
+@dataclass
+class StageConfig:
+    model: str
+    max_concurrency: int
+    requests_per_minute: float
+    burst: float = 1.0
+
+
+@dataclass
+class _Stage:
+    name: str
+    model: str
+    slots: PrioritySlots
+    bucket: TokenBucket
+    stats: StageStats = field(default_factory=StageStats)
+
+
+class GenerationScheduler:
+    """
+    Runs blocking model calls under per-stage concurrency caps and per-model rate limits.
+
+    Each stage (e.g. ``transcript`` or ``tts``) owns a priority-ordered slot pool; stages calling
+    the same model share one token bucket sized to that model's quota. Calls run on a dedicated
+    thread pool so a burst of generations cannot starve the default executor, and retryable
+    failures are retried with exponential backoff plus full jitter.
+    """
+
+    def __init__(
+        self,
+        stages: Dict[str, StageConfig],
+        max_attempts: int = 4,
+        base_backoff_seconds: float = 1.0,
+        max_backoff_seconds: float = 30.0,
+        retryable: Callable[[BaseException], bool] = is_retryable_error,
+    ) -> None:
+        self.max_attempts = max(1, max_attempts)
+        self.base_backoff_seconds = base_backoff_seconds
+        self.max_backoff_seconds = max_backoff_seconds
+        self._retryable = retryable
+        self._buckets: Dict[str, TokenBucket] = {}
+        for config in stages.values():
+            if config.model not in self._buckets:
+                self._buckets[config.model] = TokenBucket(
+                    rate=config.requests_per_minute / 60.0,
+                    capacity=config.burst,
+                )
+        self._stages = {
+            name: _Stage(
+                name=name,
+                model=config.model,
+                slots=PrioritySlots(config.max_concurrency),
+                bucket=self._buckets[config.model],
+            )
+            for name, config in stages.items()
+        }
+        max_workers = sum(config.max_concurrency for config in stages.values())
+        self._executor = ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="generation")
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def backoff_delay(self, attempt: int) -> float:
+        ceiling = min(self.max_backoff_seconds, self.base_backoff_seconds * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    async def run(self, stage_name: str, priority: int, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run ``func(*args)`` in a worker thread once the stage grants a slot and a rate token.
+
+        The provider call is recorded as stage ``<stage>``; slot, rate-limit and backoff waits
+        are recorded separately as ``<stage>_wait``.
+        """
+        stage = self._stages[stage_name]
+        stage.stats.submitted += 1
+        attempt = 0
+        while True:
+            attempt += 1
+            queued_at = time.monotonic()
+            await stage.slots.acquire(priority)
+            try:
+                await stage.bucket.acquire()
+                waited = time.monotonic() - queued_at
+                stage.stats.record_wait(waited)
+                observe_stage(f"{stage_name}_wait", waited)
+                started_at = time.monotonic()
+                try:
+                    loop = asyncio.get_running_loop()
+                    result = await loop.run_in_executor(self._executor, lambda: func(*args))
+                finally:
+                    elapsed = time.monotonic() - started_at
+                    stage.stats.total_run_seconds += elapsed
+                    observe_stage(stage_name, elapsed)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                if attempt >= self.max_attempts or not self._retryable(exc):
+                    stage.stats.failed += 1
+                    raise
+                error: Optional[Exception] = exc
+            else:
+                stage.stats.completed += 1
+                return result
+            finally:
+                stage.slots.release()
+
+            stage.stats.retries += 1
+            delay = self.backoff_delay(attempt)
+            LOGGER.warning(
+                "Retrying %s call after %s (attempt %d/%d, backoff %.2fs)",
+                stage_name,
+                error,
+                attempt,
+                self.max_attempts,
+                delay,
+            )
+            observe_stage(f"{stage_name}_wait", delay)
+            await asyncio.sleep(delay)
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        report: Dict[str, Dict[str, Any]] = {}
+        for name, stage in self._stages.items():
+            stats = stage.stats
+            started = stats.completed + stats.failed + stats.retries
+            report[name] = {
+                "model": stage.model,
+                "max_concurrency": stage.slots.limit,
+                "active": stage.slots.active,
+                "queue_depth": stage.slots.queued,
+                "submitted": stats.submitted,
+                "completed": stats.completed,
+                "failed": stats.failed,
+                "retries": stats.retries,
+                "avg_wait_seconds": stats.total_wait_seconds / started if started else 0.0,
+                "max_wait_seconds": stats.max_wait_seconds,
+                "avg_run_seconds": stats.total_run_seconds / started if started else 0.0,
+                "rate_tokens_available": stage.bucket.available,
+            }
+        return report
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+
+STATUS_RETENTION_SECONDS = 24 * 60 * 60
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS job_leases (
+    cache_key TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS job_statuses (
+    cache_key TEXT PRIMARY KEY,
+    feed_url TEXT NOT NULL,
+    status TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS job_statuses_feed ON job_statuses (feed_url, updated_at);
+"""
+
+
+@dataclass
+class StoredJobStatus:
+    cache_key: str
+    feed_url: str
+    status: Dict[str, Any]
+    updated_at: float
+    owner: Optional[str]
+    lease_expires_at: Optional[float]
+
+    @property
+    def leased(self) -> bool:
+        return self.lease_expires_at is not None and self.lease_expires_at > time.time()
+
+
+class JobStore(ABC):
+    """
+    Shared record of which job is generating an episode and how far it has got.
+
+    ``claim`` is atomic: for a given cache key at most one owner holds an unexpired lease, so
+    jobs that lose the claim follow the owner's progress instead of generating again. An owner
+    identifies a single job, not a worker, and a held lease is never claimed a second time.
+    """
+
+    @abstractmethod
+    def claim(self, cache_key: str, owner: str, lease_seconds: float) -> bool:
+        """Take the lease for ``cache_key`` if nobody holds an unexpired one."""
+
+    @abstractmethod
+    def renew(self, cache_key: str, owner: str, lease_seconds: float) -> bool:
+        ...
+
+    @abstractmethod
+    def release(self, cache_key: str, owner: str, feed_url: str, status: Dict[str, Any]) -> None:
+        """Drop ``owner``'s lease and record the job's final status in one step."""
+
+    @abstractmethod
+    def put_status(self, cache_key: str, feed_url: str, status: Dict[str, Any], updated_at: float) -> None:
+        ...
+
+    @abstractmethod
+    def get_job_status(self, cache_key: str) -> Optional[StoredJobStatus]:
+        ...
+
+    @abstractmethod
+    def get_feed_status(self, feed_url: str) -> Optional[StoredJobStatus]:
+        ...
+
+    def close(self) -> None:
+        pass
+
+
+class MemoryJobStore(JobStore):
+    """Single-process store; claims only coordinate jobs within this worker."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._leases: Dict[str, Tuple[str, float]] = {}
+        self._statuses: Dict[str, Tuple[str, Dict[str, Any], float]] = {}
+
+    def claim(self, cache_key: str, owner: str, lease_seconds: float) -> bool:
+        now = time.time()
+        with self._lock:
+            lease = self._leases.get(cache_key)
+            if lease is not None and lease[1] > now:
+                return False
+            self._leases[cache_key] = (owner, now + lease_seconds)
+            return True
+
+    def renew(self, cache_key: str, owner: str, lease_seconds: float) -> bool:
+        with self._lock:
+            lease = self._leases.get(cache_key)
+            if lease is None or lease[0] != owner:
+                return False
+            self._leases[cache_key] = (owner, time.time() + lease_seconds)
+            return True
+
+    def release(self, cache_key: str, owner: str, feed_url: str, status: Dict[str, Any]) -> None:
+        with self._lock:
+            self._statuses[cache_key] = (feed_url, status, time.time())
+            lease = self._leases.get(cache_key)
+            if lease is not None and lease[0] == owner:
+                del self._leases[cache_key]
+
+    def put_status(self, cache_key: str, feed_url: str, status: Dict[str, Any], updated_at: float) -> None:
+        with self._lock:
+            current = self._statuses.get(cache_key)
+            if current is None or current[2] <= updated_at:
+                self._statuses[cache_key] = (feed_url, status, updated_at)
+
+    def _stored(self, cache_key: str) -> Optional[StoredJobStatus]:
+        entry = self._statuses.get(cache_key)
+        if entry is None:
+            return None
+        lease = self._leases.get(cache_key)
+        return StoredJobStatus(
+            cache_key=cache_key,
+            feed_url=entry[0],
+            status=entry[1],
+            updated_at=entry[2],
+            owner=lease[0] if lease else None,
+            lease_expires_at=lease[1] if lease else None,
+        )
+
+    def get_job_status(self, cache_key: str) -> Optional[StoredJobStatus]:
+        with self._lock:
+            return self._stored(cache_key)
+
+    def get_feed_status(self, feed_url: str) -> Optional[StoredJobStatus]:
+        with self._lock:
+            matches = [key for key, entry in self._statuses.items() if entry[0] == feed_url]
+            if not matches:
+                return None
+            latest = max(matches, key=lambda key: self._statuses[key][2])
+            return self._stored(latest)
+
+
+class SQLiteJobStore(JobStore):
+    """
+    Job store shared by every worker process on one host through a WAL-mode SQLite file.
+    """
+
+    def __init__(self, path: Path, busy_timeout_seconds: float = 30.0) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            str(self.path),
+            timeout=busy_timeout_seconds,
+            check_same_thread=False,
+            isolation_level=None,
+        )
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def claim(self, cache_key: str, owner: str, lease_seconds: float) -> bool:
+        now = time.time()
+        with self._lock:
+            cursor = self._conn.execute(
+                """
+                INSERT INTO job_leases (cache_key, owner, expires_at) VALUES (?, ?, ?)
+                ON CONFLICT (cache_key) DO UPDATE SET owner = excluded.owner, expires_at = excluded.expires_at
+                WHERE job_leases.expires_at <= ?
+                """,
+                (cache_key, owner, now + lease_seconds, now),
+            )
+            return cursor.rowcount > 0
+
+    def renew(self, cache_key: str, owner: str, lease_seconds: float) -> bool:
+        with self._lock:
+            cursor = self._conn.execute(
+                "UPDATE job_leases SET expires_at = ? WHERE cache_key = ? AND owner = ?",
+                (time.time() + lease_seconds, cache_key, owner),
+            )
+            return cursor.rowcount > 0
+
+    def release(self, cache_key: str, owner: str, feed_url: str, status: Dict[str, Any]) -> None:
+        now = time.time()
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO job_statuses (cache_key, feed_url, status, updated_at) VALUES (?, ?, ?, ?)",
+                    (cache_key, feed_url, json.dumps(status), now),
+                )
+                self._conn.execute("DELETE FROM job_leases WHERE cache_key = ? AND owner = ?", (cache_key, owner))
+                self._conn.execute(
+                    "DELETE FROM job_statuses WHERE updated_at < ?",
+                    (now - STATUS_RETENTION_SECONDS,),
+                )
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def put_status(self, cache_key: str, feed_url: str, status: Dict[str, Any], updated_at: float) -> None:
+        with self._lock:
+            # Status writes may land out of order; never let an older snapshot win.
+            self._conn.execute(
+                """
+                INSERT INTO job_statuses (cache_key, feed_url, status, updated_at) VALUES (?, ?, ?, ?)
+                ON CONFLICT (cache_key) DO UPDATE SET
+                    feed_url = excluded.feed_url, status = excluded.status, updated_at = excluded.updated_at
+                WHERE job_statuses.updated_at <= excluded.updated_at
+                """,
+                (cache_key, feed_url, json.dumps(status), updated_at),
+            )
+
+    def _select(self, where: str, value: str) -> Optional[StoredJobStatus]:
+        with self._lock:
+            row = self._conn.execute(
+                f"""
+                SELECT job_statuses.*, job_leases.owner AS owner, job_leases.expires_at AS lease_expires_at
+                FROM job_statuses LEFT JOIN job_leases ON job_leases.cache_key = job_statuses.cache_key
+                WHERE {where}
+                ORDER BY job_statuses.updated_at DESC LIMIT 1
+                """,
+                (value,),
+            ).fetchone()
+        if not row:
+            return None
+        data = dict(row)
+        data["status"] = json.loads(data["status"])
+        return StoredJobStatus(**data)
+
+    def get_job_status(self, cache_key: str) -> Optional[StoredJobStatus]:
+        return self._select("job_statuses.cache_key = ?", cache_key)
+
+    def get_feed_status(self, feed_url: str) -> Optional[StoredJobStatus]:
+        return self._select("job_statuses.feed_url = ?", feed_url)
+
+
+def create_job_store(kind: str, path: Path) -> JobStore:
+    if kind == "memory":
+        return MemoryJobStore()
+    if kind == "sqlite":
+        return SQLiteJobStore(path)
+    raise ValueError(f"Unknown job store backend: {kind!r}")
@@ -0,0 +1,369 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import logging
+import math
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, Callable, Coroutine, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+
+LOGGER = logging.getLogger("metrics")
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+
+M = TypeVar("M", bound="_Metric")
+LabelValues = Tuple[str, ...]
+Sample = Tuple[Dict[str, str], float]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric(ABC):
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {tuple(labels)}")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    @abstractmethod
+    def render(self) -> List[str]:
+        ...
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return self._header() + [
+            f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}" for key, value in values
+        ]
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: count in each bucket (non-cumulative), then the running sum and count.
+        self._series: Dict[LabelValues, Tuple[List[int], List[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = ([0] * (len(self.buckets) + 1), [0.0, 0.0])
+            counts, totals = series
+            for position, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[position] += 1
+                    break
+            else:
+                counts[-1] += 1
+            totals[0] += value
+            totals[1] += 1
+
+    def totals(self) -> Dict[LabelValues, Tuple[int, float]]:
+        """Observation count and sum for each label set."""
+        with self._lock:
+            return {key: (int(totals[1]), totals[0]) for key, (_, totals) in self._series.items()}
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        with self._lock:
+            series = sorted((key, list(counts), list(totals)) for key, (counts, totals) in self._series.items())
+        for key, counts, (total, count) in series:
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, math.inf), counts):
+                cumulative += bucket_count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, key, le)} {cumulative}")
+            labels = _format_labels(self.labelnames, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {_format_value(count)}")
+        return lines
+
+
+class CallbackMetric(_Metric):
+    """
+    Metric whose samples are read at scrape time from state another component already keeps.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        kind: str,
+        collect: Callable[[], Iterable[Sample]],
+        labelnames: Sequence[str] = (),
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.kind = kind
+        self._collect = collect
+
+    def render(self) -> List[str]:
+        lines = self._header()
+        for labels, value in self._collect():
+            key = self._key(labels)
+            lines.append(f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: M) -> M:
+        with self._lock:
+            # Re-registering a name (e.g. a second manager in one process) replaces the old source.
+            self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def callback(
+        self,
+        name: str,
+        documentation: str,
+        kind: str,
+        collect: Callable[[], Iterable[Sample]],
+        labelnames: Sequence[str] = (),
+    ) -> CallbackMetric:
+        return self.register(CallbackMetric(name, documentation, kind, collect, labelnames))
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines: List[str] = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+class ServerTiming:
+    """Per-request stage durations, rendered as a ``Server-Timing`` header."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self._stages: Dict[str, float] = {}
+        self._closed = False
+
+    def record(self, stage: str, seconds: float) -> None:
+        if not self._closed:
+            self._stages[stage] = self._stages.get(stage, 0.0) + seconds
+
+    def header(self) -> str:
+        # Work still running once the response is built (e.g. feeds a timeline page stopped
+        # waiting for) must not keep writing into a finished request.
+        self._closed = True
+        entries = [f"{stage};dur={seconds * 1000:.1f}" for stage, seconds in self._stages.items()]
+        entries.append(f"total;dur={(time.perf_counter() - self.started) * 1000:.1f}")
+        return ", ".join(entries)
+
+
+def process_age() -> Optional[float]:
+    """Seconds since this process started, read from ``/proc``; None where that is unavailable."""
+    try:
+        with open("/proc/self/stat", "rb") as handle:
+            # Fields after the parenthesised command name; starttime is field 22 of the file.
+            fields = handle.read().rsplit(b")", 1)[1].split()
+        started = int(fields[19]) / os.sysconf("SC_CLK_TCK")
+        return time.clock_gettime(time.CLOCK_BOOTTIME) - started
+    except (OSError, ValueError, IndexError, AttributeError):
+        return None
+
+
+class StartupReport:
+    """
+    Cold-start milestones, in seconds since the process started (so interpreter start-up and
+    imports are included), and the duration of each warm-up phase.
+    """
+
+    def __init__(self) -> None:
+        age = process_age()
+        # Without /proc, milestones count from when this module was imported instead.
+        self._origin = time.perf_counter() - (age or 0.0)
+        self.milestones: Dict[str, float] = {}
+        self.phases: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def milestone(self, name: str) -> float:
+        """Record ``name`` the first time it is reached; later calls return the first value."""
+        with self._lock:
+            return self.milestones.setdefault(name, time.perf_counter() - self._origin)
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self.phases[name] = time.perf_counter() - started
+
+    def as_dict(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {"milestones_seconds": dict(self.milestones), "phases_seconds": dict(self.phases)}
+
+    def summary(self) -> str:
+        report = self.as_dict()
+        milestones = " ".join(f"{name}={seconds:.3f}s" for name, seconds in report["milestones_seconds"].items())
+        phases = ", ".join(f"{name}={seconds * 1000:.1f}ms" for name, seconds in report["phases_seconds"].items())
+        return f"{milestones} ({phases})" if phases else milestones
+
+
+class StartupTimingMiddleware:
+    """Records the ``first_response`` milestone; after the first response it only forwards."""
+
+    def __init__(self, app: Any, report: Optional[StartupReport] = None) -> None:
+        self.app = app
+        self.report = report or STARTUP
+
+    async def __call__(self, scope: Dict[str, Any], receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http" or "first_response" in self.report.milestones:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_timed(message: Dict[str, Any]) -> None:
+            await send(message)
+            if message["type"] == "http.response.start" and "first_response" not in self.report.milestones:
+                self.report.milestone("first_response")
+                LOGGER.info("Startup timing: %s", self.report.summary())
+
+        await self.app(scope, receive, send_timed)
+
+
+REGISTRY = MetricsRegistry()
+STARTUP = StartupReport()
+
+STAGE_SECONDS = REGISTRY.histogram(
+    "news_podcast_stage_seconds",
+    "Time spent in each stage of serving feeds and generating podcasts.",
+    ("stage",),
+)
+CACHE_LOOKUPS = REGISTRY.counter(
+    "news_podcast_generation_cache_lookups_total",
+    "Transcript and TTS cache lookups by result.",
+    ("cache", "result"),
+)
+JOB_OUTCOMES = REGISTRY.counter(
+    "news_podcast_audio_jobs_total",
+    "Podcast generation jobs by final status.",
+    ("status",),
+)
+AUDIO_BYTES_WRITTEN = REGISTRY.counter(
+    "news_podcast_audio_bytes_written_total",
+    "Bytes of podcast audio written to disk.",
+)
+
+REGISTRY.callback(
+    "news_podcast_startup_seconds",
+    "Seconds from process start to each start-up milestone (imported, ready, first_response).",
+    "gauge",
+    lambda: [({"milestone": name}, seconds) for name, seconds in STARTUP.as_dict()["milestones_seconds"].items()],
+    ("milestone",),
+)
+
+_request_timing: contextvars.ContextVar[Optional[ServerTiming]] = contextvars.ContextVar(
+    "request_timing", default=None
+)
+
+
+def start_request_timing() -> ServerTiming:
+    """
+    Collect stage timings for the current request and the tasks it awaits. Work that outlives
+    the request is started with ``start_background_task`` so it records nothing here.
+    """
+    timing = ServerTiming()
+    _request_timing.set(timing)
+    return timing
+
+
+def start_background_task(coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+    """Run ``coro`` as a task in a fresh context, detached from the current request's timing."""
+    return asyncio.create_task(coro, context=contextvars.Context())
+
+
+def observe_stage(stage: str, seconds: float) -> None:
+    STAGE_SECONDS.observe(seconds, stage=stage)
+    timing = _request_timing.get()
+    if timing is not None:
+        timing.record(stage, seconds)
+
+
+@contextmanager
+def timed(stage: str) -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe_stage(stage, time.perf_counter() - started)
+
+
+def render_metrics() -> str:
+    return REGISTRY.render()
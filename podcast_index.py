@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS episodes (
+    cache_key TEXT PRIMARY KEY,
+    content_hash TEXT NOT NULL,
+    audio_filename TEXT NOT NULL,
+    mime_type TEXT NOT NULL,
+    transcript TEXT,
+    created_at REAL NOT NULL,
+    last_accessed_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS feeds (
+    feed_url TEXT PRIMARY KEY,
+    cache_key TEXT NOT NULL,
+    channel_title TEXT NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS story_segments (
+    segment_key TEXT PRIMARY KEY,
+    article_hash TEXT NOT NULL,
+    transcript TEXT,
+    audio_filename TEXT NOT NULL,
+    mime_type TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    last_accessed_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS episodes_audio_filename ON episodes (audio_filename);
+CREATE INDEX IF NOT EXISTS story_segments_audio_filename ON story_segments (audio_filename);
+"""
+
+
+def episode_cache_key(
+    content_hash: str,
+    channel_title: str,
+    transcript_model: str,
+    tts_model: str,
+    speakers: Iterable[Tuple[str, str]],
+    backend: str,
+) -> str:
+    """
+    Identify an episode by its article content and everything that shapes the generated audio.
+
+    The channel title is part of the key because the hosts introduce the feed by name.
+    """
+    payload = {
+        "content_hash": content_hash,
+        "channel_title": channel_title,
+        "transcript_model": transcript_model,
+        "tts_model": tts_model,
+        "speakers": [list(pair) for pair in speakers],
+        "backend": backend,
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def story_cache_key(
+    article_hash: str,
+    transcript_model: str,
+    tts_model: str,
+    speakers: Iterable[Tuple[str, str]],
+    backend: str,
+) -> str:
+    """
+    Identify one story's dialogue segment independently of the feed and episode it appears in.
+    """
+    payload = {
+        "article_hash": article_hash,
+        "transcript_model": transcript_model,
+        "tts_model": tts_model,
+        "speakers": [list(pair) for pair in speakers],
+        "backend": backend,
+    }
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=True).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+@dataclass
+class EpisodeRecord:
+    cache_key: str
+    content_hash: str
+    audio_filename: str
+    mime_type: str
+    transcript: Optional[str]
+    created_at: float
+    last_accessed_at: float
+
+
+@dataclass
+class StorySegmentRecord:
+    segment_key: str
+    article_hash: str
+    transcript: Optional[str]
+    audio_filename: str
+    mime_type: str
+    created_at: float
+    last_accessed_at: float
+
+
+@dataclass
+class AudioFileEntry:
+    kind: str
+    key: str
+    audio_filename: str
+    last_accessed_at: float
+
+
+class PodcastIndex:
+    """
+    SQLite-backed index of generated episodes keyed by content hash and generation config.
+
+    Survives restarts so unchanged feeds are served from disk instead of being regenerated.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def get_episode(self, cache_key: str) -> Optional[EpisodeRecord]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM episodes WHERE cache_key = ?", (cache_key,)).fetchone()
+        return EpisodeRecord(**dict(row)) if row else None
+
+    def put_episode(self, record: EpisodeRecord) -> None:
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO episodes
+                    (cache_key, content_hash, audio_filename, mime_type, transcript, created_at, last_accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    record.cache_key,
+                    record.content_hash,
+                    record.audio_filename,
+                    record.mime_type,
+                    record.transcript,
+                    record.created_at,
+                    record.last_accessed_at,
+                ),
+            )
+
+    def delete_episode(self, cache_key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM episodes WHERE cache_key = ?", (cache_key,))
+            self._conn.execute("DELETE FROM feeds WHERE cache_key = ?", (cache_key,))
+
+    def touch_episode(self, cache_key: str, accessed_at: Optional[float] = None) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE episodes SET last_accessed_at = ? WHERE cache_key = ?",
+                (accessed_at or time.time(), cache_key),
+            )
+
+    def get_feed_episode(self, feed_url: str) -> Optional[Tuple[str, EpisodeRecord]]:
+        """Return the channel title and latest episode recorded for ``feed_url``."""
+        with self._lock:
+            row = self._conn.execute(
+                """
+                SELECT feeds.channel_title AS channel_title, episodes.*
+                FROM feeds JOIN episodes ON episodes.cache_key = feeds.cache_key
+                WHERE feeds.feed_url = ?
+                """,
+                (feed_url,),
+            ).fetchone()
+        if not row:
+            return None
+        data = dict(row)
+        channel_title = data.pop("channel_title")
+        return channel_title, EpisodeRecord(**data)
+
+    def recent_feeds(self, limit: int) -> List[str]:
+        """Feeds whose episodes were recorded most recently, newest first."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT feed_url FROM feeds ORDER BY updated_at DESC LIMIT ?", (limit,)
+            ).fetchall()
+        return [row["feed_url"] for row in rows]
+
+    def set_feed_episode(self, feed_url: str, cache_key: str, channel_title: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO feeds (feed_url, cache_key, channel_title, updated_at) VALUES (?, ?, ?, ?)",
+                (feed_url, cache_key, channel_title, time.time()),
+            )
+
+    def get_story_segments(self, segment_keys: List[str]) -> Dict[str, StorySegmentRecord]:
+        if not segment_keys:
+            return {}
+        placeholders = ", ".join("?" for _ in segment_keys)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT * FROM story_segments WHERE segment_key IN ({placeholders})",
+                list(segment_keys),
+            ).fetchall()
+        return {row["segment_key"]: StorySegmentRecord(**dict(row)) for row in rows}
+
+    def put_story_segment(self, record: StorySegmentRecord) -> None:
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT OR REPLACE INTO story_segments
+                    (segment_key, article_hash, transcript, audio_filename, mime_type, created_at, last_accessed_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    record.segment_key,
+                    record.article_hash,
+                    record.transcript,
+                    record.audio_filename,
+                    record.mime_type,
+                    record.created_at,
+                    record.last_accessed_at,
+                ),
+            )
+
+    def touch_story_segments(self, segment_keys: List[str], accessed_at: Optional[float] = None) -> None:
+        accessed_at = accessed_at or time.time()
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE story_segments SET last_accessed_at = ? WHERE segment_key = ?",
+                [(accessed_at, key) for key in segment_keys],
+            )
+
+    def touch_audio_file(self, audio_filename: str, accessed_at: Optional[float] = None) -> None:
+        """Mark whichever episode or story segment owns ``audio_filename`` as just accessed."""
+        accessed_at = accessed_at or time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE episodes SET last_accessed_at = ? WHERE audio_filename = ?", (accessed_at, audio_filename)
+            )
+            self._conn.execute(
+                "UPDATE story_segments SET last_accessed_at = ? WHERE audio_filename = ?",
+                (accessed_at, audio_filename),
+            )
+
+    def delete_story_segment(self, segment_key: str) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM story_segments WHERE segment_key = ?", (segment_key,))
+
+    def list_audio_files(self) -> List[AudioFileEntry]:
+        """Every audio file the index references, for storage accounting and eviction."""
+        with self._lock:
+            rows = self._conn.execute(
+                """
+                SELECT 'episode' AS kind, cache_key AS key, audio_filename, last_accessed_at FROM episodes
+                UNION ALL
+                SELECT 'story' AS kind, segment_key AS key, audio_filename, last_accessed_at FROM story_segments
+                """
+            ).fetchall()
+        return [AudioFileEntry(**dict(row)) for row in rows]
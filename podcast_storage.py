@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import sys
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from audio_codec import DerivedAudioCache
+from podcast_index import PodcastIndex
+
+
+LOGGER = logging.getLogger("podcast_storage")
+
+TEMP_SUFFIX = ".tmp"
+
+
+@dataclass
+class StorageReport:
+    total_bytes: int = 0
+    files: int = 0
+    episode_bytes: int = 0
+    story_bytes: int = 0
+    orphan_bytes: int = 0
+    derived_bytes: int = 0
+    quota_bytes: int = 0
+    swept_at: Optional[float] = None
+    sweep_seconds: float = 0.0
+    orphans_removed: int = 0
+    entries_evicted: int = 0
+    bytes_reclaimed: int = 0
+
+
+class PodcastStorage:
+    """
+    Keeps ``static/podcasts`` under a byte quota.
+
+    A sweep deletes files the index no longer references (once they are older than a grace
+    period, so in-progress writes and segment files survive), then evicts the least recently
+    accessed episodes and story segments until the directory fits the quota.
+
+    WAV renditions in ``derived`` count against the same quota; they can be decoded again, so
+    they are trimmed before any episode is evicted.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        index: Optional[PodcastIndex],
+        quota_bytes: int,
+        orphan_grace_seconds: float = 3600.0,
+        sweep_interval_seconds: float = 600.0,
+        derived: Optional[DerivedAudioCache] = None,
+    ) -> None:
+        self.directory = Path(directory)
+        self.index = index
+        self.quota_bytes = max(0, quota_bytes)
+        self.orphan_grace_seconds = orphan_grace_seconds
+        self.sweep_interval_seconds = sweep_interval_seconds
+        self.derived = derived
+        self._report = StorageReport(quota_bytes=self.quota_bytes)
+        self._task: Optional[asyncio.Task] = None
+        self._sweep_lock = asyncio.Lock()
+
+    def start(self) -> None:
+        """Schedule periodic sweeps; the task is kept here so ``close`` can cancel and await it."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def close(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.sweep()
+            except Exception:
+                LOGGER.exception("Podcast storage sweep failed")
+            await asyncio.sleep(self.sweep_interval_seconds)
+
+    async def sweep(self) -> StorageReport:
+        async with self._sweep_lock:
+            return await asyncio.to_thread(self._sweep)
+
+    def report(self) -> Dict[str, object]:
+        return asdict(self._report)
+
+    def _candidate_files(self) -> Dict[str, Path]:
+        files: Dict[str, Path] = {}
+        for path in self.directory.iterdir():
+            if path.name.startswith(".") and not path.name.endswith(TEMP_SUFFIX):
+                continue
+            if path.is_file():
+                files[path.name] = path
+        return files
+
+    @staticmethod
+    def _owned_by(filename: str, stems: Set[str]) -> Optional[str]:
+        # Intro/outro and partial files share their episode's stem: ``podcast_<key>_intro.wav``.
+        stem = filename.rsplit(".", 1)[0]
+        while stem:
+            if stem in stems:
+                return stem
+            if "_" not in stem:
+                return None
+            stem = stem.rsplit("_", 1)[0]
+        return None
+
+    def _sweep(self) -> StorageReport:
+        started = time.monotonic()
+        now = time.time()
+        report = StorageReport(quota_bytes=self.quota_bytes, swept_at=now)
+        files = self._candidate_files()
+        sizes: Dict[str, int] = {}
+        mtimes: Dict[str, float] = {}
+        for name, path in files.items():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            sizes[name] = stat.st_size
+            mtimes[name] = stat.st_mtime
+
+        if self.index is None:
+            report.derived_bytes = self._trim_derived(sum(sizes.values()))
+            report.total_bytes = sum(sizes.values())
+            report.files = len(sizes)
+            report.sweep_seconds = time.monotonic() - started
+            self._report = report
+            return report
+
+        entries = self.index.list_audio_files()
+        episode_stems = {
+            entry.audio_filename.rsplit(".", 1)[0]: entry for entry in entries if entry.kind == "episode"
+        }
+        story_files = {entry.audio_filename: entry for entry in entries if entry.kind == "story"}
+
+        stems = set(episode_stems)
+        owned: Dict[str, List[str]] = {}
+        for name in list(sizes):
+            if name in story_files:
+                owned.setdefault(f"story:{name}", []).append(name)
+                continue
+            stem = None if name.endswith(TEMP_SUFFIX) else self._owned_by(name, stems)
+            if stem is not None:
+                owned.setdefault(f"episode:{stem}", []).append(name)
+                continue
+            if now - mtimes[name] < self.orphan_grace_seconds:
+                owned.setdefault("recent", []).append(name)
+                continue
+            if self._remove(files[name]):
+                report.orphans_removed += 1
+                report.bytes_reclaimed += sizes.pop(name)
+
+        total = sum(sizes.values())
+        report.derived_bytes = self._trim_derived(total)
+        if self.quota_bytes and total + report.derived_bytes > self.quota_bytes:
+            # Least recently accessed first; anything touched within the grace period is kept.
+            for entry in sorted(entries, key=lambda item: item.last_accessed_at):
+                if total + report.derived_bytes <= self.quota_bytes:
+                    break
+                if now - entry.last_accessed_at < self.orphan_grace_seconds:
+                    break
+                if entry.kind == "episode":
+                    names = owned.get(f"episode:{entry.audio_filename.rsplit('.', 1)[0]}", [])
+                    self.index.delete_episode(entry.key)
+                else:
+                    names = owned.get(f"story:{entry.audio_filename}", [])
+                    self.index.delete_story_segment(entry.key)
+                report.entries_evicted += 1
+                for name in names:
+                    if name in sizes and self._remove(files[name]):
+                        size = sizes.pop(name)
+                        total -= size
+                        report.bytes_reclaimed += size
+
+        for key, names in owned.items():
+            size = sum(sizes.get(name, 0) for name in names)
+            if key.startswith("episode:"):
+                report.episode_bytes += size
+            elif key.startswith("story:"):
+                report.story_bytes += size
+            else:
+                report.orphan_bytes += size
+        report.total_bytes = sum(sizes.values())
+        report.files = len(sizes)
+        report.sweep_seconds = time.monotonic() - started
+        if report.orphans_removed or report.entries_evicted:
+            LOGGER.info(
+                "Podcast storage sweep removed %d orphans and evicted %d entries (%d bytes reclaimed)",
+                report.orphans_removed,
+                report.entries_evicted,
+                report.bytes_reclaimed,
+            )
+        self._report = report
+        return report
+
+    def _trim_derived(self, stored_bytes: int) -> int:
+        """Trim derived renditions to whatever the quota leaves after ``stored_bytes``; returns their size."""
+        if self.derived is None:
+            return 0
+        if not self.quota_bytes:
+            return self.derived.trim(sys.maxsize)
+        return self.derived.trim(max(0, self.quota_bytes - stored_bytes))
+
+    @staticmethod
+    def _remove(path: Path) -> bool:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            return False
+        except OSError as exc:
+            LOGGER.warning("Unable to remove %s: %s", path, exc)
+            return False
+        return True
@@ -1,176 +1,580 @@
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import logging
+import os
 import re
-from datetime import datetime, timezone
-from html import unescape
-from typing import Any, Dict, List, Optional, Tuple
-from xml.etree import ElementTree as ET
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, FrozenSet, List, Optional, Set, Tuple
 
 import httpx
+import orjson
 from fastapi import FastAPI, HTTPException, Query
-from fastapi.responses import HTMLResponse
+from fastapi.responses import FileResponse, HTMLResponse, ORJSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
+from pydantic import BaseModel, Field
 from starlette.requests import Request
 
 from audio_podcast_backend import (
+    articles_digest,
     ensure_audio_for_feed,
     get_all_audio_statuses,
+    get_audio_stats,
     get_audio_status,
+    resolve_audio_file,
+    start_audio_maintenance,
+    stop_audio_maintenance,
+    subscribe_audio_events,
+    unsubscribe_audio_events,
+    warm_up_audio,
 )
+from compression import CompressionMiddleware, strip_encoding_suffix
+from feed_cache import FeedCache, normalise_feed_url
+from feed_parser import FeedParseError, StreamingFeedParser
+from feed_refresher import FeedRefresher
+from generation_scheduler import PRIORITY_BACKGROUND
+from metrics import (
+    CONTENT_TYPE as METRICS_CONTENT_TYPE,
+    REGISTRY,
+    STARTUP,
+    StartupTimingMiddleware,
+    observe_stage,
+    render_metrics,
+    start_request_timing,
+    timed,
+)
+from timeline import TimelineEntry, index_items, merge_timeline
+
 
+LOGGER = logging.getLogger("rss_viewer")
 
 USER_AGENT = (
     "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
     "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 )
 REQUEST_TIMEOUT_SECONDS = 10
-NAMESPACES = {
-    "media": "https://search.yahoo.com/mrss/",
-    "dc": "https://purl.org/dc/elements/1.1/",
-    "content": "http://purl.org/rss/1.0/modules/content/",
-}
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+HTTP_KEEPALIVE_EXPIRY_SECONDS = 30.0
+MAX_CONDITIONAL_FEEDS = 512
+FEED_CACHE_TTL_SECONDS = float(os.getenv("FEED_CACHE_TTL_SECONDS", "60"))
+FEED_CACHE_STALE_SECONDS = float(os.getenv("FEED_CACHE_STALE_SECONDS", "300"))
+FEED_CACHE_MAX_ENTRIES = int(os.getenv("FEED_CACHE_MAX_ENTRIES", "256"))
+FEED_MAX_ITEMS = int(os.getenv("FEED_MAX_ITEMS", "200"))
+FEED_MAX_BYTES = int(os.getenv("FEED_MAX_BYTES", str(5 * 1024 * 1024)))
+BATCH_MAX_FEEDS = int(os.getenv("BATCH_MAX_FEEDS", "50"))
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", "8"))
+BATCH_FEED_TIMEOUT_SECONDS = float(os.getenv("BATCH_FEED_TIMEOUT_SECONDS", "15"))
+FEED_REFRESH_MIN_SECONDS = float(os.getenv("FEED_REFRESH_MIN_SECONDS", "60"))
+FEED_REFRESH_MAX_SECONDS = float(os.getenv("FEED_REFRESH_MAX_SECONDS", "1800"))
+FEED_REFRESH_IDLE_SECONDS = float(os.getenv("FEED_REFRESH_IDLE_SECONDS", str(6 * 3600)))
+FEED_REFRESH_MAX_FEEDS = int(os.getenv("FEED_REFRESH_MAX_FEEDS", "256"))
+FEED_REFRESH_CONCURRENCY = int(os.getenv("FEED_REFRESH_CONCURRENCY", "4"))
+FEED_PREGENERATE_AUDIO = os.getenv("FEED_PREGENERATE_AUDIO", "1").strip().lower() in {"1", "true", "yes", "on"}
+AUDIO_EVENTS_HEARTBEAT_SECONDS = float(os.getenv("AUDIO_EVENTS_HEARTBEAT_SECONDS", "15"))
+AUDIO_EVENTS_RETRY_MILLISECONDS = 3000
+COMPRESSION_MIN_BYTES = int(os.getenv("COMPRESSION_MIN_BYTES", "512"))
+TIMELINE_PAGE_SIZE = int(os.getenv("TIMELINE_PAGE_SIZE", "50"))
+TIMELINE_MAX_PAGE_SIZE = 200
+# The first page waits this long for feeds that are not cached; slower ones are listed as pending.
+TIMELINE_FIRST_PAGE_WAIT_SECONDS = float(os.getenv("TIMELINE_FIRST_PAGE_WAIT_SECONDS", "1.0"))
+AUDIO_FILE_RE = re.compile(r"^[A-Za-z0-9_-]+\.(?:wav|mp3)$")
+# Audio file names are derived from content hashes, so a URL never changes what it serves.
+AUDIO_CACHE_CONTROL = "public, max-age=31536000, immutable"
+STARTUP_WARMUP = os.getenv("STARTUP_WARMUP", "").strip().lower() in {"1", "true", "yes", "on"}
+STARTUP_WARMUP_FEEDS = int(os.getenv("STARTUP_WARMUP_FEEDS", "8"))
+STARTUP_WARMUP_TIMEOUT_SECONDS = float(os.getenv("STARTUP_WARMUP_TIMEOUT_SECONDS", "10"))
+# Fields of the embedded audio job that ``omit`` can drop; anything else names an item field.
+AUDIO_FIELDS = frozenset({"transcript", "segments", "audio"})
+# Drops a feed's whole item list, for batch clients that only need its title and audio job.
+ITEM_LIST_FIELD = "items"
+
+
+@dataclass
+class ParsedFeed:
+    title: str
+    items: List[Dict[str, Any]]
+    content_hash: str
+    # Hash of everything served for the feed, not just the fields the audio digest covers.
+    revision: str = ""
+    # Items newest first with their dedupe keys, for merging into /api/timeline.
+    timeline: List[TimelineEntry] = field(default_factory=list)
+
+
+class BatchArticlesRequest(BaseModel):
+    feeds: List[str] = Field(..., min_length=1, max_length=BATCH_MAX_FEEDS, description="RSS feed URLs to fetch.")
+    omit: List[str] = Field(default_factory=list, description="Fields to leave out, as for GET /api/articles.")
+
+
+@dataclass
+class _ConditionalFeedState:
+    etag: Optional[str]
+    last_modified: Optional[str]
+    channel_title: str
+    articles: List[Dict[str, Any]]
+
+
+_MAX_AGE_RE = re.compile(r"(?:^|,)\s*(?:s-)?max-age\s*=\s*\"?(\d+)", re.IGNORECASE)
+
+
+def _cache_lifetime(headers: httpx.Headers) -> Optional[float]:
+    """Seconds the response may be cached according to Cache-Control or Expires, if stated."""
+    cache_control = headers.get("Cache-Control", "").lower()
+    if "no-cache" in cache_control or "no-store" in cache_control:
+        return 0.0
+    ages = [int(value) for value in _MAX_AGE_RE.findall(cache_control)]
+    if ages:
+        return float(max(ages))
+    expires = headers.get("Expires")
+    if not expires:
+        return None
+    try:
+        expires_at = parsedate_to_datetime(expires).timestamp()
+        date_header = headers.get("Date")
+        now = parsedate_to_datetime(date_header).timestamp() if date_header else time.time()
+    except (TypeError, ValueError):
+        return 0.0
+    return max(0.0, expires_at - now)
 
 
-app = FastAPI(title="News Feed Viewer", description="Blend multiple RSS feeds into a single, polished stream.", version="1.1.0")
+class FeedFetcher:
+    """
+    Fetch feeds over one pooled HTTP/2 client and revalidate them with conditional GETs.
 
-templates = Jinja2Templates(directory="templates")
-app.mount("/static", StaticFiles(directory="static"), name="static")
+    Bodies are streamed straight into an incremental parser, so large archives are never
+    buffered whole and the download stops once the item or byte cap is reached.
+    """
 
+    def __init__(
+        self,
+        timeout: float = REQUEST_TIMEOUT_SECONDS,
+        max_conditional_feeds: int = MAX_CONDITIONAL_FEEDS,
+        max_items: int = FEED_MAX_ITEMS,
+        max_bytes: int = FEED_MAX_BYTES,
+    ) -> None:
+        self.timeout = timeout
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.max_conditional_feeds = max_conditional_feeds
+        self._client: Optional[httpx.AsyncClient] = None
+        self._conditional: "OrderedDict[str, _ConditionalFeedState]" = OrderedDict()
+        self._refresh_hints: "OrderedDict[str, float]" = OrderedDict()
+
+    async def start(self) -> None:
+        self._client_guard()
+
+    async def close(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
+    def _client_guard(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                timeout=self.timeout,
+                follow_redirects=True,
+                headers={"User-Agent": USER_AGENT},
+                limits=httpx.Limits(
+                    max_connections=HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SECONDS,
+                ),
+            )
+        return self._client
+
+    def _conditional_headers(self, feed_url: str) -> Dict[str, str]:
+        state = self._conditional.get(feed_url)
+        if state is None:
+            return {}
+        headers: Dict[str, str] = {}
+        if state.etag:
+            headers["If-None-Match"] = state.etag
+        if state.last_modified:
+            headers["If-Modified-Since"] = state.last_modified
+        return headers
+
+    def _remember(self, feed_url: str, response: httpx.Response, channel_title: str, articles: List[Dict[str, Any]]) -> None:
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            self._conditional.pop(feed_url, None)
+            return
+        self._conditional[feed_url] = _ConditionalFeedState(
+            etag=etag,
+            last_modified=last_modified,
+            channel_title=channel_title,
+            articles=articles,
+        )
+        self._conditional.move_to_end(feed_url)
+        while len(self._conditional) > self.max_conditional_feeds:
+            self._conditional.popitem(last=False)
+
+    def refresh_hint(self, feed_url: str) -> Optional[float]:
+        """Minimum refresh interval the publisher asked for via ``<ttl>`` or cache headers."""
+        return self._refresh_hints.get(feed_url)
+
+    def _remember_hint(self, feed_url: str, *lifetimes: Optional[float]) -> None:
+        known = [lifetime for lifetime in lifetimes if lifetime is not None]
+        if not known:
+            return
+        self._refresh_hints[feed_url] = max(known)
+        self._refresh_hints.move_to_end(feed_url)
+        while len(self._refresh_hints) > self.max_conditional_feeds:
+            self._refresh_hints.popitem(last=False)
+
+    async def fetch(self, feed_url: str) -> Tuple[str, List[Dict[str, Any]]]:
+        client = self._client_guard()
+        parser = StreamingFeedParser(max_items=self.max_items, max_bytes=self.max_bytes)
+        started = time.perf_counter()
+        try:
+            return await self._fetch(client, feed_url, parser)
+        finally:
+            # Parsing is interleaved with the download; report the two separately.
+            observe_stage("feed_fetch", time.perf_counter() - started - parser.parse_seconds)
+            observe_stage("feed_parse", parser.parse_seconds)
+
+    async def _fetch(
+        self, client: httpx.AsyncClient, feed_url: str, parser: StreamingFeedParser
+    ) -> Tuple[str, List[Dict[str, Any]]]:
+        try:
+            async with client.stream("GET", feed_url, headers=self._conditional_headers(feed_url)) as response:
+                if response.status_code == 304:
+                    self._remember_hint(feed_url, _cache_lifetime(response.headers))
+                    state = self._conditional.get(feed_url)
+                    if state is not None:
+                        self._conditional.move_to_end(feed_url)
+                        return state.channel_title, [dict(article) for article in state.articles]
+                    # The validators were evicted between request and response; fetch unconditionally.
+                    self._conditional.pop(feed_url, None)
+                    return await self._fetch(client, feed_url, parser)
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes():
+                    parser.feed(chunk)
+                    if parser.done:
+                        break
+        except httpx.HTTPError as exc:
+            raise HTTPException(status_code=502, detail=f"Unable to fetch feed: {exc}") from exc
+        except FeedParseError as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
 
-def _strip_html(value: Optional[str]) -> str:
+        try:
+            parser.close()
+        except FeedParseError as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
+
+        channel_title = parser.channel_title or feed_url
+        articles = parser.items
+        self._remember(feed_url, response, channel_title, [dict(article) for article in articles])
+        self._remember_hint(feed_url, _cache_lifetime(response.headers), parser.ttl_seconds)
+        return channel_title, articles
+
+
+feed_fetcher = FeedFetcher()
+feed_cache: FeedCache[ParsedFeed] = FeedCache(
+    ttl_seconds=FEED_CACHE_TTL_SECONDS,
+    stale_seconds=FEED_CACHE_STALE_SECONDS,
+    max_entries=FEED_CACHE_MAX_ENTRIES,
+)
+# Shared across batch requests so concurrent batches cannot multiply upstream fan-out.
+batch_semaphore = asyncio.Semaphore(BATCH_CONCURRENCY)
+# Feed loads a timeline page stopped waiting for; they finish in the background to fill the cache.
+_timeline_fills: Set[asyncio.Task] = set()
+
+
+async def warm_up() -> None:
     """
-    Remove HTML tags from the feed snippet while preserving basic punctuation.
+    Do the work the first requests would otherwise wait for: build the audio manager, load the
+    generation backend, restore recent episodes and fetch their feeds, which also opens pooled
+    connections to the feed hosts and fills the feed cache.
     """
-    if not value:
-        return ""
+    feeds = await warm_up_audio(STARTUP_WARMUP_FEEDS)
+    if not feeds:
+        return
+    with STARTUP.phase("feeds"):
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(get_parsed_feed(feed_url) for feed_url in feeds), return_exceptions=True),
+                timeout=STARTUP_WARMUP_TIMEOUT_SECONDS,
+            )
+        except asyncio.TimeoutError:
+            LOGGER.warning("Feed warm-up did not finish within %.0fs", STARTUP_WARMUP_TIMEOUT_SECONDS)
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    await feed_fetcher.start()
+    await start_audio_maintenance()
+    if STARTUP_WARMUP:
+        await warm_up()
+    await feed_refresher.start()
+    STARTUP.milestone("ready")
+    LOGGER.info("Startup timing: %s", STARTUP.summary())
+    try:
+        yield
+    finally:
+        await feed_refresher.close()
+        await stop_audio_maintenance()
+        await feed_fetcher.close()
+
+
+app = FastAPI(
+    title="News Feed Viewer",
+    description="Blend multiple RSS feeds into a single, polished stream.",
+    version="1.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+app.add_middleware(CompressionMiddleware, minimum_size=COMPRESSION_MIN_BYTES)
+app.add_middleware(StartupTimingMiddleware)
+
+templates = Jinja2Templates(directory="templates")
+app.mount("/static", StaticFiles(directory="static"), name="static")
+
+
+async def fetch_articles(feed_url: str) -> Tuple[str, List[Dict[str, Any]]]:
+    return await feed_fetcher.fetch(feed_url)
+
+
+def _feed_loader(cache_key: str) -> Callable[[], Awaitable[ParsedFeed]]:
+    async def load() -> ParsedFeed:
+        title, items = await fetch_articles(cache_key)
+        with timed("digest"):
+            content_hash = articles_digest(items)
+            revision = hashlib.sha256(orjson.dumps([title, items])).hexdigest()
+        with timed("timeline_index"):
+            timeline = index_items(cache_key, items)
+        return ParsedFeed(
+            title=title, items=items, content_hash=content_hash, revision=revision, timeline=timeline
+        )
 
-    # Remove HTML tags and normalise whitespace.
-    text = re.sub(r"<[^>]+>", "", value)
-    text = re.sub(r"\s+", " ", text)
-    return unescape(text).strip()
+    return load
 
 
-def _parse_datetime(date_text: Optional[str]) -> Optional[str]:
-    if not date_text:
+async def get_parsed_feed(feed_url: str) -> ParsedFeed:
+    cache_key = normalise_feed_url(feed_url)
+    return await feed_cache.get(cache_key, _feed_loader(cache_key))
+
+
+async def refresh_feed_in_background(feed_url: str) -> str:
+    """Re-fetch a tracked feed into the cache and pre-generate its podcast at low priority."""
+    cache_key = normalise_feed_url(feed_url)
+    feed_data = await feed_cache.refresh(cache_key, _feed_loader(cache_key))
+    if FEED_PREGENERATE_AUDIO:
+        await ensure_audio_for_feed(
+            feed_url,
+            feed_data.title,
+            feed_data.items,
+            content_hash=feed_data.content_hash,
+            priority=PRIORITY_BACKGROUND,
+        )
+    return feed_data.content_hash
+
+
+REGISTRY.callback(
+    "news_podcast_feed_cache_lookups_total",
+    "Feed cache lookups by result.",
+    "counter",
+    lambda: [
+        ({"result": "hit"}, feed_cache.hits),
+        ({"result": "stale"}, feed_cache.stale_hits),
+        ({"result": "miss"}, feed_cache.misses),
+        ({"result": "coalesced"}, feed_cache.coalesced),
+    ],
+    ("result",),
+)
+
+
+feed_refresher = FeedRefresher(
+    refresh=refresh_feed_in_background,
+    refresh_hint=lambda feed_url: feed_fetcher.refresh_hint(normalise_feed_url(feed_url)),
+    min_interval=FEED_REFRESH_MIN_SECONDS,
+    max_interval=FEED_REFRESH_MAX_SECONDS,
+    idle_seconds=FEED_REFRESH_IDLE_SECONDS,
+    max_feeds=FEED_REFRESH_MAX_FEEDS,
+    concurrency=FEED_REFRESH_CONCURRENCY,
+)
+
+
+def _validate_feed_url(feed: str) -> str:
+    feed_url = feed.strip()
+    if not feed_url:
+        raise HTTPException(status_code=400, detail="Feed must be provided.")
+    if not feed_url.lower().startswith(("http://", "https://")):
+        raise HTTPException(status_code=400, detail="Feed must be a valid HTTP or HTTPS URL.")
+    return feed_url
+
+
+def _parse_omit(values: Optional[List[str]]) -> FrozenSet[str]:
+    return frozenset(name.strip() for value in values or [] for name in value.split(",") if name.strip())
+
+
+def _strong_etag(*parts: Any) -> str:
+    return '"%s"' % hashlib.sha256(orjson.dumps(parts)).hexdigest()[:32]
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    candidates = {strip_encoding_suffix(value.strip().removeprefix("W/")) for value in header.split(",")}
+    return "*" in candidates or etag in candidates
+
+
+def _conditional_response(request: Request, etag: str, build: Callable[[], Any]) -> Response:
+    """Answer 304 when the client already holds ``etag``; otherwise serialise ``build()``."""
+    # no-cache: browsers keep the body but revalidate it with If-None-Match on every request.
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse(build(), headers=headers)
+
+
+def _audio_fields(audio_job: Dict[str, Any], omit: FrozenSet[str]) -> Optional[Dict[str, Any]]:
+    if "audio" in omit:
         return None
+    return {key: value for key, value in audio_job.items() if key not in omit}
+
+
+def _item_fields(items: List[Dict[str, Any]], omit: FrozenSet[str]) -> List[Dict[str, Any]]:
+    item_omit = omit - AUDIO_FIELDS - {ITEM_LIST_FIELD}
+    if not item_omit:
+        return items
+    return [{key: value for key, value in item.items() if key not in item_omit} for item in items]
+
+
+async def _load_articles(feed_url: str, omit: FrozenSet[str]) -> Tuple[ParsedFeed, Dict[str, Any]]:
+    feed_data = await get_parsed_feed(feed_url)
+    feed_refresher.track(feed_url, feed_data.content_hash)
+    with timed("audio"):
+        audio_job = await ensure_audio_for_feed(
+            feed_url,
+            feed_data.title,
+            feed_data.items,
+            content_hash=feed_data.content_hash,
+            include_transcript="transcript" not in omit and "audio" not in omit,
+        )
+    return feed_data, audio_job
 
-    for fmt in (
-        "%a, %d %b %Y %H:%M:%S %z",
-        "%Y-%m-%dT%H:%M:%SZ",
-        "%Y-%m-%d %H:%M:%S",
-    ):
-        try:
-            parsed = datetime.strptime(date_text, fmt)
-            if parsed.tzinfo is None:
-                parsed = parsed.replace(tzinfo=timezone.utc)
-            return parsed.astimezone(timezone.utc).isoformat()
-        except ValueError:
-            continue
-    return None
-
-
-def _extract_image(item: ET.Element) -> Optional[str]:
-    import re
-    
-    # Try media namespace sources first - check all media: elements
-    for media_elem in item.findall(".//media:*", NAMESPACES):
-        if media_elem.attrib.get("url"):
-            url = media_elem.attrib["url"]
-            media_type = media_elem.attrib.get("type", "")
-            # Accept any media content, prioritize images
-            if media_type.startswith("image") or "jpg" in url or "png" in url or "jpeg" in url or not media_type:
-                return url
-
-    # Look for images in description content
-    description = item.findtext("description", default="")
-    if description:
-        img_matches = re.findall(r'<img[^>]+src=["\']([^"\']+)["\']', description, re.IGNORECASE)
-        for img_url in img_matches:
-            return img_url
-
-    # Check for content:encoded which often contains full HTML
-    content_encoded = item.find("content:encoded", NAMESPACES)
-    if content_encoded is not None and content_encoded.text:
-        img_matches = re.findall(r'<img[^>]+src=["\']([^"\']+)["\']', content_encoded.text, re.IGNORECASE)
-        for img_url in img_matches:
-            return img_url
-
-    # Check all enclosure tags
-    for enclosure in item.findall("enclosure"):
-        url = enclosure.attrib.get("url", "")
-        enc_type = enclosure.attrib.get("type", "")
-        if enc_type.startswith("image") or any(ext in url.lower() for ext in ['.jpg', '.jpeg', '.png', '.gif', '.webp']):
-            return url
-
-    # Look for any element that might contain an image URL
-    for child in item.iter():
-        # Check attributes for image URLs
-        for attr_name, attr_value in child.attrib.items():
-            if attr_value and any(ext in attr_value.lower() for ext in ['jpg', 'jpeg', 'png', 'gif', 'webp']):
-                if attr_value.startswith('http'):
-                    return attr_value
-
-    return None
 
+def _articles_body(
+    feed_url: str, feed_data: ParsedFeed, audio_job: Dict[str, Any], omit: FrozenSet[str]
+) -> Dict[str, Any]:
+    body = {"source": feed_url, "title": feed_data.title, "audio": _audio_fields(audio_job, omit)}
+    if ITEM_LIST_FIELD not in omit:
+        body["items"] = _item_fields(feed_data.items, omit)
+    return body
 
-async def fetch_articles(feed_url: str) -> Tuple[str, List[Dict[str, Any]]]:
+
+async def _articles_payload(feed_url: str, omit: FrozenSet[str] = frozenset()) -> Dict[str, Any]:
+    feed_data, audio_job = await _load_articles(feed_url, omit)
+    return _articles_body(feed_url, feed_data, audio_job, omit)
+
+
+async def _batch_record(feed: str, omit: FrozenSet[str]) -> Dict[str, Any]:
+    try:
+        feed_url = _validate_feed_url(feed)
+        async with batch_semaphore:
+            payload = await asyncio.wait_for(_articles_payload(feed_url, omit), timeout=BATCH_FEED_TIMEOUT_SECONDS)
+    except HTTPException as exc:
+        return {"feed": feed, "ok": False, "status_code": exc.status_code, "error": exc.detail}
+    except asyncio.TimeoutError:
+        return {"feed": feed, "ok": False, "status_code": 504, "error": "Timed out fetching feed."}
+    return {"feed": feed, "ok": True, **payload}
+
+
+async def _stream_batch(feeds: List[str], omit: FrozenSet[str]) -> AsyncIterator[bytes]:
+    tasks = [asyncio.create_task(_batch_record(feed, omit)) for feed in feeds]
     try:
-        async with httpx.AsyncClient(timeout=REQUEST_TIMEOUT_SECONDS, follow_redirects=True) as client:
-            response = await client.get(feed_url, headers={"User-Agent": USER_AGENT})
-            response.raise_for_status()
-    except httpx.HTTPError as exc:
-        raise HTTPException(status_code=502, detail=f"Unable to fetch feed: {exc}") from exc
+        for next_record in asyncio.as_completed(tasks):
+            record = await next_record
+            yield orjson.dumps(record, option=orjson.OPT_APPEND_NEWLINE)
+    finally:
+        for task in tasks:
+            task.cancel()
 
+
+async def _timeline_source(
+    feed: str, omit: FrozenSet[str], with_audio: bool
+) -> Tuple[Dict[str, Any], Optional[ParsedFeed]]:
     try:
-        root = ET.fromstring(response.text)
-    except ET.ParseError as exc:
-        raise HTTPException(status_code=500, detail=f"Failed to parse feed XML: {exc}") from exc
-
-    channel = root.find("channel")
-    if channel is None:
-        raise HTTPException(status_code=500, detail="Unexpected feed format: missing channel element.")
-
-    channel_title = _strip_html(channel.findtext("title", default="")) or feed_url
-
-    articles: List[Dict[str, Any]] = []
-    for item in channel.findall("item"):
-        title = _strip_html(item.findtext("title", default="Untitled"))
-        description = _strip_html(item.findtext("description", default=""))
-        link = item.findtext("link", default="").strip()
-        published = _parse_datetime(item.findtext("pubDate"))
-        author = _strip_html(item.findtext("dc:creator", default="") or item.findtext("author"))
-        categories = [
-            _strip_html(cat.text) for cat in item.findall("category") if cat.text
-        ]
+        feed_url = _validate_feed_url(feed)
+        async with batch_semaphore:
+            if with_audio:
+                feed_data, audio_job = await asyncio.wait_for(
+                    _load_articles(feed_url, omit), timeout=BATCH_FEED_TIMEOUT_SECONDS
+                )
+            else:
+                feed_data = await asyncio.wait_for(get_parsed_feed(feed_url), timeout=BATCH_FEED_TIMEOUT_SECONDS)
+                audio_job = None
+    except HTTPException as exc:
+        return {"feed": feed, "ok": False, "status_code": exc.status_code, "error": exc.detail}, None
+    except asyncio.TimeoutError:
+        return {"feed": feed, "ok": False, "status_code": 504, "error": "Timed out fetching feed."}, None
+    source = {"feed": feed, "ok": True, "source": feed_url, "title": feed_data.title}
+    if audio_job is not None:
+        source["audio"] = _audio_fields(audio_job, omit)
+    return source, feed_data
+
+
+def _settled_source(feed: str, task: asyncio.Task) -> Tuple[Dict[str, Any], Optional[ParsedFeed]]:
+    """A finished source task's result, with any unexpected failure reported for that feed only."""
+    exc = task.exception()
+    if exc is None:
+        return task.result()
+    LOGGER.error("Loading %s for the timeline failed", feed, exc_info=exc)
+    return {"feed": feed, "ok": False, "status_code": 502, "error": "Failed to load feed."}, None
+
+
+def _forget_timeline_fill(task: asyncio.Task) -> None:
+    _timeline_fills.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        LOGGER.warning("Background timeline load failed: %s", task.exception())
+
+
+async def _first_page_sources(
+    feeds: List[str], omit: FrozenSet[str]
+) -> Tuple[List[Tuple[Dict[str, Any], Optional[ParsedFeed]]], List[str]]:
+    """
+    Load the sources of a first timeline page, waiting at most ``TIMELINE_FIRST_PAGE_WAIT_SECONDS``.
 
-        image_url = _extract_image(item)
-        
-        # If no image found, create a placeholder using a more reliable service
-        if not image_url:
-            # Use Picsum Photos which is more reliable and doesn't require text
-            import hashlib
-            article_hash = hashlib.md5(f"{title}{link}".encode()).hexdigest()[:6]
-            # Generate a seed based on the article for consistent images
-            seed = int(article_hash, 16) % 1000
-            image_url = f"https://picsum.photos/400/300?random={seed}"
-        
-        # Debug: Uncomment to see image extraction results
-        # print(f"DEBUG: Article '{title[:50]}...' -> Image: {image_url}")
-        
-        articles.append(
-            {
-                "title": title,
-                "description": description,
-                "link": link,
-                "published": published,
-                "author": author,
-                "categories": categories,
-                "image": image_url,
-            }
-        )
+    Cached feeds answer immediately, so one slow feed no longer holds back the whole page. Feeds
+    still loading are returned as pending and keep loading in the background.
+    """
+    tasks = [asyncio.create_task(_timeline_source(value, omit, True)) for value in feeds]
+    await asyncio.wait(tasks, timeout=TIMELINE_FIRST_PAGE_WAIT_SECONDS)
+    loaded = []
+    pending = []
+    for value, task in zip(feeds, tasks):
+        if task.done():
+            loaded.append(_settled_source(value, task))
+            continue
+        pending.append(value)
+        _timeline_fills.add(task)
+        task.add_done_callback(_forget_timeline_fill)
+    return loaded, pending
 
-    return channel_title, articles
+
+async def _stream_audio_events(request: Request, feeds: Optional[List[str]]) -> AsyncIterator[str]:
+    subscription = await subscribe_audio_events(feeds)
+    try:
+        yield f"retry: {AUDIO_EVENTS_RETRY_MILLISECONDS}\n\n"
+        while not await request.is_disconnected():
+            events = await subscription.next(timeout=AUDIO_EVENTS_HEARTBEAT_SECONDS)
+            if not events:
+                # Comment lines keep proxies from closing an idle stream.
+                yield ": keep-alive\n\n"
+                continue
+            for event in events:
+                yield f"event: status\ndata: {orjson.dumps(event).decode()}\n\n"
+    finally:
+        unsubscribe_audio_events(subscription)
 
 
 @app.get("/", response_class=HTMLResponse)
@@ -179,25 +583,184 @@ async def home(request: Request) -> HTMLResponse:
 
 
 @app.get("/api/articles")
-async def get_articles(feed: str = Query(..., description="RSS feed URL to fetch.")) -> Dict[str, Any]:
-    feed_url = feed.strip()
-    if not feed_url:
-        raise HTTPException(status_code=400, detail="Feed must be provided.")
-    if not feed_url.lower().startswith(("http://", "https://")):
-        raise HTTPException(status_code=400, detail="Feed must be a valid HTTP or HTTPS URL.")
+async def get_articles(
+    request: Request,
+    feed: str = Query(..., description="RSS feed URL to fetch."),
+    omit: Optional[List[str]] = Query(
+        None,
+        description="Fields to leave out (repeatable or comma-separated): item fields such as description, "
+        "items for the whole item list, or transcript, segments or audio for the embedded audio job.",
+    ),
+) -> Response:
+    """
+    Articles and audio status for one feed, with a strong ETag; ``If-None-Match`` yields 304.
+    """
+    timing = start_request_timing()
+    feed_url = _validate_feed_url(feed)
+    omitted = _parse_omit(omit)
+    feed_data, audio_job = await _load_articles(feed_url, omitted)
+    etag = _strong_etag(feed_url, feed_data.revision, sorted(omitted), dict(audio_job, transcript=None))
+    with timed("serialise"):
+        response = _conditional_response(
+            request, etag, lambda: _articles_body(feed_url, feed_data, audio_job, omitted)
+        )
+    response.headers["Server-Timing"] = timing.header()
+    return response
 
-    title, items = await fetch_articles(feed_url)
-    audio_job = await ensure_audio_for_feed(feed_url, title, items)
-    return {"source": feed_url, "title": title, "items": items, "audio": audio_job}
+
+@app.post("/api/articles/batch")
+async def get_articles_batch(request: BatchArticlesRequest) -> StreamingResponse:
+    """
+    Fetch several feeds concurrently and stream one NDJSON record per feed as each completes.
+    """
+    feeds = list(dict.fromkeys(request.feeds))
+    return StreamingResponse(_stream_batch(feeds, _parse_omit(request.omit)), media_type="application/x-ndjson")
+
+
+@app.get("/api/timeline")
+async def get_timeline(
+    request: Request,
+    feed: List[str] = Query(..., description="RSS feed URLs to merge (repeat the parameter)."),
+    limit: int = Query(TIMELINE_PAGE_SIZE, ge=1, le=TIMELINE_MAX_PAGE_SIZE),
+    cursor: Optional[str] = Query(None, description="Opaque ``next_cursor`` from the previous page."),
+    omit: Optional[List[str]] = Query(None, description="Fields to leave out, as for /api/articles."),
+) -> Response:
+    """
+    One page of the feeds merged newest first, with stories carried by several feeds shown once.
+
+    The first page also lists every feed with its title, story count and audio job (which it
+    starts, as /api/articles does) and any fetch errors; later pages only carry items. Feeds
+    that are not ready in time are left out of the first page and listed under ``pending``;
+    clients follow them with /api/articles/batch and request the first page again.
+    """
+    timing = start_request_timing()
+    feeds = list(dict.fromkeys(value.strip() for value in feed if value.strip()))
+    if not feeds:
+        raise HTTPException(status_code=400, detail="At least one feed URL is required.")
+    if len(feeds) > BATCH_MAX_FEEDS:
+        raise HTTPException(status_code=400, detail=f"At most {BATCH_MAX_FEEDS} feeds can be merged.")
+    omitted = _parse_omit(omit)
+    first_page = cursor is None
+    pending: List[str] = []
+    if first_page:
+        loaded, pending = await _first_page_sources(feeds, omitted)
+    else:
+        tasks = [asyncio.create_task(_timeline_source(value, omitted, False)) for value in feeds]
+        await asyncio.gather(*tasks, return_exceptions=True)
+        loaded = [_settled_source(value, task) for value, task in zip(feeds, tasks)]
+    available = [(source, feed_data) for source, feed_data in loaded if feed_data is not None]
+    with timed("merge"):
+        try:
+            page = merge_timeline(
+                [feed_data.timeline for _, feed_data in available], limit, cursor, count_all=first_page
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+    etag = _strong_etag(
+        [feed_data.revision for _, feed_data in available],
+        cursor,
+        limit,
+        sorted(omitted),
+        [source for source, _ in loaded],
+        pending,
+    )
+
+    def build() -> Dict[str, Any]:
+        item_omit = omitted - AUDIO_FIELDS - {ITEM_LIST_FIELD}
+        items = [
+            {**{key: value for key, value in item.items() if key not in item_omit}, "feed": available[index][0]["feed"]}
+            for index, item in page.items
+        ]
+        payload: Dict[str, Any] = {"items": items, "next_cursor": page.next_cursor}
+        if first_page:
+            for position, (source, _) in enumerate(available):
+                source["count"] = page.counts[position]
+            payload["feeds"] = [source for source, _ in loaded]
+            payload["pending"] = pending
+            payload["total"] = page.total
+        return payload
+
+    with timed("serialise"):
+        response = _conditional_response(request, etag, build)
+    response.headers["Server-Timing"] = timing.header()
+    return response
 
 
 @app.get("/api/audio/status")
-async def audio_status(feed: Optional[str] = Query(None)) -> Dict[str, Any]:
-    if feed:
-        return await get_audio_status(feed.strip())
-    return {"items": await get_all_audio_statuses()}
+async def audio_status(
+    request: Request,
+    feed: Optional[str] = Query(None),
+    omit: Optional[List[str]] = Query(None, description="Status fields to leave out, e.g. transcript."),
+) -> Response:
+    if not feed:
+        return ORJSONResponse({"items": await get_all_audio_statuses()})
+    omitted = _parse_omit(omit)
+    status = await get_audio_status(feed.strip(), include_transcript="transcript" not in omitted)
+    etag = _strong_etag(sorted(omitted), dict(status, transcript=None))
+    return _conditional_response(
+        request, etag, lambda: {key: value for key, value in status.items() if key not in omitted}
+    )
+
+
+@app.get("/api/audio/events")
+async def audio_events(request: Request, feed: Optional[List[str]] = Query(None)) -> StreamingResponse:
+    """
+    Server-Sent Events stream of audio job status changes, optionally limited to ``feed`` URLs.
+
+    The current status of every matching job is sent first, followed by each change as it happens.
+    """
+    feeds = [value.strip() for value in feed if value.strip()] if feed else None
+    return StreamingResponse(
+        _stream_audio_events(request, feeds),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/audio/{name}")
+async def audio_file(request: Request, name: str) -> Response:
+    """
+    Episode and segment audio, with Range support. Compactly stored episodes are served as WAV
+    decoded on first request and cached.
+    """
+    if not AUDIO_FILE_RE.match(name):
+        raise HTTPException(status_code=404, detail="Audio not found.")
+    resolved = await resolve_audio_file(name)
+    if resolved is None:
+        raise HTTPException(status_code=404, detail="Audio not found.")
+    path, media_type, digest = resolved
+    headers = {"Cache-Control": AUDIO_CACHE_CONTROL}
+    if digest:
+        headers["ETag"] = f'"{digest}"'
+        if _not_modified(request, headers["ETag"]):
+            return Response(status_code=304, headers=headers)
+    return FileResponse(path, media_type=media_type, headers=headers)
+
+
+@app.get("/api/audio/stats")
+async def audio_stats() -> Dict[str, Any]:
+    return await get_audio_stats()
+
+
+@app.get("/api/cache/stats")
+async def cache_stats() -> Dict[str, Any]:
+    return {"feeds": feed_cache.stats(), "refresher": feed_refresher.stats()}
+
+
+@app.get("/metrics")
+async def metrics() -> Response:
+    return Response(render_metrics(), media_type=METRICS_CONTENT_TYPE)
+
+
+@app.get("/api/startup")
+async def startup_report() -> Dict[str, Any]:
+    """Cold-start milestones (seconds since process start) and warm-up phase durations."""
+    return STARTUP.as_dict()
 
 
 @app.get("/healthz")
 async def healthz() -> Dict[str, str]:
     return {"status": "ok"}
+
+
+STARTUP.milestone("imported")
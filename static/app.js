@@ -1,5 +1,13 @@
-const API_ENDPOINT = "/api/articles";
+const TIMELINE_ENDPOINT = "/api/timeline";
+const TIMELINE_PAGE_SIZE = 60;
+const TIMELINE_MAX_PAGE_SIZE = 200;
+// Streams feeds the first timeline page did not wait for; only progress is needed, not items.
+const BATCH_ENDPOINT = "/api/articles/batch";
+const BATCH_OMIT_FIELDS = ["items", "audio"];
 const AUDIO_STATUS_ENDPOINT = "/api/audio/status";
+// The UI never shows transcripts; leaving them out keeps payloads small and ETags stable.
+const OMIT_FIELDS = "transcript";
+const AUDIO_EVENTS_ENDPOINT = "/api/audio/events";
 const AUDIO_POLL_INTERVAL = 5000;
 
 const STORAGE_KEYS = {
@@ -30,6 +38,7 @@ const historyCloseButton = document.getElementById("historyCloseButton");
 const historyClearButton = document.getElementById("historyClearButton");
 const audioPlayer = document.getElementById("panelAudioPlayer");
 const audioPlayerShell = document.getElementById("panelAudioPlayerShell");
+const timelineSentinel = document.getElementById("timelineSentinel");
 
 if (audioPlayerShell) {
     audioPlayerShell.dataset.state = "idle";
@@ -84,6 +93,7 @@ sourcesList.addEventListener("keydown", event => {
 
 let sourceSequence = 0;
 let cardObserver = null;
+let timelineObserver = null;
 let panelProgressPanels = [];
 let panelProgressRaf = null;
 let panelProgressListenersAttached = false;
@@ -114,8 +124,15 @@ const state = {
     sourceCounts: new Map(),
     audioStatuses: new Map(),
     audioPollers: new Map(),
+    audioEvents: null,
+    audioEventsKey: "",
     currentAudioFeed: null,
-    audioTitles: new Map()
+    audioTitles: new Map(),
+    timelineCursor: null,
+    timelineTotal: 0,
+    timelineLoading: false,
+    timelineGeneration: 0,
+    pendingFeedErrors: new Map()
 };
 
 if (audioPlayer) {
@@ -242,6 +259,10 @@ async function loadArticles(showSkeleton = true) {
         updatePresetButtonStates();
         detachPanelProgressListeners();
         floatingHeading.hidden = true;
+        disconnectAudioEvents();
+        state.timelineGeneration += 1;
+        state.timelineCursor = null;
+        observeTimelineEnd();
         return;
     }
 
@@ -254,62 +275,25 @@ async function loadArticles(showSkeleton = true) {
     toggleError(false);
     emptyState.hidden = true;
     refreshButton.disabled = true;
+    connectAudioEvents(state.sources.map(source => source.feed));
 
+    const generation = ++state.timelineGeneration;
+    state.timelineCursor = null;
+    state.pendingFeedErrors = new Map();
     try {
-        const results = await Promise.allSettled(
-            state.sources.map(source => fetchSourceArticles(source))
-        );
-        const aggregated = [];
-        const counts = new Map();
-        const errors = [];
-
-        results.forEach((result, index) => {
-            const source = state.sources[index];
-            if (result.status === "fulfilled") {
-                const { items, title, url, feed, audio } = result.value;
-                source.title = title;
-                source.url = url;
-                const feedKey = feed || url || source.feed;
-                rememberAudioTitle(feedKey, title);
-                if (audio) {
-                    upsertAudioStatus(feedKey, audio);
-                } else {
-                    requestAudioStatus(feedKey);
-                }
-                scheduleAudioPolling(feedKey);
-                items.forEach(item => {
-                    aggregated.push({
-                        ...item,
-                        sourceId: source.id,
-                        sourceTitle: title,
-                        sourceUrl: url,
-                        sourceFeed: feedKey
-                    });
-                    counts.set(source.id, (counts.get(source.id) ?? 0) + 1);
-                });
-            } else {
-                errors.push({ source, error: result.reason });
-            }
-        });
-
-        state.items = aggregated;
-        state.feedErrors = errors;
-        updateSourcesList(counts);
-        updatePresetButtonStates();
-        updateTimestamp(new Date());
-
-        if (errors.length) {
-            console.warn("Some feeds failed to load:", errors);
+        const feeds = Array.from(new Set(state.sources.map(source => source.feed).filter(Boolean)));
+        const page = await fetchTimelinePage(feeds, null);
+        if (generation !== state.timelineGeneration) {
+            return;
         }
-
-        if (!aggregated.length && errors.length) {
-            toggleError(true);
-        } else {
-            toggleError(false);
+        applyFirstTimelinePage(page);
+        if (Array.isArray(page.pending) && page.pending.length) {
+            followPendingFeeds(page.pending, feeds, generation);
         }
-
-        render();
     } catch (error) {
+        if (generation !== state.timelineGeneration) {
+            return;
+        }
         console.error("Failed to load feeds:", error);
         state.items = [];
         state.feedErrors = [{ source: null, error }];
@@ -324,26 +308,218 @@ async function loadArticles(showSkeleton = true) {
     }
 }
 
-async function fetchSourceArticles(source) {
-    if (!source.feed) {
-        throw new Error("Feed URL is required for this source.");
+function applyFirstTimelinePage(page) {
+    const counts = new Map();
+    const errors = [];
+    (page.feeds || []).forEach(record => {
+        const source = state.sources.find(candidate => candidate.feed === record.feed);
+        if (!source) {
+            return;
+        }
+        if (!record.ok) {
+            errors.push({ source, error: new Error(record.error || `Request failed with status ${record.status_code}`) });
+            return;
+        }
+        const url = record.source || source.feed;
+        source.title = deriveTitle(record.title, url);
+        source.url = url;
+        rememberAudioTitle(source.feed, source.title);
+        if (record.audio) {
+            upsertAudioStatus(source.feed, { feed: source.feed, ...record.audio });
+        } else {
+            requestAudioStatus(source.feed);
+        }
+        scheduleAudioPolling(source.feed);
+        counts.set(source.id, record.count ?? 0);
+    });
+    (page.pending || []).forEach(feed => {
+        const error = state.pendingFeedErrors.get(feed);
+        const source = state.sources.find(candidate => candidate.feed === feed);
+        if (error && source) {
+            errors.push({ source, error });
+        }
+    });
+    state.sources
+        .filter(source => !source.feed)
+        .forEach(source => errors.push({ source, error: new Error("Feed URL is required for this source.") }));
+
+    state.items = toTimelineArticles(page.items);
+    state.timelineCursor = page.next_cursor || null;
+    state.timelineTotal = page.total ?? state.items.length;
+    state.feedErrors = errors;
+    updateSourcesList(counts);
+    updatePresetButtonStates();
+    updateTimestamp(new Date());
+
+    if (errors.length) {
+        console.warn("Some feeds failed to load:", errors);
     }
-    const endpoint = `${API_ENDPOINT}?feed=${encodeURIComponent(source.feed)}`;
 
-    const response = await fetch(endpoint);
+    toggleError(!state.items.length && errors.length > 0);
+    render();
+    observeTimelineEnd();
+}
+
+// Feeds still loading when the first page was served are streamed as they finish; each arrival
+// re-merges the first page (now from the server's cache), keeping as many items as are shown.
+async function followPendingFeeds(pending, feeds, generation) {
+    let refreshing = null;
+    let stale = false;
+    const refreshFirstPage = () => {
+        if (refreshing) {
+            stale = true;
+            return;
+        }
+        refreshing = (async () => {
+            do {
+                stale = false;
+                const limit = Math.min(TIMELINE_MAX_PAGE_SIZE, Math.max(TIMELINE_PAGE_SIZE, state.items.length));
+                const page = await fetchTimelinePage(feeds, null, limit);
+                if (generation !== state.timelineGeneration) {
+                    return;
+                }
+                applyFirstTimelinePage(page);
+            } while (stale);
+        })()
+            .catch(error => console.warn("Failed to refresh the timeline:", error))
+            .finally(() => {
+                refreshing = null;
+            });
+    };
+
+    try {
+        await streamBatchRecords(pending, record => {
+            if (generation !== state.timelineGeneration) {
+                return;
+            }
+            if (!record.ok) {
+                state.pendingFeedErrors.set(
+                    record.feed,
+                    new Error(record.error || `Request failed with status ${record.status_code}`)
+                );
+            }
+            refreshFirstPage();
+        });
+    } catch (error) {
+        console.warn("Failed to follow slow feeds:", error);
+    }
+}
+
+async function streamBatchRecords(feeds, onRecord) {
+    const response = await fetch(BATCH_ENDPOINT, {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({ feeds, omit: BATCH_OMIT_FIELDS })
+    });
+    if (!response.ok || !response.body) {
+        throw new Error(`Batch request failed with status ${response.status}`);
+    }
+
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = "";
+    const handleLine = line => {
+        if (line.trim()) {
+            onRecord(JSON.parse(line));
+        }
+    };
+
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) {
+            break;
+        }
+        buffer += decoder.decode(value, { stream: true });
+        let newlineIndex = buffer.indexOf("\n");
+        while (newlineIndex !== -1) {
+            handleLine(buffer.slice(0, newlineIndex));
+            buffer = buffer.slice(newlineIndex + 1);
+            newlineIndex = buffer.indexOf("\n");
+        }
+    }
+    handleLine(buffer + decoder.decode());
+}
+
+async function fetchTimelinePage(feeds, cursor, limit = TIMELINE_PAGE_SIZE) {
+    const params = new URLSearchParams();
+    feeds.forEach(feed => params.append("feed", feed));
+    params.set("limit", String(limit));
+    params.set("omit", OMIT_FIELDS);
+    if (cursor) {
+        params.set("cursor", cursor);
+    }
+    const response = await fetch(`${TIMELINE_ENDPOINT}?${params}`);
     if (!response.ok) {
-        throw new Error(`Request failed with status ${response.status}`);
+        throw new Error(`Timeline request failed with status ${response.status}`);
+    }
+    return response.json();
+}
+
+function toTimelineArticles(items) {
+    const sourcesByFeed = new Map();
+    state.sources.forEach(source => {
+        if (source.feed && !sourcesByFeed.has(source.feed)) {
+            sourcesByFeed.set(source.feed, source);
+        }
+    });
+    return (Array.isArray(items) ? items : []).map(item => {
+        const source = sourcesByFeed.get(item.feed) ?? {};
+        return {
+            ...item,
+            sourceId: source.id,
+            sourceTitle: source.title,
+            sourceUrl: source.url || item.feed,
+            sourceFeed: item.feed
+        };
+    });
+}
+
+// Later pages are only requested once the end of the rendered timeline scrolls into view.
+function observeTimelineEnd() {
+    if (!timelineSentinel || typeof IntersectionObserver === "undefined") {
+        return;
     }
+    if (!timelineObserver) {
+        timelineObserver = new IntersectionObserver(
+            entries => {
+                if (entries.some(entry => entry.isIntersecting)) {
+                    loadMoreTimeline();
+                }
+            },
+            { rootMargin: "0px 0px 600px 0px" }
+        );
+    }
+    timelineObserver.disconnect();
+    if (state.timelineCursor) {
+        timelineObserver.observe(timelineSentinel);
+    }
+}
 
-    const payload = await response.json();
-    const sourceUrl = payload.source || source.feed || source.url;
-    const title = deriveTitle(payload.title, sourceUrl);
-    const items = Array.isArray(payload.items) ? payload.items : [];
-    const audio = payload.audio && typeof payload.audio === "object" ? payload.audio : null;
-    if (audio && !audio.feed) {
-        audio.feed = source.feed;
+async function loadMoreTimeline() {
+    if (!state.timelineCursor || state.timelineLoading) {
+        return;
+    }
+    const generation = state.timelineGeneration;
+    const feeds = Array.from(new Set(state.sources.map(source => source.feed).filter(Boolean)));
+    const cursor = state.timelineCursor;
+    state.timelineLoading = true;
+    try {
+        const page = await fetchTimelinePage(feeds, cursor);
+        // A refreshed first page replaces the items this page would have extended.
+        if (generation !== state.timelineGeneration || cursor !== state.timelineCursor) {
+            return;
+        }
+        state.items = state.items.concat(toTimelineArticles(page.items));
+        state.timelineCursor = page.next_cursor || null;
+        render();
+    } catch (error) {
+        console.warn("Failed to load more stories:", error);
+    } finally {
+        state.timelineLoading = false;
+        if (generation === state.timelineGeneration) {
+            observeTimelineEnd();
+        }
     }
-    return { items, title, url: sourceUrl, feed: source.feed, audio };
 }
 
 function upsertAudioStatus(feedUrl, rawStatus) {
@@ -355,6 +531,9 @@ function upsertAudioStatus(feedUrl, rawStatus) {
         return;
     }
     state.audioStatuses.set(feedUrl, status);
+    if (audioPlayer && audioPlayer.dataset.feedUrl === feedUrl && audioPlayer.dataset.awaitingSegment) {
+        resumeAwaitingSegment();
+    }
     if (state.currentAudioFeed === feedUrl) {
         refreshRenderedAudioButtons();
         updateAudioPlayerStatusText();
@@ -384,11 +563,26 @@ function normaliseAudioStatus(feedUrl, rawStatus) {
         mime_type: rawStatus.mime_type || null,
         transcript: rawStatus.transcript || null,
         error: rawStatus.error || null,
+        segments: Array.isArray(rawStatus.segments) ? rawStatus.segments : [],
         updated_at: rawStatus.updated_at || null
     };
     return status;
 }
 
+// Intros or outros the model left out are marked "skipped" and never get audio.
+function firstPlayableSegment(segments) {
+    const index = segments.findIndex(segment => segment.status !== "skipped");
+    return index === -1 ? segments.length : index;
+}
+
+function canStreamSegments(status) {
+    if (!status || status.status !== "generating" || !Array.isArray(status.segments)) {
+        return false;
+    }
+    const first = status.segments[firstPlayableSegment(status.segments)];
+    return Boolean(first && first.status === "ready" && first.audio_url);
+}
+
 function getAudioTitle(feedUrl) {
     if (!feedUrl) {
         return "";
@@ -408,7 +602,7 @@ async function requestAudioStatus(feedUrl) {
         return;
     }
     try {
-        const response = await fetch(`${AUDIO_STATUS_ENDPOINT}?feed=${encodeURIComponent(feedUrl)}`);
+        const response = await fetch(`${AUDIO_STATUS_ENDPOINT}?feed=${encodeURIComponent(feedUrl)}&omit=${OMIT_FIELDS}`);
         if (!response.ok) {
             throw new Error(`Status request failed with ${response.status}`);
         }
@@ -420,10 +614,61 @@ async function requestAudioStatus(feedUrl) {
     }
 }
 
+function connectAudioEvents(feeds) {
+    if (typeof window.EventSource !== "function") {
+        return;
+    }
+    const uniqueFeeds = Array.from(new Set(feeds.filter(Boolean))).sort();
+    const key = uniqueFeeds.join("\n");
+    if (state.audioEvents && state.audioEventsKey === key) {
+        return;
+    }
+    disconnectAudioEvents();
+    if (!uniqueFeeds.length) {
+        return;
+    }
+    const query = uniqueFeeds.map(feed => `feed=${encodeURIComponent(feed)}`).join("&");
+    const source = new EventSource(`${AUDIO_EVENTS_ENDPOINT}?${query}`);
+    source.addEventListener("status", event => {
+        try {
+            const payload = JSON.parse(event.data);
+            upsertAudioStatus(payload.feed, payload);
+        } catch (error) {
+            console.warn("Ignoring malformed audio event:", error);
+        }
+    });
+    source.addEventListener("open", () => {
+        // Pushed updates replace polling while the stream is connected.
+        clearAllAudioPolling();
+    });
+    source.addEventListener("error", () => {
+        // EventSource reconnects on its own; poll in the meantime so pending feeds keep updating.
+        state.audioStatuses.forEach((_, feedUrl) => scheduleAudioPolling(feedUrl));
+    });
+    state.audioEvents = source;
+    state.audioEventsKey = key;
+}
+
+function disconnectAudioEvents() {
+    if (state.audioEvents) {
+        state.audioEvents.close();
+    }
+    state.audioEvents = null;
+    state.audioEventsKey = "";
+}
+
+function audioEventsConnected() {
+    return Boolean(state.audioEvents && state.audioEvents.readyState === EventSource.OPEN);
+}
+
 function scheduleAudioPolling(feedUrl) {
     if (!feedUrl) {
         return;
     }
+    if (audioEventsConnected()) {
+        clearAudioPoll(feedUrl);
+        return;
+    }
     const status = state.audioStatuses.get(feedUrl);
     if (!shouldPollStatus(status)) {
         clearAudioPoll(feedUrl);
@@ -488,7 +733,7 @@ function updateAudioButtonElement(button) {
         return;
     }
     const labelStatus = status.status || "pending";
-    if (labelStatus === "ready" && status.audio_url) {
+    if ((labelStatus === "ready" && status.audio_url) || canStreamSegments(status)) {
         button.disabled = false;
         button.classList.add("is-ready");
         const isPlayingCurrent = state.currentAudioFeed === feedUrl && audioPlayer && !audioPlayer.paused;
@@ -551,6 +796,14 @@ async function handlePanelAudioClick(event) {
     }
     const feedTitle = button?.dataset?.feedTitle || getAudioTitle(feedUrl);
     const status = state.audioStatuses.get(feedUrl);
+    if (canStreamSegments(status)) {
+        if (state.currentAudioFeed === feedUrl && audioPlayer && !audioPlayer.paused) {
+            audioPlayer.pause();
+            return;
+        }
+        playPanelAudio(feedUrl, status, feedTitle);
+        return;
+    }
     if (
         !status ||
         !status.status ||
@@ -581,15 +834,23 @@ async function handlePanelAudioClick(event) {
 }
 
 function playPanelAudio(feedUrl, status, titleLabel) {
-    if (!audioPlayer || !status.audio_url) {
+    // While the episode is still generating, play its published segments back to back.
+    const useSegments = status.status !== "ready" && canStreamSegments(status);
+    if (!audioPlayer || (!status.audio_url && !useSegments)) {
         return;
     }
     if (feedUrl) {
         rememberAudioTitle(feedUrl, titleLabel || getAudioTitle(feedUrl));
     }
-    const audioSrc = resolveAudioSourceUrl(status);
-    if (audioPlayer.src !== audioSrc) {
-        audioPlayer.src = audioSrc;
+    const isResumingSegments = useSegments && audioPlayer.dataset.feedUrl === feedUrl && audioPlayer.dataset.segmentIndex;
+    if (!isResumingSegments) {
+        const firstIndex = useSegments ? firstPlayableSegment(status.segments) : 0;
+        const audioSrc = useSegments ? status.segments[firstIndex].audio_url : resolveAudioSourceUrl(status);
+        if (audioPlayer.src !== audioSrc) {
+            audioPlayer.src = audioSrc;
+        }
+        audioPlayer.dataset.segmentIndex = useSegments ? String(firstIndex) : "";
+        audioPlayer.dataset.awaitingSegment = "";
     }
     audioPlayer.dataset.feedUrl = feedUrl;
     if (titleLabel) {
@@ -612,6 +873,48 @@ function playPanelAudio(feedUrl, status, titleLabel) {
         });
 }
 
+function advanceAudioSegment() {
+    const feedUrl = audioPlayer.dataset.feedUrl;
+    const currentIndex = audioPlayer.dataset.segmentIndex;
+    if (!feedUrl || !currentIndex) {
+        return false;
+    }
+    const status = state.audioStatuses.get(feedUrl);
+    const segments = status && Array.isArray(status.segments) ? status.segments : [];
+    let nextIndex = Number(currentIndex) + 1;
+    while (nextIndex < segments.length && segments[nextIndex].status === "skipped") {
+        nextIndex += 1;
+    }
+    if (nextIndex >= segments.length || !status || status.status === "error" || status.status === "cancelled") {
+        audioPlayer.dataset.segmentIndex = "";
+        audioPlayer.dataset.awaitingSegment = "";
+        return false;
+    }
+    const next = segments[nextIndex];
+    if (!next || next.status !== "ready" || !next.audio_url) {
+        // Wait for the next status update to publish this segment.
+        audioPlayer.dataset.awaitingSegment = String(nextIndex);
+        scheduleAudioPolling(feedUrl);
+        return true;
+    }
+    audioPlayer.dataset.segmentIndex = String(nextIndex);
+    audioPlayer.dataset.awaitingSegment = "";
+    audioPlayer.src = next.audio_url;
+    audioPlayer.play().catch(error => {
+        console.warn("Unable to continue segment playback:", error);
+    });
+    return true;
+}
+
+function resumeAwaitingSegment() {
+    const awaiting = Number(audioPlayer.dataset.awaitingSegment);
+    audioPlayer.dataset.awaitingSegment = "";
+    audioPlayer.dataset.segmentIndex = String(awaiting - 1);
+    if (!advanceAudioSegment()) {
+        handleGlobalAudioEnded();
+    }
+}
+
 function resolveAudioSourceUrl(status) {
     if (!status.audio_url) {
         return "";
@@ -880,6 +1183,8 @@ function stopAudioPlayback() {
     audioPlayer.removeAttribute("src");
     audioPlayer.dataset.feedUrl = "";
     audioPlayer.dataset.feedTitle = "";
+    audioPlayer.dataset.segmentIndex = "";
+    audioPlayer.dataset.awaitingSegment = "";
     audioPlayer.load();
     updateAudioPlayerStatusText();
     updateAudioToggleControl(false, false);
@@ -892,6 +1197,9 @@ function handleGlobalAudioEnded() {
     if (!audioPlayer) {
         return;
     }
+    if (advanceAudioSegment()) {
+        return;
+    }
     stopAudioProgressAnimation();
     updateAudioPlayerStatusText();
     updateAudioToggleControl(false, Boolean(audioPlayer.currentSrc));
@@ -1116,6 +1424,7 @@ function render() {
         detachPanelProgressListeners();
         floatingHeading.hidden = true;
         clearAllAudioPolling();
+        disconnectAudioEvents();
         state.audioStatuses.clear();
         state.audioTitles.clear();
         if (audioPlayer && !audioPlayer.paused) {
@@ -1196,6 +1505,9 @@ function render() {
         ? formatSourceLabel(state.sources.find(source => source.id === state.activeSourceId) ?? {})
         : null;
     let message = `Showing ${filteredBySource.length} ${descriptor}`;
+    if (state.timelineCursor && !state.query && !state.activeSourceId) {
+        message += ` of ${state.timelineTotal}`;
+    }
     if (activeSourceLabel) {
         message += ` from ${activeSourceLabel}`;
     }
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import asyncio
+from pathlib import Path
+from typing import Awaitable, Callable, Iterator, List, Optional, Sequence, Tuple
+from xml.sax.saxutils import escape
+
+import httpx
+import pytest
+
+import audio_podcast_backend
+from audio_podcast_backend import DEFAULT_SPEAKERS, AudioPodcastManager
+from benchmarks.stub_rss import StubRSSServer
+from generation_backends import SyntheticBackend
+from generation_scheduler import GenerationScheduler, StageConfig
+from job_store import MemoryJobStore
+
+# (title, link, pubDate); empty strings leave the element out.
+FeedItem = Tuple[str, str, str]
+
+
+def rss_document(title: str, items: Sequence[FeedItem]) -> bytes:
+    parts = [f"<?xml version='1.0' encoding='utf-8'?><rss version='2.0'><channel><title>{escape(title)}</title>"]
+    for item_title, link, published in items:
+        parts.append("<item>")
+        if item_title:
+            parts.append(f"<title>{escape(item_title)}</title>")
+        if link:
+            parts.append(f"<link>{escape(link)}</link>")
+        if published:
+            parts.append(f"<pubDate>{published}</pubDate>")
+        parts.append(f"<description>About {escape(item_title or link or 'nothing')}.</description></item>")
+    parts.append("</channel></rss>")
+    return "".join(parts).encode("utf-8")
+
+
+def fast_scheduler() -> GenerationScheduler:
+    stage = dict(max_concurrency=4, requests_per_minute=6000, burst=4)
+    return GenerationScheduler({"transcript": StageConfig(model="t", **stage), "tts": StageConfig(model="s", **stage)})
+
+
+def build_manager(tmp_path: Path) -> AudioPodcastManager:
+    return AudioPodcastManager(
+        output_dir=tmp_path / "podcasts",
+        backend=SyntheticBackend(DEFAULT_SPEAKERS, chars_per_second=400),
+        index_path=tmp_path / "podcast_index.sqlite3",
+        scheduler=fast_scheduler(),
+        job_store=MemoryJobStore(),
+    )
+
+
+@pytest.fixture
+def rss_server() -> Iterator[StubRSSServer]:
+    server = StubRSSServer({}).start()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def audio_manager(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> AudioPodcastManager:
+    """A synthetic-backend manager in ``tmp_path``, installed as the app's manager."""
+    manager = build_manager(tmp_path)
+    monkeypatch.setattr(audio_podcast_backend, "audio_manager", manager)
+    return manager
+
+
+@pytest.fixture
+def run_app(audio_manager: AudioPodcastManager) -> Callable[[Callable[[httpx.AsyncClient], Awaitable[None]]], None]:
+    """Run ``scenario(client)`` against the app, inside its lifespan, on a fresh event loop."""
+    import rss_viewer
+
+    def run(scenario: Callable[[httpx.AsyncClient], Awaitable[None]]) -> None:
+        async def main() -> None:
+            async with rss_viewer.lifespan(rss_viewer.app):
+                transport = httpx.ASGITransport(app=rss_viewer.app)
+                async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+                    await scenario(client)
+
+        asyncio.run(main())
+
+    return run
+
+
+async def settle_audio(manager: AudioPodcastManager) -> List[Optional[str]]:
+    """Wait for every generation job the manager is running; returns their final statuses."""
+    jobs = list(manager._jobs.values())
+    await asyncio.gather(*(job.task for job in jobs if job.task is not None), return_exceptions=True)
+    return [job.status for job in jobs]
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+import orjson
+
+from conftest import rss_document, settle_audio
+
+
+def test_batch_streams_one_record_per_feed(run_app, rss_server, audio_manager) -> None:
+    rss_server.set_feed("news", rss_document("News", [("Story", "https://news.example/1", "Mon, 06 Jan 2025 09:15:00 +0000")]))
+    news, missing = rss_server.url("news"), rss_server.url("missing")
+
+    async def scenario(client) -> None:
+        records: List[Dict[str, Any]] = []
+        body = {"feeds": [news, "ftp://bad.example/rss", missing, news], "omit": ["description", "transcript"]}
+        async with client.stream("POST", "/api/articles/batch", json=body) as response:
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("application/x-ndjson")
+            async for line in response.aiter_lines():
+                if line:
+                    records.append(orjson.loads(line))
+        await settle_audio(audio_manager)
+
+        # Duplicates are fetched once; the invalid URL fails without a fetch, so it comes first.
+        assert len(records) == 3
+        assert (records[0]["feed"], records[0]["ok"], records[0]["status_code"]) == ("ftp://bad.example/rss", False, 400)
+        by_feed = {record["feed"]: record for record in records}
+        assert by_feed[news]["ok"] and by_feed[news]["title"] == "News"
+        assert [item["title"] for item in by_feed[news]["items"]] == ["Story"]
+        assert "description" not in by_feed[news]["items"][0]
+        assert "transcript" not in by_feed[news]["audio"]
+        assert (by_feed[missing]["ok"], by_feed[missing]["status_code"]) == (False, 502)
+
+    run_app(scenario)
+
+
+def test_batch_rejects_an_empty_feed_list(run_app) -> None:
+    async def scenario(client) -> None:
+        response = await client.post("/api/articles/batch", json={"feeds": []})
+        assert response.status_code == 422
+
+    run_app(scenario)
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import struct
+import wave
+from pathlib import Path
+
+import pytest
+
+import audio_codec
+from audio_codec import COMPACT_EXTENSION, DerivedAudioCache, decode_adpcm, encode_adpcm, read_info
+
+SAMPLE_RATE = 24000
+
+
+def _tone(frames: int, frequency: float = 440.0) -> bytes:
+    samples = (int(12000 * math.sin(2 * math.pi * frequency * n / SAMPLE_RATE)) for n in range(frames))
+    return struct.pack(f"<{frames}h", *samples)
+
+
+def _write_compact(path: Path, frames: int, frequency: float = 440.0) -> bytes:
+    pcm = _tone(frames, frequency)
+    path.write_bytes(encode_adpcm([pcm], 1, 2, SAMPLE_RATE))
+    return pcm
+
+
+@pytest.mark.parametrize("frames", [4800, 4801])
+def test_adpcm_round_trip(frames: int) -> None:
+    pcm = _tone(frames)
+    # Passed as several buffers, as the generator hands over segments.
+    encoded = encode_adpcm([pcm[:1000], memoryview(pcm[1000:])], 1, 2, SAMPLE_RATE)
+    assert len(encoded) < len(pcm) // 4 + 64
+
+    decoded, info = decode_adpcm(encoded)
+    assert (info.channels, info.sample_width, info.sample_rate, info.frames) == (1, 2, SAMPLE_RATE, frames)
+    assert len(decoded) == len(pcm)
+    original = struct.unpack(f"<{frames}h", pcm)
+    restored = struct.unpack(f"<{frames}h", decoded)
+    # IMA ADPCM is lossy, but a steady tone comes back well above 20 dB SNR once the
+    # predictor has settled.
+    signal = sum(sample * sample for sample in original[200:])
+    noise = sum((a - b) ** 2 for a, b in zip(original[200:], restored[200:]))
+    assert 10 * math.log10(signal / noise) > 20
+
+
+def test_adpcm_rejects_unsupported_pcm_and_foreign_files() -> None:
+    with pytest.raises(ValueError):
+        encode_adpcm([b"\0" * 8], 2, 2, SAMPLE_RATE)
+    with pytest.raises(ValueError):
+        decode_adpcm(b"RIFF" + b"\0" * 64)
+    with pytest.raises(ValueError):
+        decode_adpcm(b"NPAD")
+
+
+def test_digest_follows_the_encoded_payload(tmp_path: Path) -> None:
+    _write_compact(tmp_path / "a.adpcm", 2400, 440.0)
+    _write_compact(tmp_path / "b.adpcm", 2400, 440.0)
+    _write_compact(tmp_path / "c.adpcm", 2400, 660.0)
+    digests = [read_info(tmp_path / f"{name}.adpcm").digest for name in "abc"]
+    assert digests[0] == digests[1] != digests[2]
+
+
+def test_derived_wav_is_decoded_once_and_reused(tmp_path: Path) -> None:
+    async def scenario() -> None:
+        source = tmp_path / f"episode{COMPACT_EXTENSION}"
+        pcm = _write_compact(source, 4800)
+        cache = DerivedAudioCache(tmp_path / "derived", max_bytes=10 * 1024 * 1024)
+
+        results = await asyncio.gather(*(cache.wav_for(source) for _ in range(4)))
+        assert len({path for path, _ in results}) == 1
+        path, digest = results[0]
+        assert digest == read_info(source).digest
+        assert (cache.misses, cache.stats()["inflight"]) == (1, 0)
+        with wave.open(str(path), "rb") as rendition:
+            assert (rendition.getnchannels(), rendition.getsampwidth(), rendition.getframerate()) == (1, 2, SAMPLE_RATE)
+            assert rendition.getnframes() == len(pcm) // 2
+
+        await cache.wav_for(source)
+        assert cache.hits == 1 and cache.misses == 1
+
+    asyncio.run(scenario())
+
+
+def test_derived_cache_evicts_oldest_renditions(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr(audio_codec, "DERIVED_EVICTION_GRACE_SECONDS", 0.0)
+
+    async def scenario() -> None:
+        sources = [tmp_path / f"episode{index}{COMPACT_EXTENSION}" for index in range(3)]
+        for index, source in enumerate(sources):
+            _write_compact(source, 4800, 300.0 + 100 * index)
+        wav_bytes = 44 + 4800 * 2
+        cache = DerivedAudioCache(tmp_path / "derived", max_bytes=2 * wav_bytes)
+
+        paths = []
+        for source in sources:
+            path, _ = await cache.wav_for(source)
+            paths.append(path)
+        assert [path.exists() for path in paths] == [False, True, True]
+        assert cache.evictions == 1
+
+        assert cache.trim(0) == 0
+        assert not any(path.exists() for path in paths)
+
+    asyncio.run(scenario())
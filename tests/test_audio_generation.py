@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import struct
+import wave
+from pathlib import Path
+
+import pytest
+
+from audio_podcast_backend import DEFAULT_SPEAKERS, _normalise_audio_bytes, _stitch_audio_segments
+from conftest import build_manager
+from generation_backends import INTRO_MARKER, OUTRO_MARKER, SyntheticBackend
+
+ARTICLES = [
+    {"title": "Bridge reopens", "description": "Traffic is back.", "link": "https://news.example/bridge"},
+    {"title": "Library extends hours", "description": "Open until ten.", "link": "https://news.example/library"},
+]
+
+
+class _CountingBackend(SyntheticBackend):
+    def __init__(self) -> None:
+        super().__init__(DEFAULT_SPEAKERS, chars_per_second=400)
+        self.calls = 0
+
+    def generate_text(self, prompt: str) -> str:
+        self.calls += 1
+        return super().generate_text(prompt)
+
+    def synthesise(self, transcript: str):
+        self.calls += 1
+        return super().synthesise(transcript)
+
+
+class _NoOutroBackend(SyntheticBackend):
+    def generate_text(self, prompt: str) -> str:
+        text = super().generate_text(prompt)
+        if INTRO_MARKER in prompt:
+            return text.split(OUTRO_MARKER, 1)[0]
+        return text
+
+
+def test_missing_outro_is_left_out(tmp_path: Path) -> None:
+    async def scenario() -> None:
+        manager = build_manager(tmp_path)
+        manager.backend = _NoOutroBackend(DEFAULT_SPEAKERS, chars_per_second=400)
+        job = await manager.ensure_audio("https://news.example/rss", "News", ARTICLES)
+        await job.task
+
+        assert job.status == "ready", job.error
+        assert [segment.status for segment in job.segments] == ["ready", "ready", "ready", "skipped"]
+        assert job.audio_path.exists()
+
+    asyncio.run(scenario())
+
+
+def test_story_evicted_after_lookup_is_regenerated(tmp_path: Path) -> None:
+    async def scenario() -> None:
+        manager = build_manager(tmp_path)
+        first = await manager.ensure_audio("https://one.example/rss", "One", ARTICLES)
+        await first.task
+        assert first.status == "ready", first.error
+
+        lookup = manager._lookup_story_segments
+
+        async def lookup_then_sweep(keys):
+            # A storage sweep removes the stored stories right after the lookup found them.
+            found = await lookup(keys)
+            for record in found.values():
+                (manager.output_dir / record.audio_filename).unlink()
+            return found
+
+        manager._lookup_story_segments = lookup_then_sweep
+        second = await manager.ensure_audio("https://two.example/rss", "Two", ARTICLES)
+        await second.task
+
+        assert second.status == "ready", second.error
+        stories = second.segments[1:-1]
+        assert [segment.status for segment in stories] == ["ready", "ready"]
+        assert not any(segment.reused for segment in stories)
+        for segment in stories:
+            assert (manager.output_dir / Path(segment.audio_url).name).with_suffix(".adpcm").exists()
+
+    asyncio.run(scenario())
+
+
+def test_episode_is_restored_from_the_index_after_a_restart(tmp_path: Path) -> None:
+    async def scenario() -> None:
+        manager = build_manager(tmp_path)
+        first = await manager.ensure_audio("https://news.example/rss", "News", ARTICLES)
+        await first.task
+        assert first.status == "ready", first.error
+
+        restarted = build_manager(tmp_path)
+        backend = _CountingBackend()
+        restarted.backend = backend
+        status = await restarted.get_status("https://news.example/rss")
+        assert (status["status"], status["audio_url"]) == ("ready", first.audio_url)
+
+        # Episodes are keyed by content, so a mirror of the same feed reuses the stored file.
+        mirror = await restarted.ensure_audio("https://mirror.example/rss", "News", ARTICLES)
+        if mirror.task is not None:
+            await mirror.task
+        assert (mirror.status, mirror.audio_url) == ("ready", first.audio_url)
+        assert backend.calls == 0
+
+        # New content is a new episode; its unchanged stories are reused from the index.
+        changed = [*ARTICLES, {"title": "Market day", "description": "Stalls open at eight.", "link": "https://news.example/market"}]
+        update = await restarted.ensure_audio("https://news.example/rss", "News", changed)
+        await update.task
+        assert update.status == "ready", update.error
+        assert update.audio_url != first.audio_url
+        assert [segment.reused for segment in update.segments[1:-1]] == [True, True, False]
+
+    asyncio.run(scenario())
+
+
+def test_job_registry_stays_within_its_bounds(tmp_path: Path) -> None:
+    async def scenario() -> None:
+        manager = build_manager(tmp_path)
+        manager.max_jobs = 2
+        feeds = [f"https://feed{index}.example/rss" for index in range(3)]
+        jobs = [
+            await manager.ensure_audio(feed, f"Feed {index}", [{**ARTICLES[0], "title": f"Story {index}"}])
+            for index, feed in enumerate(feeds)
+        ]
+        # Jobs still generating are never evicted.
+        assert manager.registry_stats()["tracked"] == 3
+        await asyncio.gather(*(job.task for job in jobs))
+        assert all(job.status == "ready" for job in jobs)
+        # Finished jobs drop their articles.
+        assert all(job.articles == [] for job in jobs)
+
+        # Feed 0 is asked for again, so the next new job evicts feeds 1 and 2 instead.
+        await manager.ensure_audio(feeds[0], "Feed 0", [{**ARTICLES[0], "title": "Story 0"}])
+        latest = await manager.ensure_audio("https://feed3.example/rss", "Feed 3", ARTICLES)
+        stats = manager.registry_stats()
+        assert (stats["tracked"], stats["evictions"]) == (2, 2)
+        assert list(manager._jobs) == [feeds[0], "https://feed3.example/rss"]
+        # An evicted ready episode is still served from the index.
+        status = await manager.get_status(feeds[1])
+        assert (status["status"], status["audio_url"]) == ("ready", jobs[1].audio_url)
+        await latest.task
+
+    asyncio.run(scenario())
+
+
+def _wav_file(pcm: bytes, sample_rate: int = 24000) -> bytes:
+    out = io.BytesIO()
+    with wave.open(out, "wb") as handle:
+        handle.setnchannels(1)
+        handle.setsampwidth(2)
+        handle.setframerate(sample_rate)
+        handle.writeframes(pcm)
+    return out.getvalue()
+
+
+def test_segments_are_stitched_without_copying_samples() -> None:
+    raw = bytearray(struct.pack("<4h", 1, 2, 3, 4))
+    raw_part = _normalise_audio_bytes(raw, "audio/L16;codec=pcm;rate=24000")
+    assert raw_part[1] == "audio/wav"
+    # Raw PCM gets a header in front of it; the samples stay in the provider's buffer.
+    assert raw_part[0][1].obj is raw
+
+    wav_part = _normalise_audio_bytes(_wav_file(struct.pack("<2h", 5, 6)), "audio/wav")
+    buffers, mime_type = _stitch_audio_segments([raw_part, wav_part])
+    assert mime_type == "audio/wav"
+    assert any(buffer.obj is raw for buffer in buffers)
+    with wave.open(io.BytesIO(b"".join(buffers)), "rb") as stitched:
+        assert stitched.getnframes() == 6
+        assert struct.unpack("<6h", stitched.readframes(6)) == (1, 2, 3, 4, 5, 6)
+
+    with pytest.raises(ValueError):
+        _stitch_audio_segments([raw_part, _normalise_audio_bytes(_wav_file(b"\0\0", 16000), "audio/wav")])
+
+
+def test_failed_write_leaves_no_partial_file(tmp_path: Path) -> None:
+    async def scenario() -> None:
+        manager = build_manager(tmp_path)
+        manager.output_dir.mkdir(parents=True, exist_ok=True)
+        path = await manager._write_audio("episode", [memoryview(b"ID3"), memoryview(b"frames")], "audio/mpeg")
+        assert path.read_bytes() == b"ID3frames"
+
+        with pytest.raises(TypeError):
+            # The second buffer cannot be written, after the first already was.
+            await manager._write_audio("broken", [memoryview(b"ID3"), object()], "audio/mpeg")
+        assert sorted(item.name for item in manager.output_dir.iterdir()) == ["episode.mp3"]
+
+    asyncio.run(scenario())
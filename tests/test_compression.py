@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+from conftest import rss_document, settle_audio
+
+
+def test_compressed_static_asset_revalidates(run_app) -> None:
+    async def scenario(client) -> None:
+        first = await client.get("/static/app.js", headers={"Accept-Encoding": "gzip"})
+        assert first.status_code == 200
+        assert first.headers["content-encoding"] == "gzip"
+        etag = first.headers["etag"]
+        assert etag.endswith('-gzip"')
+
+        again = await client.get("/static/app.js", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.headers["etag"] == etag
+        assert again.content == b""
+
+        identity = await client.get("/static/app.js", headers={"Accept-Encoding": "identity"})
+        assert "content-encoding" not in identity.headers
+        assert identity.headers["etag"] != etag
+        revalidated = await client.get(
+            "/static/app.js", headers={"Accept-Encoding": "identity", "If-None-Match": identity.headers["etag"]}
+        )
+        assert revalidated.status_code == 304
+        assert revalidated.headers["etag"] == identity.headers["etag"]
+
+    run_app(scenario)
+
+
+def test_compressed_articles_revalidate(run_app, rss_server, audio_manager) -> None:
+    items = [(f"Story {index}", f"https://news.example/{index}", "Mon, 06 Jan 2025 09:15:00 +0000") for index in range(20)]
+    rss_server.set_feed("news", rss_document("News", items))
+    params = {"feed": rss_server.url("news"), "omit": "transcript"}
+    headers = {"Accept-Encoding": "gzip"}
+
+    async def scenario(client) -> None:
+        await client.get("/api/articles", params=params, headers=headers)
+        assert await settle_audio(audio_manager) == ["ready"]
+
+        first = await client.get("/api/articles", params=params, headers=headers)
+        assert first.headers["content-encoding"] == "gzip"
+        etag = first.headers["etag"]
+        assert etag.endswith('-gzip"')
+        assert len(first.json()["items"]) == 20
+
+        again = await client.get("/api/articles", params=params, headers={**headers, "If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.headers["etag"] == etag
+
+    run_app(scenario)
+
+
+def test_omitted_fields_get_their_own_etag(run_app, rss_server, audio_manager) -> None:
+    rss_server.set_feed("news", rss_document("News", [("Story", "https://news.example/1", "Mon, 06 Jan 2025 09:15:00 +0000")]))
+    feed = rss_server.url("news")
+
+    async def scenario(client) -> None:
+        await client.get("/api/articles", params={"feed": feed})
+        assert await settle_audio(audio_manager) == ["ready"]
+
+        full = await client.get("/api/articles", params={"feed": feed})
+        assert "description" in full.json()["items"][0]
+        assert full.json()["audio"]["transcript"]
+
+        slim = await client.get("/api/articles", params={"feed": feed, "omit": "description,transcript"})
+        assert "description" not in slim.json()["items"][0]
+        assert "transcript" not in slim.json()["audio"]
+        assert slim.headers["etag"] != full.headers["etag"]
+
+        # The same omit set, spelled differently, revalidates against the same ETag.
+        respelled = await client.get(
+            "/api/articles",
+            params={"feed": feed, "omit": ["transcript", "description"]},
+            headers={"If-None-Match": f'W/{slim.headers["etag"]}'},
+        )
+        assert respelled.status_code == 304
+        assert respelled.headers["etag"] == slim.headers["etag"]
+
+        # A validator for the slim body must not stand in for the full one.
+        mismatched = await client.get("/api/articles", params={"feed": feed}, headers={"If-None-Match": slim.headers["etag"]})
+        assert mismatched.status_code == 200
+        assert "description" in mismatched.json()["items"][0]
+
+        status = await client.get("/api/audio/status", params={"feed": feed, "omit": "transcript"})
+        assert status.json()["status"] == "ready" and "transcript" not in status.json()
+        cached = await client.get(
+            "/api/audio/status", params={"feed": feed, "omit": "transcript"}, headers={"If-None-Match": status.headers["etag"]}
+        )
+        assert cached.status_code == 304
+        full_status = await client.get(
+            "/api/audio/status", params={"feed": feed}, headers={"If-None-Match": status.headers["etag"]}
+        )
+        assert full_status.status_code == 200 and full_status.json()["transcript"]
+
+    run_app(scenario)
@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import asyncio
+from typing import List
+
+from feed_cache import FeedCache, normalise_feed_url
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Loader:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.release.set()
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        version = self.calls
+        # Bounded, so a cache that fails to coalesce fails the test instead of hanging it.
+        await asyncio.wait_for(self.release.wait(), 5)
+        return f"v{version}"
+
+
+def test_concurrent_misses_share_one_load() -> None:
+    async def scenario() -> None:
+        cache: FeedCache[str] = FeedCache(ttl_seconds=60)
+        loader = _Loader()
+        loader.release.clear()
+        waiters = [asyncio.create_task(cache.get("feed", loader)) for _ in range(5)]
+        await asyncio.sleep(0)
+        loader.release.set()
+        assert await asyncio.gather(*waiters) == ["v1"] * 5
+        assert loader.calls == 1
+        assert (cache.misses, cache.coalesced) == (1, 4)
+        assert cache.stats()["inflight"] == 0
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_caller_does_not_cancel_the_shared_load() -> None:
+    async def scenario() -> None:
+        cache: FeedCache[str] = FeedCache(ttl_seconds=60)
+        loader = _Loader()
+        loader.release.clear()
+        first = asyncio.create_task(cache.get("feed", loader))
+        second = asyncio.create_task(cache.get("feed", loader))
+        await asyncio.sleep(0)
+        first.cancel()
+        loader.release.set()
+        assert await second == "v1"
+        assert cache.peek("feed") == "v1"
+
+    asyncio.run(scenario())
+
+
+def test_stale_entry_is_served_while_it_revalidates() -> None:
+    async def scenario() -> None:
+        clock = _Clock()
+        cache: FeedCache[str] = FeedCache(ttl_seconds=60, stale_seconds=300, clock=clock)
+        loader = _Loader()
+        assert await cache.get("feed", loader) == "v1"
+
+        clock.now += 30
+        assert await cache.get("feed", loader) == "v1"
+        assert loader.calls == 1
+
+        clock.now += 60
+        loader.release.clear()
+        # Stale: the old value comes back at once and a single refresh starts.
+        served: List[str] = [await cache.get("feed", loader) for _ in range(3)]
+        assert served == ["v1"] * 3
+        await asyncio.sleep(0)
+        assert loader.calls == 2
+        assert cache.stale_hits == 3 and cache.refreshes == 1
+        loader.release.set()
+        # Joins the background refresh rather than starting another.
+        assert await cache.refresh("feed", loader) == "v2"
+        assert loader.calls == 2
+        assert await cache.get("feed", loader) == "v2"
+
+        clock.now += 1000
+        # Past the stale window the caller waits for a fresh load.
+        assert await cache.get("feed", loader) == "v3"
+
+    asyncio.run(scenario())
+
+
+def test_failed_background_refresh_keeps_the_stale_entry() -> None:
+    async def scenario() -> None:
+        clock = _Clock()
+        cache: FeedCache[str] = FeedCache(ttl_seconds=60, stale_seconds=300, clock=clock)
+        assert await cache.get("feed", _Loader()) == "v1"
+
+        async def failing() -> str:
+            raise RuntimeError("upstream down")
+
+        clock.now += 90
+        assert await cache.get("feed", failing) == "v1"
+        await asyncio.sleep(0)
+        assert cache.errors == 1
+        assert cache.peek("feed") == "v1"
+
+    asyncio.run(scenario())
+
+
+def test_least_recently_used_entry_is_evicted() -> None:
+    async def scenario() -> None:
+        cache: FeedCache[str] = FeedCache(ttl_seconds=60, max_entries=2)
+        loader = _Loader()
+        await cache.get("a", loader)
+        await cache.get("b", loader)
+        await cache.get("a", loader)
+        await cache.get("c", loader)
+        assert cache.peek("a") is not None
+        assert cache.peek("b") is None
+        assert cache.evictions == 1
+
+    asyncio.run(scenario())
+
+
+def test_feed_urls_are_normalised() -> None:
+    assert normalise_feed_url(" HTTPS://News.Example:443/rss#top") == "https://news.example/rss"
+    assert normalise_feed_url("http://news.example:8080") == "http://news.example:8080/"
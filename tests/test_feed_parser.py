@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from typing import List
+from xml.etree import ElementTree as ET
+
+import pytest
+
+from benchmarks.bench_parser import load_corpus
+from benchmarks.legacy_parser import legacy_parse_item
+from conftest import rss_document
+from feed_parser import StreamingFeedParser, parse_item
+
+
+def _body(count: int) -> bytes:
+    return rss_document("Archive", [(f"Story {n}", f"https://archive.example/{n}", "") for n in range(count)])
+
+
+def _parse(body: bytes, chunk_size: int, **limits: int) -> StreamingFeedParser:
+    parser = StreamingFeedParser(**limits)
+    for start in range(0, len(body), chunk_size):
+        parser.feed(body[start : start + chunk_size])
+        if parser.done:
+            break
+    parser.close()
+    return parser
+
+
+def test_items_are_emitted_as_their_end_tags_arrive() -> None:
+    body = _body(3)
+    parser = StreamingFeedParser()
+    split = body.index(b"</item>") + len(b"</item>")
+    first: List[dict] = parser.feed(body[:split])
+    assert [item["title"] for item in first] == ["Story 0"]
+    assert [item["title"] for item in parser.feed(body[split:])] == ["Story 1", "Story 2"]
+    parser.close()
+    assert parser.channel_title == "Archive"
+    assert not parser.truncated
+
+
+def test_body_of_exactly_max_bytes_is_complete() -> None:
+    body = _body(5)
+    parser = _parse(body, 64, max_bytes=len(body))
+    assert parser.bytes_read == len(body)
+    assert len(parser.items) == 5
+    assert not parser.truncated
+
+
+def test_body_past_max_bytes_is_cut_short() -> None:
+    body = _body(50)
+    cap = body.index(b"Story 10")
+    parser = _parse(body, 64, max_bytes=cap)
+    assert parser.truncated
+    assert parser.bytes_read == cap
+    assert 0 < len(parser.items) < 50
+    assert parser.items[-1]["title"] == f"Story {len(parser.items) - 1}"
+
+
+def test_item_cap_stops_parsing() -> None:
+    parser = _parse(_body(50), 64, max_items=7)
+    assert parser.truncated
+    assert parser.done
+    assert [item["title"] for item in parser.items] == [f"Story {n}" for n in range(7)]
+
+
+CORPUS = load_corpus(50)
+
+
+@pytest.mark.parametrize("name, items", CORPUS, ids=[name for name, _ in CORPUS])
+def test_single_pass_extraction_matches_the_legacy_parser(name: str, items: List[ET.Element]) -> None:
+    assert items
+    for item in items:
+        assert parse_item(item) == legacy_parse_item(item)
+
+
+def _item(inner: str) -> ET.Element:
+    return ET.fromstring(
+        f"<item xmlns:media='https://search.yahoo.com/mrss/' "
+        f"xmlns:content='http://purl.org/rss/1.0/modules/content/'>{inner}</item>"
+    )
+
+
+def test_image_candidates_are_resolved_in_priority_order() -> None:
+    description = "<description>&lt;img src='https://img.example/description.png'&gt;</description>"
+    content = "<content:encoded>&lt;img src='https://img.example/content.png'&gt;</content:encoded>"
+    enclosure = "<enclosure url='https://img.example/enclosure.jpg' type='image/jpeg'/>"
+    media = "<media:thumbnail url='https://img.example/media.jpg'/>"
+    assert parse_item(_item(enclosure + content + description + media))["image"] == "https://img.example/media.jpg"
+    assert parse_item(_item(enclosure + content + description))["image"] == "https://img.example/description.png"
+    assert parse_item(_item(enclosure + content))["image"] == "https://img.example/content.png"
+    assert parse_item(_item(enclosure))["image"] == "https://img.example/enclosure.jpg"
+    assert parse_item(_item("<title>Bare</title>"))["image"].startswith("https://picsum.photos/")
+
+
+def test_first_occurrence_of_each_field_wins() -> None:
+    article = parse_item(
+        _item(
+            "<title>First &lt;b&gt;title&lt;/b&gt;</title><title>Second</title>"
+            "<pubDate>Mon, 06 Jan 2025 09:15:00 +0000</pubDate><category>One</category><category>Two</category>"
+        )
+    )
+    assert article["title"] == "First title"
+    assert article["published"] == "2025-01-06T09:15:00+00:00"
+    assert article["categories"] == ["One", "Two"]
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Dict, List, Optional
+
+from feed_refresher import FeedRefresher
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Upstream:
+    def __init__(self) -> None:
+        self.content: Dict[str, str] = {}
+        self.calls: List[str] = []
+        self.failing = False
+
+    async def __call__(self, feed_url: str) -> str:
+        self.calls.append(feed_url)
+        if self.failing:
+            raise RuntimeError("upstream down")
+        return self.content.get(feed_url, "v1")
+
+
+def _intervals(refresher: FeedRefresher) -> Dict[str, float]:
+    return {feed["feed"]: feed["interval_seconds"] for feed in refresher.stats()["feeds"]}
+
+
+def test_interval_follows_how_often_the_feed_changes() -> None:
+    async def scenario() -> None:
+        clock, upstream = _Clock(), _Upstream()
+        refresher = FeedRefresher(upstream, min_interval=10, max_interval=100, tick_seconds=0.001, clock=clock)
+        refresher.track("https://news.example/rss", "v1")
+        await refresher.start()
+        observed = []
+
+        async def advance(seconds: float) -> None:
+            clock.now += seconds
+            calls = len(upstream.calls)
+            for _ in range(100):
+                await asyncio.sleep(0.001)
+                if len(upstream.calls) > calls and not refresher.stats()["running"]:
+                    break
+            observed.append(_intervals(refresher)["https://news.example/rss"])
+
+        await asyncio.sleep(0.01)
+        assert upstream.calls == []
+        await advance(10)  # unchanged: back off by half
+        await advance(15)  # unchanged again
+        upstream.content["https://news.example/rss"] = "v2"
+        await advance(22.5)  # changed: refresh twice as often
+        upstream.failing = True
+        await advance(11.25)  # failed: double the interval
+        await refresher.close()
+
+        assert len(upstream.calls) == 4
+        assert observed == [15.0, 22.5, 11.2, 22.5]
+
+    asyncio.run(scenario())
+
+
+def test_publisher_hint_and_idle_feeds() -> None:
+    async def scenario() -> None:
+        clock, upstream = _Clock(), _Upstream()
+        hints: Dict[str, Optional[float]] = {"https://slow.example/rss": 50.0}
+        refresher = FeedRefresher(
+            upstream, hints.get, min_interval=10, idle_seconds=100, tick_seconds=0.001, clock=clock
+        )
+        refresher.track("https://slow.example/rss")
+        refresher.track("https://idle.example/rss")
+        await refresher.start()
+
+        clock.now = 20
+        await asyncio.sleep(0.02)
+        # The publisher asked for at least 50 s between fetches.
+        assert upstream.calls == ["https://idle.example/rss"]
+
+        clock.now = 60
+        refresher.track("https://slow.example/rss")
+        await asyncio.sleep(0.02)
+        assert "https://slow.example/rss" in upstream.calls
+
+        clock.now = 150
+        await asyncio.sleep(0.02)
+        assert [feed["feed"] for feed in refresher.stats()["feeds"]] == ["https://slow.example/rss"]
+        await refresher.close()
+
+    asyncio.run(scenario())
+
+
+def test_least_recently_requested_feed_is_dropped_at_capacity() -> None:
+    refresher = FeedRefresher(_Upstream(), max_feeds=2)
+    for feed in ("https://a.example/rss", "https://b.example/rss", "https://a.example/rss", "https://c.example/rss"):
+        refresher.track(feed)
+    assert [feed["feed"] for feed in refresher.stats()["feeds"]] == ["https://a.example/rss", "https://c.example/rss"]
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+import generation_cache
+from generation_cache import GenerationCache, prompt_cache_key, tts_cache_key
+
+
+@pytest.fixture
+def clock(monkeypatch) -> SimpleNamespace:
+    fake = SimpleNamespace(now=1_000_000.0)
+    fake.time = lambda: fake.now
+    monkeypatch.setattr(generation_cache, "time", fake)
+    return fake
+
+
+def test_entries_expire_after_the_ttl(tmp_path: Path, clock: SimpleNamespace) -> None:
+    cache = GenerationCache(tmp_path / "cache.sqlite3", "transcript", ttl_seconds=60, max_bytes=1024)
+    try:
+        cache.put("key", b"script", "meta")
+        clock.now += 59
+        assert cache.get("key") == (b"script", "meta")
+        clock.now += 2
+        assert cache.get("key") is None
+        assert cache.stats()["entries"] == 0
+        assert (cache.hits, cache.misses) == (1, 1)
+    finally:
+        cache.close()
+
+
+def test_least_recently_used_entries_go_once_over_max_bytes(tmp_path: Path, clock: SimpleNamespace) -> None:
+    cache = GenerationCache(tmp_path / "cache.sqlite3", "tts", ttl_seconds=3600, max_bytes=300)
+    try:
+        for key in ("a", "b", "c"):
+            cache.put(key, bytes(100))
+            clock.now += 1
+        assert cache.get("a") is not None
+        clock.now += 1
+        cache.put("d", bytes(100))
+
+        assert cache.get("b") is None
+        assert all(cache.get(key) is not None for key in ("a", "c", "d"))
+        stats = cache.stats()
+        assert (stats["entries"], stats["bytes"], stats["evictions"]) == (3, 300, 1)
+
+        # A value larger than the whole budget is not cached and evicts nothing.
+        cache.put("huge", bytes(301))
+        assert cache.get("huge") is None
+        assert cache.stats()["entries"] == 3
+    finally:
+        cache.close()
+
+
+def test_namespaces_share_a_file_but_not_entries(tmp_path: Path, clock: SimpleNamespace) -> None:
+    path = tmp_path / "cache.sqlite3"
+    transcripts = GenerationCache(path, "transcript", ttl_seconds=3600, max_bytes=100)
+    tts = GenerationCache(path, "tts", ttl_seconds=3600, max_bytes=100)
+    other_worker = GenerationCache(path, "tts", ttl_seconds=3600, max_bytes=100)
+    try:
+        transcripts.put("key", bytes(80))
+        tts.put("key", bytes(80), "pcm")
+        # Each namespace has its own budget, so neither write evicted the other.
+        assert transcripts.get("key") == (bytes(80), "")
+        assert other_worker.get("key") == (bytes(80), "pcm")
+    finally:
+        for cache in (transcripts, tts, other_worker):
+            cache.close()
+
+
+def test_keys_cover_everything_that_shapes_the_output() -> None:
+    assert prompt_cache_key("model-a", "prompt") != prompt_cache_key("model-b", "prompt")
+    speakers = [("Host", "Kore"), ("Guest", "Puck")]
+    assert tts_cache_key("tts", speakers, "Hi") == tts_cache_key("tts", list(speakers), "Hi")
+    assert tts_cache_key("tts", speakers, "Hi") != tts_cache_key("tts", speakers[::-1], "Hi")
+    assert tts_cache_key("tts", speakers, "Hi") != tts_cache_key("tts", [("Host", "Puck"), ("Guest", "Kore")], "Hi")
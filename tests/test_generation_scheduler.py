@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+from typing import List
+
+import pytest
+
+from generation_scheduler import (
+    PRIORITY_BACKGROUND,
+    PRIORITY_INTERACTIVE,
+    GenerationScheduler,
+    PrioritySlots,
+    StageConfig,
+    TokenBucket,
+    is_retryable_error,
+)
+
+
+class _ProviderError(Exception):
+    def __init__(self, code: int, message: str = "provider error") -> None:
+        super().__init__(message)
+        self.code = code
+
+
+def _scheduler(max_concurrency: int = 1, **options) -> GenerationScheduler:
+    options.setdefault("base_backoff_seconds", 0.001)
+    options.setdefault("max_backoff_seconds", 0.005)
+    config = StageConfig(model="m", max_concurrency=max_concurrency, requests_per_minute=60000, burst=100)
+    return GenerationScheduler({"tts": config}, **options)
+
+
+def test_free_slots_go_to_the_highest_priority_waiter() -> None:
+    async def scenario() -> None:
+        slots = PrioritySlots(1)
+        await slots.acquire(PRIORITY_INTERACTIVE)
+        order: List[str] = []
+
+        async def wait(name: str, priority: int) -> None:
+            await slots.acquire(priority)
+            order.append(name)
+            slots.release()
+
+        waiters = [
+            asyncio.create_task(wait("background-1", PRIORITY_BACKGROUND)),
+            asyncio.create_task(wait("interactive-1", PRIORITY_INTERACTIVE)),
+            asyncio.create_task(wait("background-2", PRIORITY_BACKGROUND)),
+            asyncio.create_task(wait("interactive-2", PRIORITY_INTERACTIVE)),
+        ]
+        await asyncio.sleep(0)
+        assert slots.queued == 4
+        slots.release()
+        await asyncio.gather(*waiters)
+        assert order == ["interactive-1", "interactive-2", "background-1", "background-2"]
+        assert slots.active == 0
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_waiter_does_not_leak_its_slot() -> None:
+    async def scenario() -> None:
+        slots = PrioritySlots(1)
+        await slots.acquire(PRIORITY_BACKGROUND)
+        waiter = asyncio.create_task(slots.acquire(PRIORITY_INTERACTIVE))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.gather(waiter, return_exceptions=True)
+        slots.release()
+        assert slots.active == 0
+        await asyncio.wait_for(slots.acquire(PRIORITY_BACKGROUND), 1)
+
+    asyncio.run(scenario())
+
+
+def test_interactive_call_overtakes_queued_background_work() -> None:
+    async def scenario() -> None:
+        scheduler = _scheduler()
+        gate = threading.Event()
+        order: List[str] = []
+
+        def call(name: str) -> str:
+            if name == "running":
+                gate.wait(5)
+            order.append(name)
+            return name
+
+        running = asyncio.create_task(scheduler.run("tts", PRIORITY_BACKGROUND, call, "running"))
+        await asyncio.sleep(0.01)
+        queued = [asyncio.create_task(scheduler.run("tts", PRIORITY_BACKGROUND, call, "background"))]
+        await asyncio.sleep(0)
+        queued.append(asyncio.create_task(scheduler.run("tts", PRIORITY_INTERACTIVE, call, "interactive")))
+        await asyncio.sleep(0)
+        assert scheduler.stats()["tts"]["queue_depth"] == 2
+        gate.set()
+        await asyncio.gather(running, *queued)
+        assert order == ["running", "interactive", "background"]
+        scheduler.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_rate_limited_call_is_retried() -> None:
+    async def scenario() -> None:
+        scheduler = _scheduler()
+        attempts: List[int] = []
+
+        def call() -> str:
+            attempts.append(len(attempts) + 1)
+            if len(attempts) < 3:
+                raise _ProviderError(429, "RESOURCE_EXHAUSTED")
+            return "audio"
+
+        assert await scheduler.run("tts", PRIORITY_INTERACTIVE, call) == "audio"
+        assert attempts == [1, 2, 3]
+        stats = scheduler.stats()["tts"]
+        assert (stats["retries"], stats["completed"], stats["failed"]) == (2, 1, 0)
+        assert stats["active"] == 0
+        scheduler.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_retries_stop_at_max_attempts_and_skip_permanent_errors() -> None:
+    async def scenario() -> None:
+        scheduler = _scheduler(max_attempts=3)
+        calls: List[str] = []
+
+        def rate_limited() -> None:
+            calls.append("429")
+            raise _ProviderError(429)
+
+        def rejected() -> None:
+            calls.append("400")
+            raise _ProviderError(400, "invalid prompt")
+
+        with pytest.raises(_ProviderError):
+            await scheduler.run("tts", PRIORITY_INTERACTIVE, rate_limited)
+        with pytest.raises(_ProviderError):
+            await scheduler.run("tts", PRIORITY_INTERACTIVE, rejected)
+        assert calls == ["429", "429", "429", "400"]
+        assert scheduler.stats()["tts"]["failed"] == 2
+        scheduler.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_retryable_errors_are_classified() -> None:
+    assert is_retryable_error(_ProviderError(429))
+    assert is_retryable_error(_ProviderError(503))
+    assert is_retryable_error(TimeoutError())
+    assert is_retryable_error(RuntimeError("429 RESOURCE_EXHAUSTED: quota"))
+    assert not is_retryable_error(_ProviderError(400))
+    assert not is_retryable_error(ValueError("bad input"))
+
+
+def test_token_bucket_refills_at_its_rate() -> None:
+    now = [0.0]
+    bucket = TokenBucket(rate=2.0, capacity=4, clock=lambda: now[0])
+    assert bucket.available == 4
+    asyncio.run(bucket.acquire(4))
+    assert bucket.available == 0
+    now[0] += 1.0
+    assert bucket.available == 2
+    now[0] += 10.0
+    assert bucket.available == 4
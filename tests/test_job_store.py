@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from job_store import SQLiteJobStore
+
+
+def test_only_one_worker_wins_the_claim(tmp_path: Path) -> None:
+    # One store per worker, as separate processes would open the shared file.
+    stores = [SQLiteJobStore(tmp_path / "jobs.sqlite3") for _ in range(8)]
+    try:
+        with ThreadPoolExecutor(max_workers=len(stores)) as pool:
+            results = list(pool.map(lambda pair: pair[1].claim("episode", f"job-{pair[0]}", 60), enumerate(stores)))
+        assert sum(results) == 1
+        winner = results.index(True)
+        stores[0].put_status("episode", "https://feed.example/rss", {"status": "pending"}, time.time())
+        assert stores[-1].get_job_status("episode").owner == f"job-{winner}"
+        # A held lease is never claimed again, not even by its owner.
+        assert not stores[winner].claim("episode", f"job-{winner}", 60)
+    finally:
+        for store in stores:
+            store.close()
+
+
+def test_owner_renews_and_others_cannot(tmp_path: Path) -> None:
+    store = SQLiteJobStore(tmp_path / "jobs.sqlite3")
+    try:
+        assert store.claim("episode", "owner", 0.2)
+        store.put_status("episode", "https://feed.example/rss", {"status": "pending"}, time.time())
+        first_expiry = store.get_job_status("episode").lease_expires_at
+
+        assert not store.renew("episode", "intruder", 60)
+        assert store.renew("episode", "owner", 60)
+        status = store.get_job_status("episode")
+        assert status.lease_expires_at > first_expiry + 30
+        time.sleep(0.3)
+        # Renewed past its original expiry, so nobody can take it over yet.
+        assert store.get_job_status("episode").leased
+        assert not store.claim("episode", "intruder", 60)
+    finally:
+        store.close()
+
+
+def test_expired_lease_is_taken_over(tmp_path: Path) -> None:
+    first = SQLiteJobStore(tmp_path / "jobs.sqlite3")
+    second = SQLiteJobStore(tmp_path / "jobs.sqlite3")
+    try:
+        assert first.claim("episode", "crashed", 0.05)
+        assert not second.claim("episode", "successor", 60)
+        time.sleep(0.1)
+        assert second.claim("episode", "successor", 60)
+
+        # The stale owner can neither renew nor drop the new lease when it finally finishes.
+        assert not first.renew("episode", "crashed", 60)
+        first.release("episode", "crashed", "https://feed.example/rss", {"status": "error"})
+        status = second.get_job_status("episode")
+        assert status.owner == "successor" and status.leased
+
+        second.release("episode", "successor", "https://feed.example/rss", {"status": "ready"})
+        status = first.get_job_status("episode")
+        assert status.owner is None and not status.leased
+        assert status.status == {"status": "ready"}
+        assert first.get_feed_status("https://feed.example/rss").cache_key == "episode"
+        assert first.claim("episode", "next", 60)
+    finally:
+        first.close()
+        second.close()
+
+
+def test_older_status_snapshot_does_not_overwrite_a_newer_one(tmp_path: Path) -> None:
+    store = SQLiteJobStore(tmp_path / "jobs.sqlite3")
+    try:
+        store.put_status("episode", "https://feed.example/rss", {"progress": 2}, 200.0)
+        store.put_status("episode", "https://feed.example/rss", {"progress": 1}, 100.0)
+        assert store.get_job_status("episode").status == {"progress": 2}
+    finally:
+        store.close()
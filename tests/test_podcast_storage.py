@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import asyncio
+import os
+from pathlib import Path
+
+from audio_podcast_backend import AudioPodcastManager
+from conftest import build_manager
+
+
+async def _generate(manager: AudioPodcastManager, feed: str):
+    articles = [{"title": f"{feed} story", "description": f"What happened at {feed}.", "link": f"https://{feed}/1"}]
+    job = await manager.ensure_audio(f"https://{feed}/rss", feed, articles)
+    await job.task
+    assert job.status == "ready", job.error
+    return job, articles
+
+
+def test_served_episode_outlives_cold_one(tmp_path: Path) -> None:
+    async def scenario() -> None:
+        manager = build_manager(tmp_path)
+        hot, hot_articles = await _generate(manager, "hot.example")
+        cold, _ = await _generate(manager, "cold.example")
+
+        # The hot episode is older but keeps being played: once through the in-memory fast
+        # path and then straight from the audio route.
+        await manager.ensure_audio(hot.feed_url, hot.channel_title, hot_articles)
+        for _ in range(3):
+            assert await manager.resolve_audio(hot.audio_url.rsplit("/", 1)[1]) is not None
+
+        hot_stem = hot.audio_path.name.rsplit(".", 1)[0]
+        manager.storage.orphan_grace_seconds = 0
+        # Room for the hot episode and the WAV rendition it is being served from.
+        manager.storage.quota_bytes = sum(
+            path.stat().st_size for path in manager.output_dir.glob(f"{hot_stem}*")
+        ) + sum(path.stat().st_size for path in manager.derived_audio.directory.glob("*.wav"))
+        report = await manager.storage.sweep()
+
+        assert report.entries_evicted > 0
+        assert hot.audio_path.exists()
+        assert not cold.audio_path.exists()
+
+    asyncio.run(scenario())
+
+
+def test_derived_renditions_count_against_quota(tmp_path: Path) -> None:
+    async def scenario() -> None:
+        manager = build_manager(tmp_path)
+        job, _ = await _generate(manager, "derived.example")
+        resolved = await manager.resolve_audio(job.audio_url.rsplit("/", 1)[1])
+        assert resolved is not None
+        rendition = resolved[0]
+        assert rendition.parent == manager.derived_audio.directory
+        old = rendition.stat().st_mtime - 3600
+        os.utime(rendition, (old, old))
+
+        # The stored audio alone fits; the rendition on top of it does not.
+        manager.storage.orphan_grace_seconds = 0
+        manager.storage.quota_bytes = sum(path.stat().st_size for path in manager.output_dir.iterdir())
+        report = await manager.storage.sweep()
+
+        assert not rendition.exists()
+        assert report.derived_bytes == 0
+        assert report.entries_evicted == 0
+        assert job.audio_path.exists()
+
+    asyncio.run(scenario())
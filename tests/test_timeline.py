@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+import rss_viewer
+from conftest import rss_document
+from timeline import index_items, merge_timeline
+
+
+def _item(title: str, link: str, day: int) -> Dict[str, Any]:
+    return {"title": title, "link": link, "published": f"2025-01-{day:02d}T09:00:00+00:00"}
+
+
+def _walk(feeds, limit: int) -> List[List[str]]:
+    pages: List[List[str]] = []
+    cursor: Optional[str] = None
+    # Bounded, so a cursor that stops advancing fails instead of looping.
+    for _ in range(20):
+        page = merge_timeline(feeds, limit, cursor)
+        pages.append([item["title"] for _, item in page.items])
+        if page.next_cursor is None:
+            return pages
+        cursor = page.next_cursor
+    raise AssertionError(f"Timeline did not end after {len(pages)} pages: {pages[-3:]}")
+
+
+def test_pages_walk_the_merge_newest_first_without_repeats() -> None:
+    a = index_items("https://a.example/rss", [_item(f"A{day}", f"https://a.example/{day}", day) for day in (1, 3, 5, 7, 9)])
+    b = index_items("https://b.example/rss", [_item(f"B{day}", f"https://b.example/{day}", day) for day in (2, 4, 6, 8)])
+    pages = _walk([a, b], 3)
+    assert pages == [["A9", "B8", "A7"], ["B6", "A5", "B4"], ["A3", "B2", "A1"]]
+
+    first = merge_timeline([a, b], 3, count_all=True)
+    assert (first.counts, first.total) == ([5, 4], 9)
+
+
+def test_duplicate_stories_are_served_once_from_the_newest_feed() -> None:
+    a = index_items(
+        "https://a.example/rss",
+        [_item("Launch day", "https://news.example/launch", 5), _item("Old news", "https://a.example/old", 1)],
+    )
+    b = index_items(
+        "https://b.example/rss",
+        [
+            # Same link spelled differently, and the same title with different case and spacing.
+            _item("Launch coverage", "HTTPS://News.Example/launch#comments", 4),
+            _item("  old   NEWS ", "https://b.example/old", 2),
+            _item("Unique", "https://b.example/unique", 3),
+        ],
+    )
+    page = merge_timeline([a, b], 10, count_all=True)
+    assert [(source, item["title"]) for source, item in page.items] == [(0, "Launch day"), (1, "Unique"), (1, "  old   NEWS ")]
+    assert page.counts == [1, 2]
+
+
+def test_story_seen_on_an_earlier_page_does_not_reappear() -> None:
+    a = index_items("https://a.example/rss", [_item("Shared", "https://news.example/shared", 9), _item("A1", "https://a.example/1", 8)])
+    b = index_items("https://b.example/rss", [_item("B1", "https://b.example/1", 7), _item("Shared again", "https://news.example/shared", 6)])
+    assert _walk([a, b], 1) == [["Shared"], ["A1"], ["B1"]]
+
+
+def test_cursor_is_stable_when_a_feed_gains_new_items() -> None:
+    items = [_item(f"A{day}", f"https://a.example/{day}", day) for day in (1, 2, 3, 4)]
+    first = merge_timeline([index_items("https://a.example/rss", items)], 2)
+    assert [item["title"] for _, item in first.items] == ["A4", "A3"]
+
+    refreshed = index_items("https://a.example/rss", [_item("A5", "https://a.example/5", 5), *items])
+    second = merge_timeline([refreshed], 2, first.next_cursor)
+    assert [item["title"] for _, item in second.items] == ["A2", "A1"]
+    assert second.next_cursor is None
+
+
+def test_malformed_cursor_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        merge_timeline([], 10, "not-a-cursor!")
+
+
+def test_untitled_linkless_items_stay_distinct_across_feeds() -> None:
+    item = {"description": "Untitled note", "published": "2025-01-06T09:15:00+00:00"}
+    page = merge_timeline([index_items("https://a.example/rss", [item]), index_items("https://b.example/rss", [item])], 10)
+    assert [source for source, _ in page.items] == [0, 1]
+
+
+def test_unexpected_feed_failure_is_reported_for_that_feed(run_app, rss_server, monkeypatch) -> None:
+    rss_server.set_feed("good", rss_document("Good", [("Fine story", "https://good.example/1", "Mon, 06 Jan 2025 09:15:00 +0000")]))
+    good, bad = rss_server.url("good"), rss_server.url("bad")
+    fetch = rss_viewer.fetch_articles
+
+    async def flaky_fetch(feed_url):
+        if feed_url == bad:
+            raise RuntimeError("parser exploded")
+        return await fetch(feed_url)
+
+    monkeypatch.setattr(rss_viewer, "fetch_articles", flaky_fetch)
+
+    async def scenario(client) -> None:
+        for cursor in (None, "WyIiLCIiXQ"):
+            params = {"feed": [good, bad]} if cursor is None else {"feed": [good, bad], "cursor": cursor}
+            response = await client.get("/api/timeline", params=params)
+            assert response.status_code == 200
+        first = (await client.get("/api/timeline", params={"feed": [good, bad]})).json()
+        assert [item["title"] for item in first["items"]] == ["Fine story"]
+        failed = [source for source in first["feeds"] if not source["ok"]]
+        assert [(source["feed"], source["status_code"]) for source in failed] == [(bad, 502)]
+
+    run_app(scenario)
+
+
+def test_timeline_endpoint_pages_merged_feeds(run_app, rss_server) -> None:
+    rss_server.set_feed("a", rss_document("A", [
+        ("Shared story", "https://news.example/shared", "Fri, 10 Jan 2025 09:00:00 +0000"),
+        ("A older", "https://a.example/1", "Tue, 07 Jan 2025 09:00:00 +0000"),
+    ]))
+    rss_server.set_feed("b", rss_document("B", [
+        ("B newer", "https://b.example/1", "Thu, 09 Jan 2025 09:00:00 +0000"),
+        ("Shared story", "https://news.example/shared", "Wed, 08 Jan 2025 09:00:00 +0000"),
+        ("B oldest", "https://b.example/2", "Mon, 06 Jan 2025 09:00:00 +0000"),
+    ]))
+    feeds = [rss_server.url("a"), rss_server.url("b")]
+
+    async def scenario(client) -> None:
+        first = (await client.get("/api/timeline", params={"feed": feeds, "limit": 2})).json()
+        assert [item["title"] for item in first["items"]] == ["Shared story", "B newer"]
+        assert [source["count"] for source in first["feeds"]] == [2, 2]
+        assert first["total"] == 4
+        second = (
+            await client.get("/api/timeline", params={"feed": feeds, "limit": 2, "cursor": first["next_cursor"]})
+        ).json()
+        assert [(item["title"], item["feed"]) for item in second["items"]] == [("A older", feeds[0]), ("B oldest", feeds[1])]
+        assert second["next_cursor"] is None
+        bad = await client.get("/api/timeline", params={"feed": feeds, "cursor": "not-a-cursor!"})
+        assert bad.status_code == 400
+
+    run_app(scenario)
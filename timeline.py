@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import heapq
+import re
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import orjson
+
+from feed_cache import normalise_feed_url
+
+
+SortKey = Tuple[str, str]
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@dataclass(frozen=True)
+class TimelineEntry:
+    # (published, story key): ISO-8601 UTC timestamps order correctly as strings, and
+    # undated items ("") sort after everything else when merging newest first.
+    sort_key: SortKey
+    # Link and title hashes; an item matching any key already emitted is a duplicate.
+    story_keys: Tuple[str, ...]
+    item: Dict[str, Any]
+
+
+@dataclass
+class TimelinePage:
+    items: List[Tuple[int, Dict[str, Any]]]
+    next_cursor: Optional[str]
+    # Only filled when the whole merge was walked (``count_all``).
+    counts: Optional[List[int]] = None
+    total: Optional[int] = None
+
+
+def _hash(kind: str, value: str) -> str:
+    return hashlib.blake2b(f"{kind}\0{value}".encode("utf-8"), digest_size=10).hexdigest()
+
+
+def story_keys(item: Dict[str, Any]) -> Tuple[str, ...]:
+    keys = []
+    link = (item.get("link") or "").strip()
+    if link:
+        keys.append(_hash("link", normalise_feed_url(link)))
+    title = _WHITESPACE_RE.sub(" ", (item.get("title") or "").strip()).casefold()
+    if title:
+        keys.append(_hash("title", title))
+    return tuple(keys)
+
+
+def index_items(feed_url: str, items: Sequence[Dict[str, Any]]) -> List[TimelineEntry]:
+    """Order one feed's items newest first, ready to be merged with other feeds."""
+    entries = []
+    for position, item in enumerate(items):
+        # Items with neither link nor title only ever match themselves, never another feed's.
+        keys = story_keys(item) or (_hash("position", f"{feed_url}\0{position}"),)
+        entries.append(TimelineEntry((item.get("published") or "", keys[0]), keys, item))
+    entries.sort(key=lambda entry: entry.sort_key, reverse=True)
+    return entries
+
+
+def encode_cursor(sort_key: SortKey) -> str:
+    return base64.urlsafe_b64encode(orjson.dumps(list(sort_key))).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> SortKey:
+    try:
+        published, key = orjson.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (ValueError, TypeError) as exc:
+        raise ValueError("Malformed timeline cursor.") from exc
+    if not isinstance(published, str) or not isinstance(key, str):
+        raise ValueError("Malformed timeline cursor.")
+    return published, key
+
+
+def _tagged(source: int, entries: Sequence[TimelineEntry]) -> Iterator[Tuple[TimelineEntry, int]]:
+    for entry in entries:
+        yield entry, source
+
+
+def merge_timeline(
+    feeds: Sequence[Sequence[TimelineEntry]],
+    limit: int,
+    cursor: Optional[str] = None,
+    count_all: bool = False,
+) -> TimelinePage:
+    """
+    K-way merge of indexed feeds, newest first, keeping the first (newest) copy of each story.
+
+    The cursor is the sort key of the last item served, so pages stay consistent while feeds
+    refresh between requests. Duplicates are still resolved from the top of the merge, which
+    keeps a story seen on an earlier page from reappearing on a later one.
+    """
+    after = decode_cursor(cursor) if cursor else None
+    merged = heapq.merge(
+        *(_tagged(source, entries) for source, entries in enumerate(feeds)),
+        key=lambda pair: pair[0].sort_key,
+        reverse=True,
+    )
+    seen = set()
+    page: List[Tuple[int, Dict[str, Any]]] = []
+    last_key: Optional[SortKey] = None
+    next_cursor = None
+    counts = [0] * len(feeds)
+    for entry, source in merged:
+        if not seen.isdisjoint(entry.story_keys):
+            continue
+        seen.update(entry.story_keys)
+        counts[source] += 1
+        if after is not None and entry.sort_key >= after:
+            continue
+        if len(page) < limit:
+            page.append((source, entry.item))
+            last_key = entry.sort_key
+            continue
+        if next_cursor is None:
+            next_cursor = encode_cursor(last_key)
+        if not count_all:
+            break
+    if not count_all:
+        return TimelinePage(items=page, next_cursor=next_cursor)
+    return TimelinePage(items=page, next_cursor=next_cursor, counts=counts, total=sum(counts))